@@ -0,0 +1,155 @@
+"""Builds cards for many users in one process.
+
+Reads a JSON list of users, each with its own org configuration, and builds
+every user's data-driven cards concurrently over one shared
+:class:`GitHubClient`, so the keep-alive session, response caches, and
+rate-limit budget are shared across the whole team. Each user's cards are
+written to ``<output_dir>/<username>/``. Prints a per-user summary with the
+throughput in users per minute.
+
+The users file looks like::
+
+    [
+        {"username": "octocat", "orgs": [{"name": "github", "stars": true, "languages": false}]},
+        {"username": "hubot"}
+    ]
+
+Usage::
+
+    uv run python -m src.batch team.json --output-dir batch_cards
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.build import USER_CARDS, build_jobs, run_jobs
+from src.config import BATCH_USER_WORKERS
+from src.github_client import GitHubClient, log_http_stats
+
+logger = logging.getLogger(__name__)
+
+
+def load_users(path: Path) -> list[dict]:
+    """Read and normalise the users file at *path*.
+
+    :param path: JSON file holding a list of ``{"username", "orgs"}`` objects.
+    :raises ValueError: When the file is not a list of objects with a ``username``.
+    :return: List of ``{"username": str, "orgs": [{"name", "stars", "languages"}]}`` dicts.
+    """
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a JSON list of users")
+    users = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("username"):
+            raise ValueError(f"{path}: every user needs a 'username': {entry!r}")
+        orgs = [
+            {"name": org["name"], "stars": bool(org.get("stars")), "languages": bool(org.get("languages"))}
+            for org in entry.get("orgs", [])
+        ]
+        users.append({"username": entry["username"], "orgs": orgs})
+    return users
+
+
+def run_user(user: dict, *, templates_dir: Path, output_dir: Path, client: GitHubClient) -> dict:
+    """Build every data-driven card for one *user* into ``output_dir/<username>``.
+
+    :param user: Normalised user from :func:`load_users`.
+    :param templates_dir: Directory containing the SVG template files.
+    :param output_dir: Batch output root.
+    :param client: Shared GitHub client.
+    :return: Dict with ``seconds``, ``ok``, and per-card ``cards`` results from :func:`~src.build.run_jobs`.
+    """
+    start = time.perf_counter()
+    cards_dir = output_dir / user["username"]
+    jobs = build_jobs(
+        templates_dir=templates_dir,
+        cards_dir=cards_dir,
+        badges_dir=cards_dir,
+        username=user["username"],
+        client=client,
+        org_config=user["orgs"],
+    )
+    cards = run_jobs({name: job for name, job in jobs.items() if name in USER_CARDS})
+    return {
+        "seconds": time.perf_counter() - start,
+        "ok": all(result["ok"] for result in cards.values()),
+        "cards": cards,
+    }
+
+
+def run_batch(
+    users: list[dict],
+    *,
+    templates_dir: Path,
+    output_dir: Path,
+    client: GitHubClient,
+    max_workers: int = BATCH_USER_WORKERS,
+) -> dict[str, dict]:
+    """Build cards for all *users* concurrently, at most *max_workers* users at a time.
+
+    :param users: Normalised users from :func:`load_users`.
+    :param templates_dir: Directory containing the SVG template files.
+    :param output_dir: Batch output root; each user gets a subdirectory.
+    :param client: GitHub client shared by every user.
+    :param max_workers: Maximum number of users in flight at once.
+    :return: Mapping of username to its :func:`run_user` result.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(users))), thread_name_prefix="user") as pool:
+        futures = {
+            user["username"]: pool.submit(
+                run_user, user, templates_dir=templates_dir, output_dir=output_dir, client=client
+            )
+            for user in users
+        }
+        return {username: future.result() for username, future in futures.items()}
+
+
+def format_summary(results: dict[str, dict], wall_seconds: float) -> str:
+    """Format *results* from :func:`run_batch` as a plain-text table with users per minute.
+
+    :param results: Per-user results.
+    :param wall_seconds: Total elapsed time for the whole batch.
+    :return: Multi-line table string.
+    """
+    lines = [f"{'user':<24} {'status':<7} {'seconds':>8}  failed cards"]
+    for username, result in sorted(results.items(), key=lambda item: item[1]["seconds"], reverse=True):
+        status = "ok" if result["ok"] else "FAILED"
+        failed = ", ".join(name for name, card in result["cards"].items() if not card["ok"]) or "-"
+        lines.append(f"{username:<24} {status:<7} {result['seconds']:>8.2f}  {failed}")
+    per_minute = len(results) / wall_seconds * 60 if wall_seconds > 0 else 0.0
+    lines.append(f"{len(results)} user(s) in {wall_seconds:.2f}s ({per_minute:.1f} users/min)")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    parser = argparse.ArgumentParser(description="Build GitHub cards for a list of users.")
+    parser.add_argument("users_file", type=Path, help="JSON list of {username, orgs} objects")
+    parser.add_argument("--output-dir", type=Path, default=repo_root / "batch_cards", help="output root directory")
+    parser.add_argument("--workers", type=int, default=BATCH_USER_WORKERS, help="users built concurrently")
+    args = parser.parse_args()
+
+    users = load_users(args.users_file)
+    start = time.perf_counter()
+    results = run_batch(
+        users,
+        templates_dir=repo_root / "templates",
+        output_dir=args.output_dir,
+        client=GitHubClient(),
+        max_workers=args.workers,
+    )
+    print(format_summary(results, time.perf_counter() - start))
+    log_http_stats()
+
+    if not all(result["ok"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""End-to-end benchmarks of the card generators over replayed API fixtures.
+
+For every account -- the synthetic accounts in
+:data:`~src.synthetic_account.ACCOUNTS` and, optionally, a cassette recorded
+from a real account with ``HTTP_TRANSPORT=record`` -- each generator (stats,
+streak, activity, pr, plan, badges) is run on its own in a fresh subprocess
+with an empty ``CACHE_DIR``, replaying the account's cassette
+(``HTTP_TRANSPORT=replay``, see :mod:`src.cassette`). Synthetic cassettes are
+recorded at the start of each run, so they always match the requests the
+current code sends.
+
+Reported per card: wall time (median over ``--repeat`` runs), HTTP requests,
+response bytes, and peak RSS of the process. Results are written as JSON,
+tagged with the git commit, so runs can be compared across commits with
+``--compare``.
+
+Usage::
+
+    uv run python -m src.benchmark --output bench_results.json
+    uv run python -m src.benchmark --accounts large --cards stats streak --repeat 5 --compare bench_results.json
+    uv run python -m src.benchmark --cassette fixtures/octocat
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CARDS = ("stats", "streak", "activity", "pr", "plan", "badges")
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _child_env(**overrides: str) -> dict[str, str]:
+    env = {key: value for key, value in os.environ.items() if key not in ("GH_TOKEN", "GH_USERNAME")}
+    env.update({"LOG_LEVEL": "NONE"}, **overrides)
+    return env
+
+
+def _run_child(args: list[str], env: dict[str, str]) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "src.benchmark", *args],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"benchmark child {args} failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+# src.config reads GH_TOKEN, CACHE_DIR, and the transport settings from the environment at import,
+# so modules depending on it are only imported inside the child-process entry points.
+def _jobs(username: str, org_config: list[dict] | None, output_dir: Path, client) -> dict:
+    """Return the named generator calls for one account, each taking no arguments."""
+    from src.github_activity_card import generate_github_activity_cards
+    from src.github_badges import generate_badges
+    from src.github_plan_card import generate_github_plan_cards
+    from src.github_pr_card import generate_github_pr_cards
+    from src.github_stats_card import generate_github_stats_cards
+    from src.github_streak_card import generate_github_streak_cards
+    from src.stats import GitHubStats
+
+    templates_dir = REPO_ROOT / "templates"
+    card_kwargs = {"templates_dir": templates_dir, "output_dir": output_dir, "username": username}
+    exclude_orgs = None if org_config is None else [o["name"] for o in org_config]
+
+    def stats() -> GitHubStats:
+        return GitHubStats(username, client=client, org_config=org_config)
+
+    return {
+        "stats": lambda: generate_github_stats_cards(**card_kwargs, stats=stats()),
+        "streak": lambda: generate_github_streak_cards(**card_kwargs, stats=stats()),
+        "activity": lambda: generate_github_activity_cards(**card_kwargs, client=client),
+        "pr": lambda: generate_github_pr_cards(**card_kwargs, client=client, exclude_orgs=exclude_orgs),
+        "plan": lambda: generate_github_plan_cards(templates_dir=templates_dir, output_dir=output_dir),
+        "badges": lambda: generate_badges(templates_dir=templates_dir, output_dir=output_dir),
+    }
+
+
+def _org_config(account: str) -> list[dict] | None:
+    from src.synthetic_account import ACCOUNTS
+
+    return ACCOUNTS[account].org_config if account in ACCOUNTS else None
+
+
+def record_synthetic(account: str) -> dict:
+    """Record a cassette of every card for synthetic *account* (runs in a child process).
+
+    The cassette directory is taken from ``HTTP_CASSETTE``.
+    """
+    import requests
+
+    from src.cassette import Cassette, RecordingAdapter
+    from src.config import HTTP_CASSETTE, REST_API_URL
+    from src.github_client import GitHubClient
+    from src.synthetic_account import ACCOUNTS, SyntheticAPIAdapter
+    from src.token_pool import TokenPool
+
+    cassette = Cassette(HTTP_CASSETTE, REST_API_URL)
+    cassette.set_username(ACCOUNTS[account].username)
+    adapter = RecordingAdapter(cassette, SyntheticAPIAdapter(ACCOUNTS[account]))
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    client = GitHubClient(session=session, token_pool=TokenPool(["synthetic"]))
+    with tempfile.TemporaryDirectory() as output_dir:
+        for job in _jobs(ACCOUNTS[account].username, _org_config(account), Path(output_dir), client).values():
+            job()
+    adapter.close()
+    return {"interactions": len(cassette)}
+
+
+def measure_card(account: str, card: str) -> dict:
+    """Run one *card* generator against the replayed cassette and measure it (runs in a child process)."""
+    from src.config import REST_API_URL, require_username
+    from src.github_client import GitHubClient, connection_stats
+
+    client = GitHubClient()
+    replay = client.session.get_adapter(REST_API_URL).transport
+    with tempfile.TemporaryDirectory() as output_dir:
+        job = _jobs(require_username(), _org_config(account), Path(output_dir), client)[card]
+        start = time.perf_counter()
+        error = None
+        try:
+            job()
+        except Exception as exc:
+            error = str(exc)
+        seconds = time.perf_counter() - start
+    stats = connection_stats()
+    if error is None and replay.misses:
+        error = f"{replay.misses} request(s) not found in the cassette"
+    return {
+        "ok": error is None,
+        "error": error,
+        "seconds": seconds,
+        "requests": stats["requests"],
+        "bytes": stats["bytes"],
+        # ru_maxrss is reported in KiB on Linux.
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run_benchmarks(
+    accounts: list[str],
+    cards: list[str],
+    *,
+    repeat: int = 3,
+    cassette: Path | None = None,
+    latency_ms: float = 0.0,
+) -> list[dict]:
+    """Benchmark every card for every account and return one result per ``(account, card)``.
+
+    :param accounts: Synthetic account names from :data:`~src.synthetic_account.ACCOUNTS`.
+    :param cards: Card names from :data:`CARDS`.
+    :param repeat: Runs per card; the median wall time is reported.
+    :param cassette: Optional recorded cassette of a real account, benchmarked as account ``recorded``.
+    :param latency_ms: Latency injected per replayed request.
+    :return: List of ``{account, card, ok, error, seconds, runs, requests, bytes, peak_rss_kib}`` dicts.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench-") as scratch:
+        scratch_dir = Path(scratch)
+        cassettes = {}
+        for account in accounts:
+            cassettes[account] = scratch_dir / "cassettes" / account
+            env = _child_env(
+                HTTP_TRANSPORT="live",
+                GH_TOKEN="synthetic",
+                GH_USERNAME="synthetic",
+                HTTP_CASSETTE=str(cassettes[account]),
+                CACHE_DIR=str(scratch_dir / "record-cache" / account),
+            )
+            recorded = _run_child(["--record", account], env)
+            logger.info("recorded %s: %d interaction(s)", account, recorded["interactions"])
+        if cassette is not None:
+            cassettes["recorded"] = cassette
+
+        for account, cassette_dir in cassettes.items():
+            for card in cards:
+                runs = []
+                for i in range(repeat):
+                    env = _child_env(
+                        HTTP_TRANSPORT="replay",
+                        HTTP_CASSETTE=str(cassette_dir),
+                        REPLAY_LATENCY_MS=str(latency_ms),
+                        CACHE_DIR=str(scratch_dir / "cache" / f"{account}-{card}-{i}"),
+                    )
+                    runs.append(_run_child(["--measure", account, card], env))
+                last = runs[-1]
+                result = {
+                    "account": account,
+                    "card": card,
+                    "ok": all(run["ok"] for run in runs),
+                    "error": next((run["error"] for run in runs if run["error"]), None),
+                    "seconds": statistics.median(run["seconds"] for run in runs),
+                    "runs": [run["seconds"] for run in runs],
+                    "requests": last["requests"],
+                    "bytes": last["bytes"],
+                    "peak_rss_kib": max(run["peak_rss_kib"] for run in runs),
+                }
+                logger.info("%s/%s: %.3fs, %d request(s)", account, card, result["seconds"], result["requests"])
+                results.append(result)
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def _change(new: float, old: float | None) -> str:
+    if old is None:
+        return ""
+    if old == 0:
+        return " (new)" if new else ""
+    return f" ({(new - old) / old:+.0%})"
+
+
+def format_results(results: list[dict], baseline: list[dict] | None = None) -> str:
+    """Format *results* as a plain-text table, with changes against *baseline* results when given.
+
+    :param results: Results from :func:`run_benchmarks`.
+    :param baseline: Results of an earlier run to compare against.
+    :return: Multi-line table string.
+    """
+    previous = {(r["account"], r["card"]): r for r in baseline or []}
+    lines = [f"{'account':<10} {'card':<9} {'status':<7} {'seconds':>18} {'requests':>14} {'KiB':>16} {'RSS MiB':>8}"]
+    for result in results:
+        old = previous.get((result["account"], result["card"]), {})
+        status = "ok" if result["ok"] else "FAILED"
+        seconds = f"{result['seconds']:.3f}{_change(result['seconds'], old.get('seconds'))}"
+        requests_sent = f"{result['requests']}{_change(result['requests'], old.get('requests'))}"
+        kib = f"{result['bytes'] / 1024:.1f}{_change(result['bytes'], old.get('bytes'))}"
+        lines.append(
+            f"{result['account']:<10} {result['card']:<9} {status:<7} {seconds:>18} {requests_sent:>14} "
+            f"{kib:>16} {result['peak_rss_kib'] / 1024:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    from src.synthetic_account import ACCOUNTS
+
+    parser = argparse.ArgumentParser(description="Benchmark the card generators over replayed API fixtures.")
+    parser.add_argument("--accounts", nargs="*", default=list(ACCOUNTS), choices=list(ACCOUNTS))
+    parser.add_argument("--cards", nargs="+", default=list(CARDS), choices=CARDS)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per card (median reported)")
+    parser.add_argument("--cassette", type=Path, help="also benchmark a cassette recorded from a real account")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latency injected per replayed request")
+    parser.add_argument("--output", type=Path, default=REPO_ROOT / "bench_results.json", help="JSON results file")
+    parser.add_argument("--compare", type=Path, help="earlier JSON results file to compare against")
+    parser.add_argument("--record", metavar="ACCOUNT", help=argparse.SUPPRESS)
+    parser.add_argument("--measure", nargs=2, metavar=("ACCOUNT", "CARD"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.record:
+        print(json.dumps(record_synthetic(args.record)))
+        return
+    if args.measure:
+        print(json.dumps(measure_card(*args.measure)))
+        return
+
+    logging.basicConfig(level=logging.INFO, format="%(name)s [%(levelname)s] %(message)s")
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"] if args.compare else None
+    results = run_benchmarks(
+        args.accounts, args.cards, repeat=max(1, args.repeat), cassette=args.cassette, latency_ms=args.latency_ms
+    )
+    report = {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "repeat": max(1, args.repeat),
+        "latency_ms": args.latency_ms,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(format_results(results, baseline))
+    print(f"results written to {args.output}")
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Builds every card and badge in a single process.
+
+Runs the stats, streak, PR, plan, and activity card generators plus the
+badge generator concurrently over one shared :class:`GitHubClient` and
+:class:`GitHubStats`, so interpreter startup, imports, the keep-alive
+session, and the response cache are paid for once. Prints a per-card
+timing table when finished, including the age of any card rendered from
+a saved data bundle.
+
+Usage::
+
+    uv run python -m src.build
+"""
+
+import logging
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.card_bundle import bundle_age
+from src.config import require_username
+from src.github_activity_card import generate_github_activity_cards
+from src.github_badges import generate_badges
+from src.github_client import GitHubClient, log_http_stats
+from src.github_plan_card import generate_github_plan_cards
+from src.github_pr_card import generate_github_pr_cards
+from src.github_stats_card import generate_github_stats_cards
+from src.github_streak_card import generate_github_streak_cards
+from src.stats import GitHubStats
+
+logger = logging.getLogger(__name__)
+
+# Cards rendered from a user's GitHub data (the plan card and badges are static).
+USER_CARDS = ("stats", "streak", "pr", "activity")
+
+
+def build_jobs(
+    *,
+    templates_dir: Path,
+    cards_dir: Path,
+    badges_dir: Path,
+    username: str,
+    client: GitHubClient,
+    org_config: list[dict] | None = None,
+) -> dict[str, Callable[[], object]]:
+    """Return the named card generator jobs for *username*, all sharing *client*.
+
+    :param templates_dir: Directory containing the SVG template files.
+    :param cards_dir: Directory where the rendered card SVGs will be written.
+    :param badges_dir: Directory where the rendered badge SVGs will be written.
+    :param username: GitHub username to generate cards for.
+    :param client: Shared GitHub client.
+    :param org_config: Per-org ``{"name", "stars", "languages"}`` entries for *username*; defaults to ``ORG_CONFIG``.
+    :return: Mapping of card name to zero-argument callable.
+    """
+    stats = GitHubStats(username, client=client, org_config=org_config)
+    exclude_orgs = None if org_config is None else [o["name"] for o in org_config]
+    card_kwargs = {"templates_dir": templates_dir, "output_dir": cards_dir, "username": username}
+    return {
+        "stats": lambda: generate_github_stats_cards(**card_kwargs, stats=stats),
+        "streak": lambda: generate_github_streak_cards(**card_kwargs, stats=stats),
+        "pr": lambda: generate_github_pr_cards(**card_kwargs, client=client, exclude_orgs=exclude_orgs),
+        "activity": lambda: generate_github_activity_cards(**card_kwargs, client=client),
+        "plan": lambda: generate_github_plan_cards(templates_dir=templates_dir, output_dir=cards_dir),
+        "badges": lambda: generate_badges(templates_dir=templates_dir, output_dir=badges_dir),
+    }
+
+
+def run_jobs(jobs: dict[str, Callable[[], object]], max_workers: int | None = None) -> dict[str, dict]:
+    """Run *jobs* concurrently and record each one's duration and outcome.
+
+    A failing job is logged and reported; it does not stop the others.
+
+    :param jobs: Mapping of job name to zero-argument callable.
+    :param max_workers: Thread pool size; defaults to one thread per job.
+    :return: Mapping of job name to ``{"seconds": float, "ok": bool, "error": str | None}``.
+    """
+
+    def timed(name: str, job: Callable[[], object]) -> dict:
+        start = time.perf_counter()
+        try:
+            job()
+        except Exception as exc:
+            logger.exception("%s card failed", name)
+            return {"seconds": time.perf_counter() - start, "ok": False, "error": str(exc)}
+        return {"seconds": time.perf_counter() - start, "ok": True, "error": None}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(jobs), thread_name_prefix="card") as pool:
+        futures = {name: pool.submit(timed, name, job) for name, job in jobs.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _format_age(age: float | None) -> str:
+    if age is None:
+        return "-"
+    if age == 0:
+        return "fresh"
+    if age >= 3600:
+        return f"{age / 3600:.1f}h old"
+    return f"{age / 60:.0f}m old" if age >= 60 else f"{age:.0f}s old"
+
+
+def format_timings(results: dict[str, dict], wall_seconds: float, ages: dict[str, float | None] | None = None) -> str:
+    """Format *results* from :func:`run_jobs` as a plain-text table.
+
+    :param results: Per-job results.
+    :param wall_seconds: Total elapsed time for the whole build.
+    :param ages: Optional age in seconds of the data each card rendered (see :func:`~src.card_bundle.bundle_age`).
+    :return: Multi-line table string.
+    """
+    ages = ages or {}
+    lines = [f"{'card':<10} {'status':<7} {'seconds':>8}  data"]
+    for name, result in sorted(results.items(), key=lambda item: item[1]["seconds"], reverse=True):
+        status = "ok" if result["ok"] else "FAILED"
+        lines.append(f"{name:<10} {status:<7} {result['seconds']:>8.2f}  {_format_age(ages.get(name))}")
+    lines.append(f"{'total':<10} {'':<7} {wall_seconds:>8.2f}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    templates_dir = repo_root / "templates"
+
+    username = require_username()
+    start = time.perf_counter()
+    jobs = build_jobs(
+        templates_dir=templates_dir,
+        cards_dir=repo_root / "cards",
+        badges_dir=repo_root / "badges",
+        username=username,
+        client=GitHubClient(),
+    )
+    results = run_jobs(jobs)
+    ages = {name: bundle_age(username, name) for name in results}
+    print(format_timings(results, time.perf_counter() - start, ages))
+    log_http_stats()
+
+    if not all(result["ok"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
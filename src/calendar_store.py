@@ -0,0 +1,206 @@
+"""Persistent on-disk store of daily contribution counts.
+
+Each user's calendar is kept as a compact binary file of little-endian
+``uint32`` counts indexed by day ordinal, plus a small JSON sidecar that
+records when each contribution year was last fetched. Reads memory-map the
+binary file, so loading a 15-year history costs one ``mmap`` call.
+
+File layout (``<username>.bin``)::
+
+    magic "GHCAL1" | base ordinal (uint32) | day count (uint32) | counts (uint32 * day count)
+
+Usage::
+
+    from src.calendar_store import CalendarStore
+
+    store = CalendarStore.open(CACHE_DIR / "calendar" / "octocat.bin")
+    store.update(days)
+    store.mark_year(2024, complete=True)
+    store.save()
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"GHCAL1"
+_HEADER = struct.Struct("<6sII")
+
+
+class CalendarStore:
+    """Dense array of daily contribution counts backed by a memory-mapped file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.meta_path = path.with_suffix(".json")
+        self.base_ordinal = 0
+        self._counts: memoryview | array = array("I")
+        self._mmap: mmap.mmap | None = None
+        self.years: dict[str, dict] = {}
+        self.synced_through: date | None = None
+        self._dirty = False
+
+    @classmethod
+    def open(cls, path: Path) -> "CalendarStore":
+        """Open the store at *path*, memory-mapping existing data if present.
+
+        A missing, truncated, or foreign file yields an empty store rather than an error.
+
+        :param path: Location of the ``.bin`` file; the sidecar uses the same stem with ``.json``.
+        :return: Loaded :class:`CalendarStore`.
+        """
+        store = cls(path)
+        try:
+            store._load()
+        except (OSError, ValueError, struct.error) as exc:
+            logger.warning("ignoring unreadable calendar store %s: %s", path, exc)
+            return cls(path)
+        return store
+
+    def _load(self) -> None:
+        if self.meta_path.exists():
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+            self.years = meta.get("years", {})
+            if meta.get("synced_through"):
+                self.synced_through = date.fromisoformat(meta["synced_through"])
+        if not self.path.exists() or self.path.stat().st_size < _HEADER.size:
+            return
+
+        with self.path.open("rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, base_ordinal, day_count = _HEADER.unpack_from(mm)
+        if magic != _MAGIC or len(mm) != _HEADER.size + day_count * 4:
+            mm.close()
+            raise ValueError("bad calendar header")
+
+        self.base_ordinal = base_ordinal
+        if sys.byteorder == "little":
+            self._mmap = mm
+            self._counts = memoryview(mm)[_HEADER.size :].cast("I")
+        else:
+            counts = array("I", mm[_HEADER.size :])
+            counts.byteswap()
+            mm.close()
+            self._counts = counts
+        logger.debug("loaded calendar store %s: %d day(s)", self.path, day_count)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def counts(self) -> memoryview | array:
+        """Daily counts starting at :attr:`base_ordinal` (read-only view when memory-mapped)."""
+        return self._counts
+
+    @property
+    def first_day(self) -> date | None:
+        return date.fromordinal(self.base_ordinal) if len(self._counts) else None
+
+    @property
+    def last_day(self) -> date | None:
+        return date.fromordinal(self.base_ordinal + len(self._counts) - 1) if len(self._counts) else None
+
+    def iter_days(self) -> Iterator[tuple[date, int]]:
+        """Yield ``(date, count)`` pairs for every stored day in ascending order."""
+        for offset, count in enumerate(self._counts):
+            yield date.fromordinal(self.base_ordinal + offset), count
+
+    def first_contribution(self) -> date | None:
+        """Return the earliest day with a non-zero count, or ``None``."""
+        for offset, count in enumerate(self._counts):
+            if count > 0:
+                return date.fromordinal(self.base_ordinal + offset)
+        return None
+
+    def _writable(self) -> array:
+        if not isinstance(self._counts, array):
+            counts = array("I", self._counts.tobytes())
+            self._counts.release()
+            self._counts = counts
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+        return self._counts
+
+    def update(self, days: Iterable[tuple[date, int]]) -> None:
+        """Write *days* into the store, growing the covered range as needed.
+
+        :param days: Iterable of ``(date, contribution_count)`` pairs.
+        """
+        days = list(days)
+        if not days:
+            return
+        counts = self._writable()
+        ordinals = [d.toordinal() for d, _ in days]
+        lo, hi = min(ordinals), max(ordinals)
+
+        if not counts:
+            self.base_ordinal = lo
+        if lo < self.base_ordinal:
+            counts[0:0] = array("I", bytes(4 * (self.base_ordinal - lo)))
+            self.base_ordinal = lo
+        end_ordinal = self.base_ordinal + len(counts) - 1
+        if hi > end_ordinal:
+            counts.extend(array("I", bytes(4 * (hi - end_ordinal))))
+
+        for ordinal, (_, count) in zip(ordinals, days):
+            counts[ordinal - self.base_ordinal] = count
+        self._dirty = True
+
+    def mark_year(self, year: int, *, complete: bool) -> None:
+        """Record that *year* was fetched now; *complete* means the year had already ended."""
+        self.years[str(year)] = {"fetched_at": datetime.now(timezone.utc).isoformat(), "complete": complete}
+        self._dirty = True
+
+    def mark_synced(self, through: date) -> None:
+        """Record the last day covered by the most recent incremental sync."""
+        self.synced_through = through
+        self._dirty = True
+
+    def fetched_within(self, year: int, max_age: timedelta) -> bool:
+        """Return True when *year* was last fetched less than *max_age* ago."""
+        entry = self.years.get(str(year))
+        if not entry:
+            return False
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        return datetime.now(timezone.utc) - fetched_at < max_age
+
+    def year_is_fresh(self, year: int, max_age: timedelta) -> bool:
+        """Return True when *year* was fetched after it ended and within *max_age*."""
+        entry = self.years.get(str(year))
+        return bool(entry and entry.get("complete")) and self.fetched_within(year, max_age)
+
+    def save(self) -> None:
+        """Atomically write the binary file and metadata sidecar if anything changed."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        counts = self._writable()
+        if sys.byteorder != "little":
+            counts = array("I", counts)
+            counts.byteswap()
+
+        tmp = self.path.with_suffix(".bin.tmp")
+        with tmp.open("wb") as fh:
+            fh.write(_HEADER.pack(_MAGIC, self.base_ordinal, len(counts)))
+            fh.write(counts.tobytes())
+        os.replace(tmp, self.path)
+
+        meta = {
+            "years": self.years,
+            "synced_through": self.synced_through.isoformat() if self.synced_through else None,
+        }
+        tmp_meta = self.meta_path.with_suffix(".json.tmp")
+        tmp_meta.write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_meta, self.meta_path)
+        self._dirty = False
+        logger.debug("saved calendar store %s: %d day(s)", self.path, len(counts))
@@ -0,0 +1,151 @@
+"""Stale-while-revalidate data bundles for the cards.
+
+Each card's fetched data (before rendering) is persisted as a bundle in its
+own file, ``CACHE_DIR/bundles/<username>/<card>.json``. :func:`fetch_bundle`
+runs the fetch on a background thread and waits at most the card's deadline:
+
+1. If the fetch finishes in time, its data is saved and returned fresh.
+2. If it fails or overruns the deadline, the last saved bundle is returned
+   with its age; an overrunning fetch keeps going in the background and
+   saves its result when it completes. On exit the process waits up to
+   ``CARD_REFRESH_EXIT_WAIT_SECONDS`` for such refreshes; one still running
+   after that is abandoned and the next run refreshes the bundle.
+3. With no saved bundle, the fetch error (or :class:`TimeoutError`) is raised.
+
+Usage::
+
+    from src.card_bundle import fetch_bundle
+
+    bundle = fetch_bundle("octocat", "stats", lambda: {"stars": 42})
+    if bundle.stale:
+        logger.warning("stats are %.0fs old", bundle.age)
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from src.config import CACHE_DIR, CARD_DEADLINE_SECONDS, CARD_REFRESH_EXIT_WAIT_SECONDS
+from src.json_store import JsonStore
+
+logger = logging.getLogger(__name__)
+
+_inflight: dict[str, tuple[threading.Event, dict]] = {}
+_inflight_lock = threading.Lock()
+_ages: dict[str, float] = {}
+
+
+class Bundle(NamedTuple):
+    """Card data and how old it is (``0.0`` when freshly fetched)."""
+
+    data: dict
+    age: float
+    stale: bool
+
+
+def _key(username: str, card: str) -> str:
+    return f"{username}/{card}"
+
+
+def _store(key: str) -> JsonStore:
+    """Return the store holding the bundle for *key* (its ``saved_at`` and ``data``)."""
+    return JsonStore(CACHE_DIR / "bundles" / f"{key}.json")
+
+
+def _refresh(key: str, fetch: Callable[[], dict]) -> tuple[threading.Event, dict]:
+    """Start a background fetch for *key*, or join the one already running."""
+    with _inflight_lock:
+        running = _inflight.get(key)
+        if running is not None:
+            return running
+        done, outcome = _inflight[key] = (threading.Event(), {})
+
+    def run() -> None:
+        try:
+            data = fetch()
+            # Refreshes of one key are coalesced above, so this is the only writer of its file.
+            store = _store(key)
+            store.set("saved_at", time.time())
+            store.set("data", data)
+            store.save()
+            outcome["data"] = data
+        except Exception as exc:
+            outcome["error"] = exc
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+            done.set()
+
+    threading.Thread(target=run, name=f"refresh-{key}", daemon=True).start()
+    return done, outcome
+
+
+def fetch_bundle(
+    username: str,
+    card: str,
+    fetch: Callable[[], dict],
+    deadline: float = CARD_DEADLINE_SECONDS,
+) -> Bundle:
+    """Return fresh card data if *fetch* completes within *deadline*, else the last saved bundle.
+
+    :param username: GitHub username the card is for.
+    :param card: Card name, e.g. ``"stats"``.
+    :param fetch: Zero-argument callable returning JSON-serialisable card data.
+    :param deadline: Seconds to wait for *fetch* before falling back.
+    :raises TimeoutError: When *fetch* overruns *deadline* and no bundle is saved.
+    :return: The data with its age in seconds.
+    """
+    key = _key(username, card)
+    done, outcome = _refresh(key, fetch)
+    done.wait(deadline)
+    if "data" in outcome:
+        _ages[key] = 0.0
+        return Bundle(outcome["data"], 0.0, False)
+
+    error = outcome.get("error")
+    saved = _store(key)
+    saved_at = saved.get("saved_at")
+    if saved_at is None:
+        if error is not None:
+            raise error
+        raise TimeoutError(f"{card} card data for {username} not fetched within {deadline:g}s and no bundle saved")
+
+    age = max(0.0, time.time() - saved_at)
+    _ages[key] = age
+    if error is not None:
+        reason = f"fetch failed: {error}"
+    else:
+        reason = f"fetch exceeded {deadline:g}s, refreshing in background"
+    logger.warning("%s card for %s: rendering from bundle %.0fs old (%s)", card, username, age, reason)
+    return Bundle(saved.get("data"), age, True)
+
+
+def wait_for_refreshes(timeout: float = CARD_REFRESH_EXIT_WAIT_SECONDS) -> int:
+    """Wait up to *timeout* seconds in total for background refreshes to finish.
+
+    Registered with :mod:`atexit` so refreshes that overran their deadline
+    still save their bundle when a one-shot build exits.
+
+    :param timeout: Total seconds to wait.
+    :return: Number of refreshes still running afterwards.
+    """
+    end = time.monotonic() + timeout
+    with _inflight_lock:
+        running = list(_inflight.items())
+    pending = 0
+    for key, (done, _) in running:
+        if not done.wait(max(0.0, end - time.monotonic())):
+            pending += 1
+            logger.warning("abandoning background refresh of %s bundle; the next run refreshes it", key)
+    return pending
+
+
+atexit.register(wait_for_refreshes)
+
+
+def bundle_age(username: str, card: str) -> float | None:
+    """Return the age in seconds of the data last rendered for *card*, or ``None`` if not rendered yet."""
+    return _ages.get(_key(username, card))
@@ -0,0 +1,226 @@
+"""Record/replay transports for the GitHub API.
+
+``HTTP_TRANSPORT`` selects the ``requests`` adapter mounted on the shared
+session (see :func:`src.github_client.get_shared_session`):
+
+1. ``live`` -- plain keep-alive adapter (default).
+2. ``record`` -- forwards every request and saves the normalized exchange to
+   the cassette at ``HTTP_CASSETTE``. Conditional headers are stripped before
+   forwarding so every recorded response carries its full body.
+3. ``replay`` -- answers from the cassette only, without network access or a
+   real token, after ``REPLAY_LATENCY_MS`` of injected latency. A matching
+   ``If-None-Match`` gets ``304``; an unrecorded request raises
+   :class:`CassetteMissError`.
+
+Requests are matched on method, path relative to ``GITHUB_API_URL``, sorted
+query parameters, and JSON body (GraphQL whitespace collapsed). Timestamps
+read from the clock (ISO values with fractional seconds, such as windows
+ending "now", and the ``created:`` bounds of search qualifiers) are masked in
+GraphQL variables, while fixed boundaries such as year starts are kept, so a
+recording keeps replaying on later days.
+Replay against a fresh ``CACHE_DIR`` to reproduce the recorded run.
+
+A cassette is a directory holding ``interactions.json`` and ``meta.json``
+(the recorded ``username``, used as the default ``GH_USERNAME`` in replay mode).
+
+Usage::
+
+    HTTP_TRANSPORT=record HTTP_CASSETTE=fixtures/octocat uv run python -m src.build
+    HTTP_TRANSPORT=replay HTTP_CASSETTE=fixtures/octocat CACHE_DIR=/tmp/cache uv run python -m src.build
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.json_store import JsonStore
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping; the rest (dates, request ids, cookies, encodings) vary per run.
+RECORDED_HEADERS = (
+    "Content-Type",
+    "ETag",
+    "Last-Modified",
+    "Link",
+    "Retry-After",
+    "X-Poll-Interval",
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+    "X-RateLimit-Resource",
+    "X-RateLimit-Used",
+)
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+# ISO timestamps with fractional seconds come from datetime.now(), not from fixed window boundaries.
+_CLOCK_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+")
+# Search count windows (``created:<=T`` or ``created:A..B``) end a lag margin before now.
+_SEARCH_WINDOW = re.compile(r"(?<=\bcreated:)\S+")
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def _mask_timestamps(value: Any) -> Any:
+    if isinstance(value, str):
+        if _CLOCK_TIMESTAMP.match(value):
+            return "<now>"
+        return _SEARCH_WINDOW.sub("<now>", value)
+    if isinstance(value, dict):
+        return {k: _mask_timestamps(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_mask_timestamps(v) for v in value]
+    return value
+
+
+class Cassette:
+    """Normalized request/response exchanges stored in a cassette directory."""
+
+    def __init__(self, directory: Path, base_url: str) -> None:
+        self.directory = directory
+        self.base_url = base_url
+        self._interactions = JsonStore(directory / "interactions.json")
+        self._meta = JsonStore(directory / "meta.json")
+
+    def normalize(self, request: requests.PreparedRequest) -> dict:
+        """Return the matching form of *request*: ``method``, ``path``, ``params``, and ``body``."""
+        url = request.url or ""
+        path = url[len(self.base_url) :] if url.startswith(self.base_url) else url
+        parts = urlsplit(path)
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        if body:
+            try:
+                body = json.loads(body)
+            except ValueError:
+                pass
+        if isinstance(body, dict):
+            if isinstance(body.get("query"), str):
+                body = {**body, "query": " ".join(body["query"].split())}
+            body = _mask_timestamps(body)
+        return {
+            "method": request.method,
+            "path": parts.path,
+            "params": sorted(parse_qsl(parts.query)),
+            "body": body or None,
+        }
+
+    def key(self, normalized: dict) -> str:
+        return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """Store the exchange, replacing any earlier response to the same normalized request."""
+        normalized = self.normalize(request)
+        try:
+            body = {"json": response.json()}
+        except ValueError:
+            body = {"text": response.text}
+        headers = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+        self._interactions.set(
+            self.key(normalized),
+            {"request": normalized, "response": {"status": response.status_code, "headers": headers, **body}},
+        )
+
+    def lookup(self, request: requests.PreparedRequest) -> dict | None:
+        """Return the recorded ``{status, headers, json|text}`` for *request*, or ``None``."""
+        entry = self._interactions.get(self.key(self.normalize(request)))
+        return entry["response"] if entry is not None else None
+
+    def set_username(self, username: str) -> None:
+        self._meta.set("username", username)
+        self._meta.set("recorded_at", datetime.now(timezone.utc).isoformat())
+
+    def save(self) -> None:
+        self._interactions.save()
+        self._meta.save()
+
+    def __len__(self) -> int:
+        return len(self._interactions.items())
+
+
+class RecordingAdapter(BaseAdapter):
+    """Adapter that forwards to *transport* and records every exchange into a :class:`Cassette`."""
+
+    def __init__(self, cassette: Cassette, transport: BaseAdapter) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.transport = transport
+
+    @property
+    def poolmanager(self):
+        """Connection pool of the wrapped transport, if it has one."""
+        return getattr(self.transport, "poolmanager", None)
+
+    def send(self, request, **kwargs):
+        if any(name in request.headers for name in CONDITIONAL_HEADERS):
+            request = request.copy()
+            for name in CONDITIONAL_HEADERS:
+                request.headers.pop(name, None)
+        response = self.transport.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        self.cassette.save()
+        logger.info("recorded %d interaction(s) to %s", len(self.cassette), self.cassette.directory)
+        self.transport.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Offline adapter serving responses from a :class:`Cassette`."""
+
+    def __init__(self, cassette: Cassette, latency: float = 0.0) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.misses = 0
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.latency > 0:
+            time.sleep(self.latency)
+        recorded = self.cassette.lookup(request)
+        if recorded is None:
+            with self._lock:
+                self.misses += 1
+            normalized = self.cassette.normalize(request)
+            raise CassetteMissError(
+                f"no recorded response for {normalized['method']} {normalized['path']}", request=request
+            )
+
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        etag = response.headers.get("ETag")
+        if etag and response.status_code == 200 and etag in request.headers.get("If-None-Match", ""):
+            response.status_code = 304
+            response._content = b""
+        elif "json" in recorded:
+            response._content = json.dumps(recorded["json"]).encode("utf-8")
+        else:
+            response._content = recorded.get("text", "").encode("utf-8")
+        response.reason = HTTPStatus(response.status_code).phrase
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        if self.misses:
+            logger.warning("replay: %d request(s) not found in %s", self.misses, self.cassette.directory)
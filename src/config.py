@@ -2,27 +2,68 @@
 
 Loads the following from environment variables:
 
-1. ``GH_TOKEN`` -- GitHub personal access token.
-2. ``GH_USERNAME`` -- GitHub username for the profile to render.
+1. ``GH_TOKEN`` -- GitHub personal access token; several comma-separated tokens form a pool whose
+   requests are routed to the token with the most remaining rate-limit budget.
+2. ``GH_USERNAME`` -- GitHub username for the profile to render; required by the single-user entry points
+   (see :func:`require_username`), not by batch mode, which reads its users from a file.
 3. ``LOG_LEVEL`` -- Verbosity: ``NONE`` (silent), ``INFO`` (summary), ``DEBUG`` (includes API calls).
+4. ``HTTP_POOL_SIZE`` -- Maximum keep-alive connections held open to the GitHub API (default ``10``).
+5. ``CACHE_DIR`` -- Directory for persistent caches such as the contribution calendar (default ``.cache``).
+6. ``QUERY_CACHE_TTL`` -- Seconds identical API responses are reused within a process (default ``300``, ``0`` disables).
+7. ``CARD_DEADLINE_SECONDS`` -- Seconds a card waits for fresh data before using its saved bundle (default ``120``).
+8. ``GITHUB_API_URL`` -- Base URL of the GitHub API (default ``https://api.github.com``).
+9. ``HTTP_TRANSPORT`` -- ``live`` (default), ``record``, or ``replay`` (see :mod:`src.cassette`). In replay
+   mode ``GH_TOKEN`` is not needed and ``GH_USERNAME`` defaults to the username the cassette was recorded for.
+10. ``HTTP_CASSETTE`` -- Cassette directory for record and replay (default ``fixtures/cassette``).
+11. ``REPLAY_LATENCY_MS`` -- Latency injected per replayed request, in milliseconds (default ``0``).
 
 Usage::
 
     uv run python -m src.github_stats_card
 """
 
+import json
 import logging
 import os
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 GH_TOKEN = os.getenv("GH_TOKEN")
 GH_USERNAME = os.getenv("GH_USERNAME")
-API_URL = "https://api.github.com/graphql"
+# Base URL of the GitHub API; point it at a local stand-in to test without GitHub.
+REST_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+API_URL = f"{REST_API_URL}/graphql"
+
+HTTP_TRANSPORT = os.getenv("HTTP_TRANSPORT", "live").lower()
+HTTP_CASSETTE = Path(os.getenv("HTTP_CASSETTE", Path(__file__).resolve().parents[1] / "fixtures" / "cassette"))
+REPLAY_LATENCY_MS: float = float(os.getenv("REPLAY_LATENCY_MS", "0"))
+if HTTP_TRANSPORT not in ("live", "record", "replay"):
+    raise ValueError(f"HTTP_TRANSPORT must be live, record, or replay, not {HTTP_TRANSPORT!r}")
+
+if HTTP_TRANSPORT == "replay":
+    # Replayed runs are offline: no token is sent, and the user defaults to the recorded one.
+    GH_TOKEN = GH_TOKEN or "replay"
+    if not GH_USERNAME:
+        try:
+            GH_USERNAME = json.loads((HTTP_CASSETTE / "meta.json").read_text(encoding="utf-8")).get("username")
+        except (OSError, ValueError):
+            pass
 
 if not GH_TOKEN:
     raise ValueError("GH_TOKEN not found in environment variables")
-if not GH_USERNAME:
-    raise ValueError("GH_USERNAME not found in environment variables")
+GH_TOKENS = [token.strip() for token in GH_TOKEN.split(",") if token.strip()]
+
+
+def require_username() -> str:
+    """Return ``GH_USERNAME`` for the single-user entry points.
+
+    :raises ValueError: When ``GH_USERNAME`` is not set (and not recorded in the replayed cassette).
+    :return: The configured GitHub username.
+    """
+    if not GH_USERNAME:
+        raise ValueError("GH_USERNAME not found in environment variables")
+    return GH_USERNAME
+
 
 # LOG_LEVEL controls verbosity: "NONE" (silent), "INFO" (summary), "DEBUG" (includes API calls).
 # Can also be overridden via the LOG_LEVEL environment variable.
@@ -35,6 +76,72 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()],
 )
 
+# Size of the shared keep-alive connection pool used by every GitHubClient in the process.
+HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "10"))
+
+# In-process memoization window for identical GraphQL queries and REST calls.
+QUERY_CACHE_TTL: float = float(os.getenv("QUERY_CACHE_TTL", "300"))
+# Responses held by that in-process cache; the least recently used are evicted first.
+QUERY_CACHE_MAX_ENTRIES = 1000
+
+# Maximum cursor chains (one per repository owner) paginated concurrently.
+PAGINATION_WORKERS = 4
+
+# Adaptive GraphQL page size: chains start at their last recorded size (at most PAGE_SIZE_MAX),
+# halve on timeouts and 5xx responses down to PAGE_SIZE_MIN, and double after pages faster than PAGE_FAST_SECONDS.
+PAGE_SIZE_MAX = 100
+PAGE_SIZE_MIN = 5
+PAGE_FAST_SECONDS = 2.0
+
+# Retries for rate-limited (403/429) responses before the error is raised.
+RATE_LIMIT_MAX_RETRIES = 5
+
+# Persistent cache root; the daily workflow restores and saves this directory between runs.
+CACHE_DIR = Path(os.getenv("CACHE_DIR", Path(__file__).resolve().parents[1] / ".cache"))
+
+# Size bound for the on-disk conditional-request cache of REST responses (least recently used evicted first).
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Finished contribution years are re-fetched only after this many days.
+CALENDAR_REVALIDATE_DAYS = 30
+
+# Days before the last synced day that are re-fetched, to catch late-arriving contributions.
+CALENDAR_RESYNC_OVERLAP_DAYS = 7
+
+# Default connect/read timeout in seconds for every GitHub API request.
+HTTP_TIMEOUT = 30.0
+
+# Issue/PR/review search totals are kept incrementally (``created:>LAST`` deltas) and fully
+# recounted after this many days to pick up deletions, visibility changes, and late reviews.
+SEARCH_RECOUNT_DAYS = 7
+
+# Items are counted only once they are this old, so the search index has caught up with them and
+# each item falls into exactly one ``created:`` window.
+SEARCH_INDEX_LAG_MINUTES = 15
+
+# Language stats are cached per repository by ``pushedAt``; owners are swept in full (no early
+# stop at unchanged repositories) after this many days so deleted repositories are pruned.
+LANGUAGE_RESWEEP_DAYS = 7
+
+# Seconds a card waits for fresh data before rendering from its last saved bundle.
+CARD_DEADLINE_SECONDS: float = float(os.getenv("CARD_DEADLINE_SECONDS", "120"))
+# Seconds a finishing process waits, in total, for background bundle refreshes that overran their deadline.
+CARD_REFRESH_EXIT_WAIT_SECONDS = 30.0
+
+# Card server (``src.server``): seconds each rendered card is reused and advertised as cacheable.
+SERVER_CARD_TTLS = {"stats": 3600, "streak": 3600, "pr": 900, "activity": 300, "plan": 86400}
+# Users whose rendered cards each card cache keeps; the least recently requested are evicted first.
+SERVER_CACHE_MAX_USERS = 256
+
+# Users built concurrently by the multi-user batch mode (``src.batch``).
+BATCH_USER_WORKERS = 4
+
+# Commit-message lookups for the activity card: concurrent requests and per-request timeout.
+COMMIT_LOOKUP_WORKERS = 4
+COMMIT_LOOKUP_TIMEOUT = 5.0
+# Resolved commit messages kept on disk (oldest dropped first).
+COMMIT_MESSAGE_CACHE_MAX = 2000
+
 # Per-org configuration: controls which orgs contribute to star and language stats.
 ORG_CONFIG = [
     {"name": "thegraydot", "stars": True, "languages": True},
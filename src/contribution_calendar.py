@@ -0,0 +1,157 @@
+"""Array-backed contribution calendar with weekday prefix sums.
+
+:class:`ContributionCalendar` wraps a dense vector of daily counts indexed
+by day ordinal (as kept by :class:`~src.calendar_store.CalendarStore`) and
+precomputes, over weekdays only:
+
+1. Positions of each weekday in the count vector.
+2. Prefix sums of contribution counts, for O(log n) range totals (two
+   bisects over the weekday positions, then one subtraction).
+3. Prefix sums of active (non-zero) days, for O(log n) streak boundaries.
+
+Weekends (Sat/Sun) are excluded throughout: they neither count toward nor
+break streaks. When *years* is given, only days in those years are included,
+so (as with the per-year calendar lists this replaced) a year missing from
+``contributionYears`` neither counts toward nor breaks streaks either, even
+though the store holds zeros for it.
+
+Usage::
+
+    from src.contribution_calendar import ContributionCalendar
+
+    calendar = ContributionCalendar(store.base_ordinal, store.counts, years=[2023, 2024])
+    total = calendar.range_total(date(2024, 1, 1), date(2024, 12, 31))
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import date
+
+# date.fromordinal(1) is a Monday, so weekday(ordinal) == (ordinal + 6) % 7.
+_WEEKDAY_SHIFT = 6
+
+
+class ContributionCalendar:
+    """Weekday-only view over daily contribution counts with prefix-sum queries."""
+
+    def __init__(self, base_ordinal: int, counts: Sequence[int], years: Iterable[int] | None = None) -> None:
+        self.base_ordinal = base_ordinal
+        self.counts = counts
+
+        # Offset ranges to include: every stored day, or only the days of *years*.
+        if years is None:
+            spans = [(0, len(counts))]
+        else:
+            spans = []
+            for year in sorted(set(years)):
+                lo = max(0, date(year, 1, 1).toordinal() - base_ordinal)
+                hi = min(len(counts), date(year, 12, 31).toordinal() - base_ordinal + 1)
+                if lo < hi:
+                    spans.append((lo, hi))
+
+        # Weekday ordinals, their counts, and inclusive-exclusive prefix sums over both.
+        self.ordinals = array("l")
+        self.weekday_counts = array("L")
+        self.count_prefix = array("Q", [0])
+        self.active_prefix = array("L", [0])
+        total = active = 0
+        for lo, hi in spans:
+            for offset in range(lo, hi):
+                ordinal = base_ordinal + offset
+                if (ordinal + _WEEKDAY_SHIFT) % 7 >= 5:
+                    continue
+                count = counts[offset]
+                self.ordinals.append(ordinal)
+                self.weekday_counts.append(count)
+                total += count
+                active += count > 0
+                self.count_prefix.append(total)
+                self.active_prefix.append(active)
+
+    def __len__(self) -> int:
+        """Number of weekdays in the calendar."""
+        return len(self.ordinals)
+
+    @property
+    def total(self) -> int:
+        """Total weekday contributions."""
+        return self.count_prefix[-1]
+
+    @property
+    def first_day(self) -> date | None:
+        return date.fromordinal(self.ordinals[0]) if self.ordinals else None
+
+    @property
+    def last_day(self) -> date | None:
+        return date.fromordinal(self.ordinals[-1]) if self.ordinals else None
+
+    def range_total(self, start: date, end: date) -> int:
+        """Return weekday contributions from *start* to *end* inclusive, in O(log n).
+
+        :param start: First day of the range.
+        :param end: Last day of the range.
+        :return: Sum of weekday counts in the range (``0`` when empty).
+        """
+        lo = bisect_left(self.ordinals, start.toordinal())
+        hi = bisect_right(self.ordinals, end.toordinal())
+        return self.count_prefix[hi] - self.count_prefix[lo] if hi > lo else 0
+
+    def _is_run(self, lo: int, hi: int) -> bool:
+        """Return True when every weekday at positions ``lo..hi`` (inclusive) is active."""
+        return self.active_prefix[hi + 1] - self.active_prefix[lo] == hi - lo + 1
+
+    def longest_streak(self) -> tuple[int, date | None, date | None]:
+        """Return ``(length, start, end)`` of the earliest longest run of active weekdays."""
+        best_len = best_end = run_len = 0
+        for idx, count in enumerate(self.weekday_counts):
+            if count:
+                run_len += 1
+                if run_len > best_len:
+                    best_len, best_end = run_len, idx
+            else:
+                run_len = 0
+        if not best_len:
+            return 0, None, None
+        return (
+            best_len,
+            date.fromordinal(self.ordinals[best_end - best_len + 1]),
+            date.fromordinal(self.ordinals[best_end]),
+        )
+
+    def current_streak(self, today_local: date, today_utc: date) -> tuple[int, date | None, date | None]:
+        """Return ``(length, start, end)`` of the run ending on the most recent weekday.
+
+        Grace period: if the last day is today (UTC) with no contributions and
+        today is still a weekday locally, the streak is measured from the
+        previous weekday instead.
+
+        :param today_local: Today's date in ``LOCAL_TZ``.
+        :param today_utc: Today's date in UTC.
+        :return: Streak length and its first and last days, or ``(0, None, None)``.
+        """
+        end = len(self.ordinals) - 1
+        if end < 0:
+            return 0, None, None
+        if (
+            self.weekday_counts[end] == 0
+            and today_local.weekday() < 5
+            and date.fromordinal(self.ordinals[end]) == today_utc
+        ):
+            end -= 1
+        if end < 0 or self.weekday_counts[end] == 0:
+            return 0, None, None
+
+        # Binary search the earliest start such that start..end is an unbroken run.
+        lo, hi = 0, end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._is_run(mid, end):
+                hi = mid
+            else:
+                lo = mid + 1
+        return (
+            end - lo + 1,
+            date.fromordinal(self.ordinals[lo]),
+            date.fromordinal(self.ordinals[end]),
+        )
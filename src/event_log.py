@@ -0,0 +1,195 @@
+"""Persistent, incrementally polled log of a user's push events.
+
+Keeps an append-only JSON Lines file of trimmed push events from
+``/users/{username}/events`` plus a small state file holding the newest
+event id, the events feed ``ETag``, GitHub's ``X-Poll-Interval``, and the
+log's line count. :meth:`EventLog.for_user` returns one shared instance per
+log file, so concurrent polls in a process are serialized. Each
+:meth:`EventLog.poll`:
+
+1. Makes no request at all if the last poll is younger than the poll interval.
+2. Otherwise sends a conditional request; a ``304 Not Modified`` costs no
+   rate limit and involves no JSON parsing.
+3. On ``200``, walks pages only until it reaches an already-logged event id,
+   and appends just the new push events. The new ``ETag`` and newest id are
+   saved only once every page has been fetched and appended, so a failed
+   poll is retried in full by the next one.
+
+The log is compacted to the newest ``EVENT_LOG_MAX_EVENTS`` entries once it
+grows to twice that size.
+
+Usage::
+
+    from src.event_log import EventLog
+
+    log = EventLog.for_user(CACHE_DIR / "events", "octocat")
+    log.poll(client)
+    for event in log.iter_newest_first():
+        ...
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from src.github_client import GitHubClient
+from src.json_store import JsonStore
+
+logger = logging.getLogger(__name__)
+
+# The events API serves at most 300 events (3 pages of 100).
+EVENTS_PER_PAGE = 100
+EVENTS_MAX_PAGES = 3
+
+EVENT_LOG_MAX_EVENTS = 300
+DEFAULT_POLL_INTERVAL = 60
+
+_logs: dict[Path, "EventLog"] = {}
+_logs_lock = threading.Lock()
+
+
+def _trim_event(event: dict) -> dict:
+    """Keep only the fields the activity card reads from a push event."""
+    payload = event.get("payload", {})
+    trimmed_payload = {"head": payload.get("head", "")}
+    commits = payload.get("commits") or []
+    if commits:
+        trimmed_payload["commits"] = [{"message": commits[0].get("message", "").split("\n")[0]}]
+    return {
+        "id": event.get("id"),
+        "type": event.get("type"),
+        "repo": {"name": event.get("repo", {}).get("name", "")},
+        "payload": trimmed_payload,
+        "created_at": event.get("created_at"),
+    }
+
+
+class EventLog:
+    """Append-only local copy of a user's push events, refreshed by conditional polling."""
+
+    def __init__(self, directory: Path, username: str) -> None:
+        self.username = username
+        self.path = directory / f"{username}.jsonl"
+        self.state = JsonStore(directory / f"{username}.state.json")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_user(cls, directory: Path, username: str) -> "EventLog":
+        """Return the process-wide log for *username* in *directory*, creating it on first use.
+
+        :param directory: Directory holding the log and state files.
+        :param username: GitHub username whose events are logged.
+        :return: The shared :class:`EventLog`.
+        """
+        path = directory / f"{username}.jsonl"
+        with _logs_lock:
+            log = _logs.get(path)
+            if log is None:
+                log = _logs[path] = cls(directory, username)
+            return log
+
+    @property
+    def events_path(self) -> str:
+        return f"/users/{self.username}/events"
+
+    def poll(self, client: GitHubClient, force: bool = False) -> int:
+        """Merge any new push events into the log.
+
+        :param client: Authenticated GitHub client.
+        :param force: Poll even if ``X-Poll-Interval`` has not elapsed.
+        :return: Number of event pages fetched with a ``200`` response (``0`` for a skipped poll or a 304).
+        """
+        with self._lock:
+            polled_at = self.state.get("polled_at", 0)
+            interval = self.state.get("poll_interval", DEFAULT_POLL_INTERVAL)
+            if not force and time.time() - polled_at < interval:
+                logger.debug("event log %s: poll skipped (interval %ds)", self.username, interval)
+                return 0
+
+            newest_id = int(self.state.get("newest_id") or 0)
+            etag = self.state.get("etag") if self.path.exists() else None
+            # Nothing is written to the state until every page succeeded and the log is appended to,
+            # so a failed poll keeps the previous ETag and the next poll fetches the missed events.
+            new_etag = new_interval = None
+            new_events: list[dict] = []
+            pages = 0
+            for page in range(1, EVENTS_MAX_PAGES + 1):
+                headers = {"If-None-Match": etag} if page == 1 and etag else None
+                response = client.request_rest(
+                    self.events_path, params={"per_page": EVENTS_PER_PAGE, "page": page}, headers=headers
+                )
+                if page == 1:
+                    if response.headers.get("X-Poll-Interval", "").isdigit():
+                        new_interval = int(response.headers["X-Poll-Interval"])
+                    if response.status_code == 304:
+                        logger.debug("event log %s: not modified", self.username)
+                        new_etag = etag
+                        break
+                    new_etag = response.headers.get("ETag")
+                response.raise_for_status()
+                pages += 1
+
+                events = response.json()
+                if not isinstance(events, list):
+                    raise ValueError(f"unexpected response from {self.events_path}: {type(events).__name__}")
+                reached_known = False
+                for event in events:
+                    if int(event.get("id") or 0) <= newest_id:
+                        reached_known = True
+                        break
+                    new_events.append(event)
+                if reached_known or len(events) < EVENTS_PER_PAGE:
+                    break
+
+            # Appending even nothing creates the log file, which the ETag is only sent alongside.
+            if new_events or not self.path.exists():
+                self._append([_trim_event(e) for e in reversed(new_events) if e.get("type") == "PushEvent"])
+            if new_events:
+                self.state.set("newest_id", str(max(int(e["id"]) for e in new_events)))
+            self.state.set("etag", new_etag)
+            if new_interval is not None:
+                self.state.set("poll_interval", new_interval)
+            self.state.set("polled_at", time.time())
+            self.state.save()
+            logger.debug("event log %s: %d new event(s) from %d page(s)", self.username, len(new_events), pages)
+            return pages
+
+    def _append(self, events: list[dict]) -> None:
+        """Append *events* to the log, compacting it once it reaches twice ``EVENT_LOG_MAX_EVENTS`` lines.
+
+        The line count is kept in the state file; it is only recounted from the
+        log for state written before the count was tracked.
+        """
+        if not self.path.exists():
+            count = 0
+        elif (count := self.state.get("lines")) is None:
+            with self.path.open(encoding="utf-8") as fh:
+                count = sum(1 for _ in fh)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            for event in events:
+                fh.write(json.dumps(event, separators=(",", ":")) + "\n")
+        count += len(events)
+
+        if count >= 2 * EVENT_LOG_MAX_EVENTS:
+            lines = self.path.read_text(encoding="utf-8").splitlines(keepends=True)[-EVENT_LOG_MAX_EVENTS:]
+            tmp = self.path.with_suffix(".jsonl.tmp")
+            tmp.write_text("".join(lines), encoding="utf-8")
+            os.replace(tmp, self.path)
+            count = len(lines)
+            logger.debug("event log %s: compacted to %d event(s)", self.username, count)
+        self.state.set("lines", count)
+
+    def iter_newest_first(self) -> Iterator[dict]:
+        """Yield logged push events from newest to oldest."""
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in reversed(lines):
+            if line:
+                yield json.loads(line)
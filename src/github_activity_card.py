@@ -1,7 +1,8 @@
 """Generates the GitHub activity SVG cards.
 
-Fetches recent push events for a user, resolves commit messages where
-necessary, and renders dark and light activity log SVG cards.
+Refreshes the user's local push event log (see :mod:`src.event_log`),
+resolves commit messages where necessary, and renders dark and light
+activity log SVG cards from the log.
 
 Usage::
 
@@ -10,15 +11,33 @@ Usage::
 
 import html
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.config import GH_USERNAME
-from src.github_client import GitHubClient
-from src.render_template import render_template
+from src.card_bundle import fetch_bundle
+from src.config import (
+    CACHE_DIR,
+    COMMIT_LOOKUP_TIMEOUT,
+    COMMIT_LOOKUP_WORKERS,
+    COMMIT_MESSAGE_CACHE_MAX,
+    require_username,
+)
+from src.event_log import EventLog
+from src.github_client import GitHubClient, log_http_stats
+from src.graphql_queries import build_commit_headlines_query
+from src.json_store import JsonStore
+from src.render_template import load_template, write_card_svgs
 
 logger = logging.getLogger(__name__)
 
+# Shared by every activity card in the process (batch mode and the server render several at once).
+_commit_messages = JsonStore(CACHE_DIR / "commit_messages.json", max_entries=COMMIT_MESSAGE_CACHE_MAX)
+
+ACTIVITY_MAX_ENTRIES = 8
+ACTIVITY_MAX_PER_REPO = 2
+
 
 def _relative_time(dt: datetime) -> str:
     """Return a human-readable relative time string for *dt*.
@@ -53,7 +72,7 @@ def _fetch_commit_message(client: GitHubClient, repo_name: str, sha: str) -> str
     """
     logger.debug("fetching commit message for %s@%s", repo_name, sha[:7])
     try:
-        data = client.get_rest(f"/repos/{repo_name}/commits/{sha}")
+        data = client.get_rest(f"/repos/{repo_name}/commits/{sha}", timeout=COMMIT_LOOKUP_TIMEOUT)
         if isinstance(data, dict):
             msg = data.get("commit", {}).get("message", "")
             return msg.split("\n")[0][:70]
@@ -63,31 +82,100 @@ def _fetch_commit_message(client: GitHubClient, repo_name: str, sha: str) -> str
     return ""
 
 
-def _fetch_push_events(client: GitHubClient, path: str) -> list[dict]:
-    """Fetch and parse push events from the GitHub REST events endpoint.
+def _fetch_commit_headlines(client: GitHubClient, entries: list[dict]) -> dict[int, str]:
+    """Resolve commit headlines for *entries* with one batched GraphQL query.
+
+    Entries whose repository or commit the token cannot see through GraphQL
+    are simply absent from the result so the caller can fall back to REST.
 
     :param client: Authenticated GitHub client.
-    :param path: API path, e.g. ``/users/octocat/events``.
-    :return: List of push event dicts with ``repo``, ``message``, ``head_sha``, and ``timestamp``.
+    :param entries: Push event entries with ``repo`` and ``head_sha``.
+    :return: Mapping of entry index to its headline, truncated to 70 characters.
     """
-    entries: list[dict] = []
+    variables = {}
+    for i, entry in enumerate(entries):
+        owner, _, name = entry["repo"].partition("/")
+        variables.update({f"owner{i}": owner, f"name{i}": name, f"oid{i}": entry["head_sha"]})
     try:
-        events = client.get_rest(path, params={"per_page": 100})
+        result = client.query(build_commit_headlines_query(len(entries)), variables, allow_partial=True)
     except Exception as exc:
-        logger.warning("failed to fetch events from %s: %s", path, exc)
-        return entries
+        logger.debug("batched commit lookup failed: %s", exc)
+        return {}
+
+    headlines = {}
+    data = result.get("data") or {}
+    for i in range(len(entries)):
+        commit = (data.get(f"c{i}") or {}).get("object") or {}
+        if commit.get("messageHeadline"):
+            headlines[i] = commit["messageHeadline"][:70]
+    return headlines
+
+
+def _resolve_commit_messages(client: GitHubClient, entries: list[dict]) -> None:
+    """Fill in missing ``message`` fields of *entries* in place.
 
-    if not isinstance(events, list):
-        logger.warning("unexpected response from %s: %s", path, type(events))
-        return entries
+    Messages are looked up in the persistent SHA cache first, then resolved
+    with one batched GraphQL query; any left over (repositories GraphQL cannot
+    see) are fetched from REST concurrently on a bounded pool, each with its
+    own timeout. Successful results are added to the cache.
 
+    :param client: Authenticated GitHub client.
+    :param entries: Push event entries; those with ``message`` of ``None`` and a ``head_sha`` are resolved.
+    """
+    store = _commit_messages
+    pending: list[dict] = []
+    for entry in entries:
+        if entry["message"] is not None or not entry.get("head_sha"):
+            continue
+        cached = store.get(f"{entry['repo']}@{entry['head_sha']}")
+        if cached is not None:
+            entry["message"] = cached
+        else:
+            pending.append(entry)
+
+    logger.debug("commit messages: %d cached, %d to fetch", len(entries) - len(pending), len(pending))
+    if not pending:
+        return
+
+    headlines = _fetch_commit_headlines(client, pending)
+    for i, headline in headlines.items():
+        pending[i]["message"] = headline
+        store.set(f"{pending[i]['repo']}@{pending[i]['head_sha']}", headline)
+    pending = [entry for i, entry in enumerate(pending) if i not in headlines]
+    if not pending:
+        store.save()
+        return
+    logger.debug("commit messages: %d falling back to REST", len(pending))
+
+    with ThreadPoolExecutor(max_workers=min(COMMIT_LOOKUP_WORKERS, len(pending)), thread_name_prefix="commit") as pool:
+        messages = pool.map(lambda e: _fetch_commit_message(client, e["repo"], e["head_sha"]), pending)
+        for entry, message in zip(pending, messages):
+            entry["message"] = message
+            if message:
+                store.set(f"{entry['repo']}@{entry['head_sha']}", message)
+    store.save()
+
+
+def _select_push_events(events: Iterable[dict], limit: int, per_repo: int) -> list[dict]:
+    """Pick the first *limit* push events from *events*, at most *per_repo* per repository.
+
+    Events arrive newest first; each is parsed only once it passes the type and
+    per-repo checks, and consumption stops as soon as *limit* entries are chosen.
+
+    :param events: Raw events, newest first.
+    :param limit: Maximum number of entries to return.
+    :param per_repo: Maximum entries per repository.
+    :return: List of push event dicts with ``repo``, ``message``, ``head_sha``, and ``timestamp``.
+    """
+    entries: list[dict] = []
+    repo_counts: dict[str, int] = {}
     for event in events:
         if event.get("type") != "PushEvent":
             continue
-        payload = event.get("payload", {})
         repo_name = event.get("repo", {}).get("name", "")
-        if not repo_name:
+        if not repo_name or repo_counts.get(repo_name, 0) >= per_repo:
             continue
+        payload = event.get("payload", {})
         # New API format: commits stripped, only head SHA available
         head_sha = payload.get("head", "")
         # Old API format (fallback): commits list present
@@ -108,11 +196,51 @@ def _fetch_push_events(client: GitHubClient, path: str) -> list[dict]:
                 "timestamp": created_at,
             }
         )
+        repo_counts[repo_name] = repo_counts.get(repo_name, 0) + 1
+        if len(entries) >= limit:
+            break
 
-    logger.debug("fetched %d push events from %s", len(entries), path)
+    entries.sort(key=lambda x: x["timestamp"], reverse=True)
     return entries
 
 
+def _fetch_push_events(client: GitHubClient, username: str) -> tuple[list[dict], int]:
+    """Refresh the local event log for *username* and select the card's push events from it.
+
+    If polling fails, the card is rendered from whatever the log already holds.
+
+    :param client: Authenticated GitHub client.
+    :param username: GitHub username whose events feed is logged.
+    :return: Tuple of ``(entries, pages_polled)``: the number of event pages the poll downloaded
+        (``0`` when it was skipped, answered ``304``, or failed), not pages read to fill the card.
+    """
+    log = EventLog.for_user(CACHE_DIR / "events", username)
+    try:
+        pages = log.poll(client)
+    except Exception as exc:
+        logger.warning("failed to poll events for %s, using local log: %s", username, exc)
+        pages = 0
+    entries = _select_push_events(log.iter_newest_first(), ACTIVITY_MAX_ENTRIES, ACTIVITY_MAX_PER_REPO)
+    logger.debug("selected %d push events from %s (%d page(s) polled)", len(entries), log.path, pages)
+    return entries, pages
+
+
+def _fetch_activity_data(client: GitHubClient, username: str) -> dict:
+    """Select the card's push events and resolve their commit messages.
+
+    :param client: Authenticated GitHub client.
+    :param username: GitHub username whose events are shown.
+    :return: Dict with ``entries`` (ISO ``timestamp``) and the number of event ``pages`` downloaded by the poll.
+    """
+    entries, pages = _fetch_push_events(client, username)
+    _resolve_commit_messages(client, entries)
+    for entry in entries:
+        if not entry["message"]:
+            entry["message"] = "(no message)"
+        entry["timestamp"] = entry["timestamp"].isoformat()
+    return {"entries": entries, "pages": pages}
+
+
 def _build_log_lines_svg(entries: list[dict]) -> str:
     if not entries:
         return (
@@ -139,55 +267,53 @@ def _build_log_lines_svg(entries: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def generate_github_activity_cards(
+def render_github_activity_svgs(
     *,
     templates_dir: Path,
-    output_dir: Path,
     username: str,
-) -> tuple[Path, Path]:
+    client: GitHubClient | None = None,
+) -> dict[str, str]:
+    """Fetch recent push activity for *username* and render the dark and light activity SVGs.
+
+    :param templates_dir: Directory containing the SVG template files.
+    :param username: GitHub username to generate cards for.
+    :param client: Optional shared :class:`GitHubClient`; one is created if omitted.
+    :return: Rendered SVGs keyed by theme (``dark`` and ``light``).
+    """
     logger.info("generating activity card for %s", username)
-    client = GitHubClient()
+    client = client or GitHubClient()
 
-    entries: list[dict] = _fetch_push_events(client, f"/users/{username}/events")
+    data = fetch_bundle(username, "activity", lambda: _fetch_activity_data(client, username)).data
+    filtered = [{**entry, "timestamp": datetime.fromisoformat(entry["timestamp"])} for entry in data["entries"]]
 
-    entries.sort(key=lambda x: x["timestamp"], reverse=True)
-
-    repo_counts: dict[str, int] = {}
-    filtered: list[dict] = []
-    for entry in entries:
-        repo = entry["repo"]
-        if repo_counts.get(repo, 0) < 2:
-            filtered.append(entry)
-            repo_counts[repo] = repo_counts.get(repo, 0) + 1
-        if len(filtered) >= 8:
-            break
-
-    for entry in filtered:
-        if entry["message"] is None and entry.get("head_sha"):
-            entry["message"] = _fetch_commit_message(client, entry["repo"], entry["head_sha"])
-        if not entry["message"]:
-            entry["message"] = "(no message)"
-
-    logger.info("activity card: %d entries after filtering", len(filtered))
+    logger.info("activity card: %d entries after filtering (%d new event page(s) polled)", len(filtered), data["pages"])
     log_lines = _build_log_lines_svg(filtered)
     values = {"LOG_LINES": log_lines}
 
-    dark_template = (templates_dir / "github_activity_card_dark.svg").read_text(encoding="utf-8")
-    light_template = (templates_dir / "github_activity_card_light.svg").read_text(encoding="utf-8")
+    return {
+        "dark": load_template(templates_dir / "github_activity_card_dark.svg").render(values),
+        "light": load_template(templates_dir / "github_activity_card_light.svg").render(values),
+    }
 
-    dark_svg = render_template(dark_template, values)
-    light_svg = render_template(light_template, values)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+def generate_github_activity_cards(
+    *,
+    templates_dir: Path,
+    output_dir: Path,
+    username: str,
+    client: GitHubClient | None = None,
+) -> tuple[Path, Path]:
+    """Render the activity card for *username* and write its dark and light SVGs into *output_dir*.
 
-    dark_out = output_dir / "github_activity_card_dark.svg"
-    light_out = output_dir / "github_activity_card_light.svg"
-    dark_out.write_text(dark_svg, encoding="utf-8")
-    light_out.write_text(light_svg, encoding="utf-8")
-    logger.info("wrote %s", dark_out)
-    logger.info("wrote %s", light_out)
+    See :func:`render_github_activity_svgs`.
 
-    return dark_out, light_out
+    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    """
+    return write_card_svgs(
+        output_dir,
+        "github_activity_card",
+        render_github_activity_svgs(templates_dir=templates_dir, username=username, client=client),
+    )
 
 
 def main() -> None:
@@ -198,8 +324,9 @@ def main() -> None:
     generate_github_activity_cards(
         templates_dir=templates_dir,
         output_dir=output_dir,
-        username=GH_USERNAME,
+        username=require_username(),
     )
+    log_http_stats()
 
 
 if __name__ == "__main__":
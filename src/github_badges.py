@@ -12,7 +12,7 @@ import logging
 import re
 from pathlib import Path
 
-from src.render_template import render_template
+from src.render_template import load_template
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +117,7 @@ def generate_badges(
     templates_dir: Path,
     output_dir: Path,
 ) -> list[tuple[Path, Path]]:
-    template = (templates_dir / "badge.svg").read_text(encoding="utf-8")
+    template = load_template(templates_dir / "badge.svg")
     output_dir.mkdir(parents=True, exist_ok=True)
 
     results: list[tuple[Path, Path]] = []
@@ -152,8 +152,8 @@ def generate_badges(
         dark_values = {**base_values, "icon_group_attrs": dark_icon_attrs, **DARK_PALETTE}
         light_values = {**base_values, "icon_group_attrs": light_icon_attrs, **LIGHT_PALETTE}
 
-        dark_svg = render_template(template, dark_values)
-        light_svg = render_template(template, light_values)
+        dark_svg = template.render(dark_values)
+        light_svg = template.render(light_values)
 
         dark_out = output_dir / f"{filename}_dark.svg"
         light_out = output_dir / f"{filename}_light.svg"
@@ -4,7 +4,14 @@ Provides:
 
 1. Authenticated REST GET requests.
 2. GraphQL query execution with error handling.
-3. Automatic cursor-based pagination for user and organisation queries.
+3. Cursor-based pagination, with independent chains (e.g. one per owner) run in parallel.
+4. A process-wide pooled keep-alive session shared by every client instance.
+5. Process-wide memoization with single-flight coalescing of identical requests.
+6. Rate-limit-aware pacing and jittered retry of 403/429 responses per API bucket.
+7. A persistent ETag/Last-Modified cache that revalidates REST responses conditionally.
+8. Adaptive page sizing that shrinks on timeouts and 5xx responses and grows back on fast pages.
+9. Routing across a pool of tokens by remaining budget, with failover on exhausted or revoked tokens.
+10. Pluggable live, record, and replay transports (``HTTP_TRANSPORT``, see :mod:`src.cassette`).
 
 Usage::
 
@@ -14,125 +21,507 @@ Usage::
     result = client.query(MY_QUERY, {"username": "octocat"})
 """
 
+import atexit
+import hashlib
+import json
 import logging
-from collections.abc import Callable
+import re
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
 import requests
-
-from src.config import API_URL, GH_TOKEN
-
-REST_API_URL = "https://api.github.com"
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from src.cassette import Cassette, RecordingAdapter, ReplayAdapter
+from src.config import (
+    API_URL,
+    CACHE_DIR,
+    GH_TOKENS,
+    GH_USERNAME,
+    HTTP_CACHE_MAX_BYTES,
+    HTTP_CASSETTE,
+    HTTP_POOL_SIZE,
+    HTTP_TIMEOUT,
+    HTTP_TRANSPORT,
+    PAGE_FAST_SECONDS,
+    PAGE_SIZE_MIN,
+    PAGINATION_WORKERS,
+    QUERY_CACHE_MAX_ENTRIES,
+    QUERY_CACHE_TTL,
+    RATE_LIMIT_MAX_RETRIES,
+    REPLAY_LATENCY_MS,
+    REST_API_URL,
+)
+from src.http_cache import HTTPCache
+from src.json_store import JsonStore
+from src.query_cache import QueryCache, make_key
+from src.rate_limit import RateLimitScheduler, bucket_for
+from src.token_pool import TokenPool
 
 logger = logging.getLogger(__name__)
 
+_session_lock = threading.Lock()
+_shared_session: requests.Session | None = None
+_shared_adapter: "_CountingAdapter | None" = None
+_shared_cache = QueryCache(ttl=QUERY_CACHE_TTL, max_entries=QUERY_CACHE_MAX_ENTRIES)
+_shared_scheduler = RateLimitScheduler()
+# The first token is paced by the shared scheduler, so a single-token pool behaves as before.
+_shared_token_pool = TokenPool(GH_TOKENS, [_shared_scheduler])
+_shared_http_cache = HTTPCache(CACHE_DIR / "http", max_bytes=HTTP_CACHE_MAX_BYTES)
+# Last page size that succeeded for each adaptively sized cursor chain.
+_page_sizes = JsonStore(CACHE_DIR / "page_sizes.json")
+
+# Commits addressed by full SHA never change, so their cached bodies are never revalidated.
+_IMMUTABLE_PATH = re.compile(r"^/repos/[^/]+/[^/]+/commits/[0-9a-f]{40}$")
+
+
+class _CountingAdapter(BaseAdapter):
+    """Adapter wrapper that counts requests and response bytes so connection reuse and volume can be reported."""
+
+    def __init__(self, transport: BaseAdapter) -> None:
+        super().__init__()
+        self.transport = transport
+        self._count_lock = threading.Lock()
+        self.requests_sent = 0
+        self.bytes_received = 0
+
+    def send(self, request, **kwargs):
+        with self._count_lock:
+            self.requests_sent += 1
+        response = self.transport.send(request, **kwargs)
+        received = len(response.content or b"")
+        with self._count_lock:
+            self.bytes_received += received
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def connections_opened(self) -> int:
+        poolmanager = getattr(self.transport, "poolmanager", None)
+        if poolmanager is None:
+            return 0
+        pools = poolmanager.pools
+        return sum(pools[key].num_connections for key in list(pools.keys()))
+
+
+def _make_transport(pool_size: int) -> BaseAdapter:
+    """Build the adapter selected by ``HTTP_TRANSPORT`` (see :mod:`src.cassette`)."""
+    pool_args = {"pool_connections": pool_size, "pool_maxsize": pool_size, "pool_block": True}
+    if HTTP_TRANSPORT == "live":
+        return HTTPAdapter(**pool_args)
+    cassette = Cassette(HTTP_CASSETTE, REST_API_URL)
+    if HTTP_TRANSPORT == "replay":
+        logger.info("replaying GitHub API responses from %s", HTTP_CASSETTE)
+        return ReplayAdapter(cassette, latency=REPLAY_LATENCY_MS / 1000)
+    logger.info("recording GitHub API responses to %s", HTTP_CASSETTE)
+    if GH_USERNAME:
+        cassette.set_username(GH_USERNAME)
+    return RecordingAdapter(cassette, HTTPAdapter(**pool_args))
+
+
+def get_shared_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Return the process-wide keep-alive session, creating it on first use.
+
+    The underlying urllib3 pool is thread-safe, so one session is shared by
+    every :class:`GitHubClient` (and every card generator) in the process.
+    The session's transport is chosen by ``HTTP_TRANSPORT`` (live, record, or
+    replay); a recording is saved when the process exits.
+
+    :param pool_size: Maximum number of connections kept open per host.
+    :return: Shared :class:`requests.Session` with gzip and keep-alive enabled.
+    """
+    global _shared_session, _shared_adapter
+    with _session_lock:
+        if _shared_session is None:
+            adapter = _CountingAdapter(_make_transport(pool_size))
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+            if HTTP_TRANSPORT != "live":
+                atexit.register(adapter.close)
+            _shared_session = session
+            _shared_adapter = adapter
+            logger.debug("created shared HTTP session (pool_size=%d, transport=%s)", pool_size, HTTP_TRANSPORT)
+        return _shared_session
+
+
+def connection_stats() -> dict[str, int]:
+    """Return request, connection, and volume counters for the shared session.
+
+    :return: Dict with ``requests``, ``connections`` (opened), ``reused``, and ``bytes`` (decoded response bodies).
+    """
+    if _shared_adapter is None:
+        return {"requests": 0, "connections": 0, "reused": 0, "bytes": 0}
+    sent = _shared_adapter.requests_sent
+    opened = _shared_adapter.connections_opened()
+    return {
+        "requests": sent,
+        "connections": opened,
+        "reused": max(0, sent - opened),
+        "bytes": _shared_adapter.bytes_received,
+    }
+
+
+def get_shared_cache() -> QueryCache:
+    """Return the process-wide response cache used by default by every client."""
+    return _shared_cache
+
+
+def get_shared_scheduler() -> RateLimitScheduler:
+    """Return the process-wide rate-limit scheduler of the first token in the shared pool."""
+    return _shared_scheduler
+
+
+def get_shared_token_pool() -> TokenPool:
+    """Return the process-wide token pool (from ``GH_TOKEN``) used by default by every client."""
+    return _shared_token_pool
+
+
+def log_http_stats() -> None:
+    """Log connection reuse and response cache counters at ``INFO`` level."""
+    stats = connection_stats()
+    logger.info(
+        "http: %d request(s) over %d connection(s), %d reused, %.1f KiB received",
+        stats["requests"],
+        stats["connections"],
+        stats["reused"],
+        stats["bytes"] / 1024,
+    )
+    cache = _shared_cache.stats()
+    logger.info(
+        "cache: %d hit(s), %d miss(es), %d coalesced, %d evicted",
+        cache["hits"],
+        cache["misses"],
+        cache["coalesced"],
+        cache["evicted"],
+    )
+    disk = _shared_http_cache.stats()
+    logger.info(
+        "http cache: %d hit(s), %d revalidated (304), %d refreshed, %d miss(es), %d entries",
+        disk["hits"],
+        disk["revalidated"],
+        disk["refreshed"],
+        disk["misses"],
+        disk["entries"],
+    )
+    for token in _shared_token_pool.tokens:
+        limits = token.scheduler.stats()
+        logger.info(
+            "rate limit %s: requests=%s, remaining=%s, %d retry(ies), %.2fs throttled%s",
+            token.label,
+            dict(token.requests),
+            limits["remaining"],
+            limits["retries"],
+            limits["throttled_seconds"],
+            ", revoked" if token.revoked else "",
+        )
+
+
+class PageChain(NamedTuple):
+    """One cursor chain for :meth:`GitHubClient.paginated_queries`."""
+
+    query_string: str
+    variables: dict
+    page_info_path: Sequence[str]
+    process_fn: Callable[[dict], dict | bool | None]
+    page_size: int | None = None
+
+
+def _is_retryable_page_error(exc: Exception) -> bool:
+    """Return True for failures a smaller page may avoid: timeouts, 5xx, and GraphQL timeout errors."""
+    if isinstance(exc, requests.Timeout | requests.ConnectionError):
+        return True
+    if isinstance(exc, requests.HTTPError):
+        return exc.response is not None and exc.response.status_code >= 500
+    return isinstance(exc, RuntimeError) and "timeout" in str(exc).lower()
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    if response.status_code == 429:
+        return True
+    if response.status_code == 403:
+        if response.headers.get("Retry-After") or response.headers.get("X-RateLimit-Remaining") == "0":
+            return True
+        return "rate limit" in response.text.lower()
+    if response.status_code == 200 and b"RATE_LIMITED" in response.content:
+        try:
+            errors = response.json().get("errors") or []
+        except ValueError:
+            return False
+        return any(isinstance(e, dict) and e.get("type") == "RATE_LIMITED" for e in errors)
+    return False
+
 
 class GitHubClient:
     """Authenticated client for the GitHub REST and GraphQL APIs."""
 
-    def __init__(self) -> None:
-        self.headers = {
-            "Authorization": f"Bearer {GH_TOKEN}",
-            "Content-Type": "application/json",
-        }
-
-    def get_rest(self, path: str, params: dict | None = None) -> dict | list:
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        cache: QueryCache | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        http_cache: HTTPCache | None = None,
+        token_pool: TokenPool | None = None,
+    ) -> None:
+        self.session = session or get_shared_session()
+        self.cache = cache or _shared_cache
+        self.http_cache = http_cache or _shared_http_cache
+        if token_pool is None:
+            token_pool = _shared_token_pool if scheduler is None else TokenPool(GH_TOKENS, [scheduler])
+        self.token_pool = token_pool
+        self.headers = {"Content-Type": "application/json"}
+
+    def get_rest(self, path: str, params: dict | None = None, timeout: float = HTTP_TIMEOUT) -> dict | list:
         """Perform an authenticated GET request against the REST API.
 
         :param path: API path relative to ``https://api.github.com``, e.g. ``/users/octocat/events``.
         :param params: Optional query parameters to include in the request.
+        :param timeout: Per-request connect/read timeout in seconds.
         :return: Parsed JSON response as a dict or list.
         """
+        # Responses depend on what the tokens can see, so clients with other tokens never share them.
+        key = (*make_key("rest", path, params), self.token_pool.fingerprint)
+        return self.cache.get_or_fetch(key, lambda: self._get_rest(key, path, params, timeout))
+
+    def _get_rest(self, key: tuple, path: str, params: dict | None, timeout: float) -> dict | list:
+        entry = self.http_cache.get(key)
+        if entry is not None and entry.immutable:
+            self.http_cache.record("hit")
+            logger.debug("GET %s served from disk cache", path)
+            return json.loads(entry.body)
+
         url = f"{REST_API_URL}{path}"
         logger.debug("GET %s params=%s", path, params)
-        response = requests.get(url, headers=self.headers, params=params)
+        extra_headers = entry.conditional_headers() if entry is not None else None
+        response = self._send(
+            bucket_for("rest", path), "GET", url, params=params, extra_headers=extra_headers, timeout=timeout
+        )
+        if response.status_code == 304 and entry is not None:
+            self.http_cache.record("revalidated")
+            logger.debug("GET %s not modified", path)
+            return json.loads(entry.body)
         response.raise_for_status()
+        if entry is not None:
+            self.http_cache.record("refreshed")
+            logger.debug("GET %s changed, refreshing disk cache", path)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        immutable = bool(_IMMUTABLE_PATH.match(path))
+        if etag or last_modified or immutable:
+            self.http_cache.put(key, etag=etag, last_modified=last_modified, immutable=immutable, body=response.content)
         return response.json()
 
-    def query(self, query_string: str, variables: dict | None = None) -> dict:
+    def request_rest(
+        self,
+        path: str,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = HTTP_TIMEOUT,
+    ) -> requests.Response:
+        """Send a paced REST GET that bypasses both caches and return the raw response.
+
+        For callers that manage their own validators and need status and headers,
+        such as conditional polling of the events feed.
+
+        :param path: API path relative to ``https://api.github.com``.
+        :param params: Optional query parameters to include in the request.
+        :param headers: Extra request headers, e.g. ``If-None-Match``.
+        :param timeout: Per-request connect/read timeout in seconds.
+        :return: The response, unchecked (``304`` and errors are left to the caller).
+        """
+        url = f"{REST_API_URL}{path}"
+        logger.debug("GET %s params=%s (raw)", path, params)
+        return self._send(bucket_for("rest", path), "GET", url, params=params, extra_headers=headers, timeout=timeout)
+
+    def _send(
+        self,
+        bucket: str,
+        method: str,
+        url: str,
+        extra_headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request with the best token in the pool, paced by its scheduler, retrying rate limits.
+
+        Each attempt goes to the token with the most remaining budget in *bucket*.
+        A ``401`` revokes the token and a rate-limited response from an exhausted
+        token switches to another one immediately, when another usable token
+        exists; otherwise 403/429 responses that carry rate-limit signals, and
+        GraphQL ``RATE_LIMITED`` errors, are retried up to ``RATE_LIMIT_MAX_RETRIES``
+        times with backoff. The final response is returned as-is for the caller to check.
+        """
+        headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+        pool = self.token_pool
+        failed = None
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            token = pool.choose(bucket, exclude=failed)
+            token.scheduler.acquire(bucket)
+            response = self.session.request(
+                method, url, headers={**headers, "Authorization": f"Bearer {token.value}"}, **kwargs
+            )
+            token.scheduler.observe(bucket, response.headers)
+            pool.record(token, bucket)
+            if response.status_code == 401 and pool.has_alternative(token, bucket):
+                pool.revoke(token)
+                continue
+            if attempt == RATE_LIMIT_MAX_RETRIES or not _is_rate_limited(response):
+                return response
+            if pool.has_alternative(token, bucket):
+                logger.debug("%s rate limited on token %s, failing over", bucket, token.label)
+                failed = token
+                continue
+            delay = token.scheduler.backoff(bucket, attempt, response.headers)
+            logger.warning("%s rate limited (HTTP %d), retrying in %.1fs", bucket, response.status_code, delay)
+            token.scheduler.wait(delay)
+        return response
+
+    def query(self, query_string: str, variables: dict | None = None, allow_partial: bool = False) -> dict:
         """Execute a GraphQL query and return the parsed response.
 
         :param query_string: GraphQL query string.
         :param variables: Optional mapping of GraphQL variable names to values.
+        :param allow_partial: Return ``data`` alongside GraphQL ``errors`` instead of raising,
+            for batched queries where some aliased fields may fail (e.g. ``NOT_FOUND``).
         :raises RuntimeError: When the response contains GraphQL errors or is malformed.
         :return: Full parsed response dict including the ``data`` key.
         """
+        # Like get_rest, keyed by the token pool so viewer-scoped results never cross credentials.
+        key = (
+            *make_key("graphql-partial" if allow_partial else "graphql", query_string, variables),
+            self.token_pool.fingerprint,
+        )
+        return self.cache.get_or_fetch(key, lambda: self._query(query_string, variables, allow_partial))
+
+    def _query(self, query_string: str, variables: dict | None, allow_partial: bool = False) -> dict:
         payload = {"query": query_string}
         if variables:
             payload["variables"] = variables
         logger.debug("GraphQL query variables=%s", list(variables.keys()) if variables else None)
-        response = requests.post(API_URL, json=payload, headers=self.headers)
+        response = self._send("graphql", "POST", API_URL, json=payload, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         if isinstance(data, dict) and "errors" in data:
+            if allow_partial and data.get("data") is not None:
+                logger.debug("GraphQL partial result with %d error(s)", len(data["errors"]))
+                return data
             raise RuntimeError(f"GitHub GraphQL returned errors: {data['errors']}")
         if not isinstance(data, dict) or "data" not in data:
             raise RuntimeError(f"Unexpected GitHub response (no 'data'): {data}")
         return data
 
-    def paginated_query(self, query_string: str, username: str, process_fn: Callable[[dict], None]) -> None:
-        """Execute a paginated GraphQL query over a user's repositories.
-
-        Iterates through all pages, calling *process_fn* with each page's
-        raw response until ``hasNextPage`` is false.
+    def paginated_query(
+        self,
+        query_string: str,
+        variables: dict,
+        page_info_path: Sequence[str],
+        process_fn: Callable[[dict], dict | bool | None],
+        page_size: int | None = None,
+    ) -> int:
+        """Follow one GraphQL cursor chain to the end.
+
+        Iterates through all pages, calling *process_fn* with each page's raw
+        response until the connection at *page_info_path* reports
+        ``hasNextPage`` false. *process_fn* steers the remaining pages through
+        its return value: a dict of variables to override, or ``False`` to stop
+        early.
+
+        With *page_size*, the query must take a ``$first`` variable and the size
+        adapts: a timeout or 5xx halves it (down to ``PAGE_SIZE_MIN``) and the
+        same cursor is retried, while a page faster than ``PAGE_FAST_SECONDS``
+        doubles it (up to *page_size*, and never back to a size that failed in
+        this chain). The last size that succeeded is recorded per chain and used
+        as the starting size next time.
 
         :param query_string: GraphQL query string with ``$cursor`` variable support.
-        :param username: GitHub username passed as the ``$username`` variable.
-        :param process_fn: Callable invoked with each page's raw response dict.
+        :param variables: Variables for every page; ``cursor`` is added per page.
+        :param page_info_path: Keys under ``data`` leading to the paginated connection,
+            e.g. ``("user", "repositories")``.
+        :param process_fn: Callable invoked with each page's raw response dict; returns
+            ``None``, a dict of variable overrides, or ``False``.
+        :param page_size: Maximum page size for adaptive sizing; ``None`` uses the query's own.
+        :return: Number of pages fetched.
         """
         cursor = None
         has_next_page = True
         page_count = 0
-        logger.debug("starting paginated query for user %s", username)
+        sizes: list[int] = []
+        size_key = hashlib.sha256(repr(make_key("graphql", query_string, variables)).encode("utf-8")).hexdigest()
+        max_size = page_size
+        if page_size is not None:
+            page_size = max(PAGE_SIZE_MIN, min(page_size, _page_sizes.get(size_key, page_size)))
+        logger.debug("starting paginated query %s (page size %s)", variables, page_size)
 
         while has_next_page:
-            variables = {"username": username, "cursor": cursor}
-            result = self.query(query_string, variables)
-
-            process_fn(result)
+            page_variables = {**variables, "cursor": cursor}
+            if page_size is not None:
+                page_variables["first"] = page_size
+            started = time.monotonic()
+            try:
+                result = self.query(query_string, page_variables)
+            except Exception as exc:
+                if page_size is None or page_size <= PAGE_SIZE_MIN or not _is_retryable_page_error(exc):
+                    raise
+                page_size = max_size = max(PAGE_SIZE_MIN, page_size // 2)
+                logger.warning("page of %s failed (%s), retrying with page size %d", variables, exc, page_size)
+                continue
+            elapsed = time.monotonic() - started
+
+            outcome = process_fn(result)
             page_count += 1
-
-            page_info = self._extract_page_info(result)
+            if page_size is not None:
+                sizes.append(page_size)
+                if elapsed < PAGE_FAST_SECONDS and page_size < max_size:
+                    page_size = min(max_size, page_size * 2)
+            if outcome is False:
+                logger.debug("paginated query stopped early %s: %d page(s)", variables, page_count)
+                break
+            if outcome:
+                variables = {**variables, **outcome}
+
+            page_info = _extract_page_info(result, page_info_path)
             has_next_page = page_info.get("hasNextPage", False)
             cursor = page_info.get("endCursor")
+        else:
+            logger.debug("paginated query complete %s: %d page(s)", variables, page_count)
 
-        logger.debug("paginated query complete for user %s: %d page(s)", username, page_count)
+        if sizes:
+            logger.debug("page sizes for %s: %s", variables, sizes)
+            _page_sizes.set(size_key, sizes[-1])
+            _page_sizes.save()
+        return page_count
 
-    def paginated_org_query(self, query_string: str, org: str, process_fn: Callable[[dict], None]) -> None:
-        """Execute a paginated GraphQL query over an organisation's repositories.
+    def paginated_queries(self, chains: Sequence[PageChain], max_workers: int = PAGINATION_WORKERS) -> None:
+        """Follow several independent cursor chains concurrently.
 
-        Iterates through all pages, calling *process_fn* with each page's
-        raw response until ``hasNextPage`` is false.
+        Each chain runs sequentially within itself on a bounded worker pool, so
+        total time is set by the longest chain. *process_fn* callbacks may run on
+        worker threads and must only touch state owned by their chain.
 
-        :param query_string: GraphQL query string with ``$cursor`` variable support.
-        :param org: GitHub organisation login passed as the ``$org`` variable.
-        :param process_fn: Callable invoked with each page's raw response dict.
+        :param chains: Cursor chains to run, e.g. one per repository owner.
+        :param max_workers: Maximum number of chains in flight at once.
         """
-        cursor = None
-        has_next_page = True
-        page_count = 0
-        logger.debug("starting paginated org query for org %s", org)
-
-        while has_next_page:
-            variables = {"org": org, "cursor": cursor}
-            result = self.query(query_string, variables)
-
-            process_fn(result)
-            page_count += 1
-
-            page_info = self._extract_org_page_info(result)
-            has_next_page = page_info.get("hasNextPage", False)
-            cursor = page_info.get("endCursor")
-
-        logger.debug("paginated org query complete for org %s: %d page(s)", org, page_count)
-
-    def _extract_page_info(self, result: dict) -> dict:
-        try:
-            return result["data"]["user"]["repositories"]["pageInfo"]
-        except (KeyError, TypeError):
-            return {}
-
-    def _extract_org_page_info(self, result: dict) -> dict:
-        try:
-            return result["data"]["organization"]["repositories"]["pageInfo"]
-        except (KeyError, TypeError):
-            return {}
+        if len(chains) <= 1 or max_workers <= 1:
+            for chain in chains:
+                self.paginated_query(*chain)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chains)), thread_name_prefix="page") as pool:
+            futures = [pool.submit(self.paginated_query, *chain) for chain in chains]
+            for future in futures:
+                future.result()
+
+
+def _extract_page_info(result: dict, page_info_path: Sequence[str]) -> dict:
+    try:
+        node = result["data"]
+        for key in page_info_path:
+            node = node[key]
+        return node["pageInfo"]
+    except (KeyError, TypeError):
+        return {}
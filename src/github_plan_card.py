@@ -12,7 +12,7 @@ import html
 import logging
 from pathlib import Path
 
-from src.render_template import render_template
+from src.render_template import load_template, write_card_svgs
 
 logger = logging.getLogger(__name__)
 
@@ -48,36 +48,35 @@ def _build_plan_lines_svg(entries: list[tuple[str, str]]) -> str:
     return "\n".join(lines)
 
 
-def generate_github_plan_cards(
+def render_github_plan_svgs(
     templates_dir: Path,
-    output_dir: Path,
-) -> tuple[Path, Path]:
-    """Render dark and light plan SVG cards from ``PLAN_ENTRIES``.
+) -> dict[str, str]:
+    """Render the dark and light plan SVGs from ``PLAN_ENTRIES``.
 
     :param templates_dir: Directory containing the SVG template files.
-    :param output_dir: Directory where the rendered SVG files will be written.
-    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    :return: Rendered SVGs keyed by theme (``dark`` and ``light``).
     """
     logger.info("generating plan card (%d entries)", len(PLAN_ENTRIES))
     plan_lines = _build_plan_lines_svg(PLAN_ENTRIES)
     values = {"PLAN_LINES": plan_lines}
 
-    dark_template = (templates_dir / "github_plan_card_dark.svg").read_text(encoding="utf-8")
-    light_template = (templates_dir / "github_plan_card_light.svg").read_text(encoding="utf-8")
+    return {
+        "dark": load_template(templates_dir / "github_plan_card_dark.svg").render(values),
+        "light": load_template(templates_dir / "github_plan_card_light.svg").render(values),
+    }
 
-    dark_svg = render_template(dark_template, values)
-    light_svg = render_template(light_template, values)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+def generate_github_plan_cards(
+    templates_dir: Path,
+    output_dir: Path,
+) -> tuple[Path, Path]:
+    """Render the plan card and write its dark and light SVGs into *output_dir*.
 
-    dark_out = output_dir / "github_plan_card_dark.svg"
-    light_out = output_dir / "github_plan_card_light.svg"
-    dark_out.write_text(dark_svg, encoding="utf-8")
-    light_out.write_text(light_svg, encoding="utf-8")
-    logger.info("wrote %s", dark_out)
-    logger.info("wrote %s", light_out)
+    See :func:`render_github_plan_svgs`.
 
-    return dark_out, light_out
+    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    """
+    return write_card_svgs(output_dir, "github_plan_card", render_github_plan_svgs(templates_dir=templates_dir))
 
 
 def main() -> None:
@@ -5,9 +5,10 @@ import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.config import GH_USERNAME, PR_EXCLUDE_ORGS
-from src.github_client import GitHubClient
-from src.render_template import render_template
+from src.card_bundle import fetch_bundle
+from src.config import PR_EXCLUDE_ORGS, REST_API_URL, require_username
+from src.github_client import GitHubClient, log_http_stats
+from src.render_template import load_template, write_card_svgs
 
 logger = logging.getLogger(__name__)
 
@@ -67,73 +68,115 @@ def _build_pr_lines_svg(prs: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def generate_github_pr_cards(
-    *,
-    templates_dir: Path,
-    output_dir: Path,
-    username: str,
-) -> tuple[Path, Path]:
-    client = GitHubClient()
+def _fetch_external_prs(client: GitHubClient, username: str, exclude_orgs: list[str]) -> dict:
+    """Search the user's most recently updated PRs outside their own repos and *exclude_orgs*.
 
+    :param client: Authenticated GitHub client.
+    :param username: GitHub username whose PRs are searched.
+    :param exclude_orgs: Orgs whose PRs are left out.
+    :return: Dict with ``prs``: ``repo``, ``title``, ``status``, and ISO ``updated_at`` per PR.
+    """
     # Build search query: authored PRs excluding the user's own repos and all
     # configured orgs (personal secondary orgs, work orgs, etc.).
-    excludes = " ".join([f"-user:{username}"] + [f"-org:{org}" for org in PR_EXCLUDE_ORGS])
+    excludes = " ".join([f"-user:{username}"] + [f"-org:{org}" for org in exclude_orgs])
     query = f"is:pr author:{username} {excludes}"
 
+    data = client.get_rest(
+        "/search/issues",
+        params={"q": query, "sort": "updated", "order": "desc", "per_page": 10},
+    )
     prs: list[dict] = []
-    try:
-        data = client.get_rest(
-            "/search/issues",
-            params={"q": query, "sort": "updated", "order": "desc", "per_page": 10},
+    items = data.get("items", []) if isinstance(data, dict) else []
+    # repository_url form: {GITHUB_API_URL}/repos/owner/repo (e.g. https://ghes.example.com/api/v3 on GHES)
+    repos_prefix = f"{REST_API_URL}/repos/"
+    for item in items:
+        repo = item.get("repository_url", "").removeprefix(repos_prefix)
+        pr_info = item.get("pull_request", {})
+        merged_at = pr_info.get("merged_at")
+        state = item.get("state", "closed")
+        if merged_at:
+            status = "merged"
+        elif state == "open":
+            status = "open"
+        else:
+            status = "closed"
+        prs.append(
+            {
+                "repo": repo,
+                "title": item.get("title", ""),
+                "status": status,
+                "updated_at": item.get("updated_at", ""),
+            }
         )
-        items = data.get("items", []) if isinstance(data, dict) else []
-        for item in items:
-            # repository_url form: https://api.github.com/repos/owner/repo
-            repo = item.get("repository_url", "").removeprefix("https://api.github.com/repos/")
-            pr_info = item.get("pull_request", {})
-            merged_at = pr_info.get("merged_at")
-            state = item.get("state", "closed")
-            if merged_at:
-                status = "merged"
-            elif state == "open":
-                status = "open"
-            else:
-                status = "closed"
-            raw_ts = item.get("updated_at", "")
+    return {"prs": prs}
+
+
+def render_github_pr_svgs(
+    *,
+    templates_dir: Path,
+    username: str,
+    client: GitHubClient | None = None,
+    exclude_orgs: list[str] | None = None,
+) -> dict[str, str]:
+    """Fetch recent external PRs for *username* and render the dark and light PR SVGs.
+
+    Falls back to the last saved data bundle if fetching fails or exceeds
+    ``CARD_DEADLINE_SECONDS`` (see :mod:`src.card_bundle`); with no bundle
+    either, the card shows an empty PR list.
+
+    :param templates_dir: Directory containing the SVG template files.
+    :param username: GitHub username to generate cards for.
+    :param client: Optional shared :class:`GitHubClient`; one is created if omitted.
+    :param exclude_orgs: Orgs whose PRs are left out (default ``PR_EXCLUDE_ORGS``).
+    :return: Rendered SVGs keyed by theme (``dark`` and ``light``).
+    """
+    client = client or GitHubClient()
+    exclude_orgs = PR_EXCLUDE_ORGS if exclude_orgs is None else exclude_orgs
+
+    prs: list[dict] = []
+    try:
+        bundle = fetch_bundle(username, "pr", lambda: _fetch_external_prs(client, username, exclude_orgs))
+    except Exception as exc:
+        logger.warning("failed to fetch external PRs via search: %s", exc)
+    else:
+        for pr in bundle.data["prs"]:
+            raw_ts = pr["updated_at"]
             try:
                 timestamp = datetime.fromisoformat(raw_ts.replace("Z", "+00:00"))
             except (ValueError, AttributeError):
                 timestamp = datetime.now(timezone.utc)
-            prs.append(
-                {
-                    "repo": repo,
-                    "title": item.get("title", ""),
-                    "status": status,
-                    "timestamp": timestamp,
-                }
-            )
-    except Exception as exc:
-        logger.warning("failed to fetch external PRs via search: %s", exc)
+            prs.append({**pr, "timestamp": timestamp})
 
     logger.debug("found %d external PRs", len(prs))
 
     pr_lines = _build_pr_lines_svg(prs)
     values = {"PR_LINES": pr_lines}
 
-    dark_template = (templates_dir / "github_pr_card_dark.svg").read_text(encoding="utf-8")
-    light_template = (templates_dir / "github_pr_card_light.svg").read_text(encoding="utf-8")
+    return {
+        "dark": load_template(templates_dir / "github_pr_card_dark.svg").render(values),
+        "light": load_template(templates_dir / "github_pr_card_light.svg").render(values),
+    }
 
-    dark_svg = render_template(dark_template, values)
-    light_svg = render_template(light_template, values)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+def generate_github_pr_cards(
+    *,
+    templates_dir: Path,
+    output_dir: Path,
+    username: str,
+    client: GitHubClient | None = None,
+    exclude_orgs: list[str] | None = None,
+) -> tuple[Path, Path]:
+    """Render the PR card for *username* and write its dark and light SVGs into *output_dir*.
 
-    dark_out = output_dir / "github_pr_card_dark.svg"
-    light_out = output_dir / "github_pr_card_light.svg"
-    dark_out.write_text(dark_svg, encoding="utf-8")
-    light_out.write_text(light_svg, encoding="utf-8")
+    See :func:`render_github_pr_svgs`.
 
-    return dark_out, light_out
+    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    """
+    return write_card_svgs(
+        output_dir,
+        "github_pr_card",
+        render_github_pr_svgs(templates_dir=templates_dir, username=username, client=client, exclude_orgs=exclude_orgs),
+    )
 
 
 def main() -> None:
@@ -144,8 +187,9 @@ def main() -> None:
     dark_out, light_out = generate_github_pr_cards(
         templates_dir=templates_dir,
         output_dir=output_dir,
-        username=GH_USERNAME,
+        username=require_username(),
     )
+    log_http_stats()
 
 
 if __name__ == "__main__":
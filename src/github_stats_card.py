@@ -8,40 +8,64 @@ Usage::
     uv run python -m src.github_stats_card
 """
 
+import html
 import logging
 from math import tau
 from pathlib import Path
 
-from src.config import GH_USERNAME
-from src.render_template import render_template
+from src.card_bundle import fetch_bundle
+from src.config import require_username
+from src.github_client import log_http_stats
+from src.render_template import load_template, write_card_svgs
 from src.stats import GitHubStats, calculate_rank
 
 logger = logging.getLogger(__name__)
 
 
-def generate_github_stats_cards(
+def _fetch_stats_data(stats: GitHubStats) -> dict:
+    """Fetch the counts shown on the stats card.
+
+    :param stats: :class:`GitHubStats` for the card's user.
+    :return: Dict with ``display_name``, ``stars``, ``commits``, ``prs``, ``issues``, ``reviews``, and ``followers``.
+    """
+    profile = stats.get_profile_counts()
+    return {
+        "display_name": profile["display_name"],
+        "stars": stats.get_total_stars(),
+        "commits": stats.get_commits_all_time(),
+        "prs": profile["prs"],
+        "issues": profile["issues"],
+        "reviews": profile["reviews"],
+        "followers": profile["followers"],
+    }
+
+
+def render_github_stats_svgs(
     *,
     templates_dir: Path,
-    output_dir: Path,
     username: str,
-) -> tuple[Path, Path]:
-    """Fetch stats for *username* and render dark and light stats SVG cards.
+    stats: GitHubStats | None = None,
+) -> dict[str, str]:
+    """Fetch stats for *username* and render the dark and light stats SVGs.
+
+    Falls back to the last saved data bundle if fetching fails or exceeds
+    ``CARD_DEADLINE_SECONDS`` (see :mod:`src.card_bundle`).
 
     :param templates_dir: Directory containing the SVG template files.
-    :param output_dir: Directory where the rendered SVG files will be written.
     :param username: GitHub username to generate cards for.
-    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    :param stats: Optional shared :class:`GitHubStats` for *username*; one is created if omitted.
+    :return: Rendered SVGs keyed by theme (``dark`` and ``light``).
     """
     logger.info("generating stats card for %s", username)
-    stats = GitHubStats(username)
+    stats = stats or GitHubStats(username)
 
-    display_name = stats.get_display_name()
-    total_stars = stats.get_total_stars()
-    commits_all_time = stats.get_commits_all_time()
-    total_prs = stats.get_total_pull_requests_created()
-    total_issues = stats.get_total_issues_created()
-    followers = stats.get_followers_count()
-    reviews = stats.get_total_reviews_created()
+    data = fetch_bundle(username, "stats", lambda: _fetch_stats_data(stats)).data
+    total_stars = data["stars"]
+    commits_all_time = data["commits"]
+    total_prs = data["prs"]
+    total_issues = data["issues"]
+    reviews = data["reviews"]
+    followers = data["followers"]
 
     level, percentile = calculate_rank(
         all_commits=True,
@@ -68,7 +92,7 @@ def generate_github_stats_cards(
     rank_dashoffset = circumference * (percentile / 100)
 
     values: dict[str, str] = {
-        "DISPLAY_NAME": display_name,
+        "DISPLAY_NAME": html.escape(data["display_name"]),
         "RANK": level,
         "RANK_DASHOFFSET": f"{rank_dashoffset:.3f}",
         "TOTAL_STARS": str(total_stars),
@@ -78,22 +102,30 @@ def generate_github_stats_cards(
         "TOTAL_ISSUES": str(total_issues),
     }
 
-    dark_template = (templates_dir / "github_stats_card_dark.svg").read_text(encoding="utf-8")
-    light_template = (templates_dir / "github_stats_card_light.svg").read_text(encoding="utf-8")
+    return {
+        "dark": load_template(templates_dir / "github_stats_card_dark.svg").render(values),
+        "light": load_template(templates_dir / "github_stats_card_light.svg").render(values),
+    }
 
-    dark_svg = render_template(dark_template, values)
-    light_svg = render_template(light_template, values)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+def generate_github_stats_cards(
+    *,
+    templates_dir: Path,
+    output_dir: Path,
+    username: str,
+    stats: GitHubStats | None = None,
+) -> tuple[Path, Path]:
+    """Render the stats card for *username* and write its dark and light SVGs into *output_dir*.
 
-    dark_out = output_dir / "github_stats_card_dark.svg"
-    light_out = output_dir / "github_stats_card_light.svg"
-    dark_out.write_text(dark_svg, encoding="utf-8")
-    light_out.write_text(light_svg, encoding="utf-8")
-    logger.info("wrote %s", dark_out)
-    logger.info("wrote %s", light_out)
+    See :func:`render_github_stats_svgs`.
 
-    return dark_out, light_out
+    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    """
+    return write_card_svgs(
+        output_dir,
+        "github_stats_card",
+        render_github_stats_svgs(templates_dir=templates_dir, username=username, stats=stats),
+    )
 
 
 def main() -> None:
@@ -104,8 +136,9 @@ def main() -> None:
     generate_github_stats_cards(
         templates_dir=templates_dir,
         output_dir=output_dir,
-        username=GH_USERNAME,
+        username=require_username(),
     )
+    log_http_stats()
 
 
 if __name__ == "__main__":
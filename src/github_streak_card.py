@@ -11,30 +11,45 @@ Usage::
 import logging
 from pathlib import Path
 
-from src.config import GH_USERNAME
-from src.render_template import render_template
+from src.card_bundle import fetch_bundle
+from src.config import require_username
+from src.github_client import log_http_stats
+from src.render_template import load_template, write_card_svgs
 from src.stats import GitHubStats
 
 logger = logging.getLogger(__name__)
 
 
-def generate_github_streak_cards(
+def _fetch_streak_data(stats: GitHubStats) -> dict:
+    """Fetch the streak stats and first contribution date shown on the streak card.
+
+    :param stats: :class:`GitHubStats` for the card's user.
+    :return: Dict with ``streak`` (from :meth:`GitHubStats.get_streak_stats`) and ``first_contribution``.
+    """
+    return {"streak": stats.get_streak_stats(), "first_contribution": list(stats.get_first_contribution_date())}
+
+
+def render_github_streak_svgs(
     *,
     templates_dir: Path,
-    output_dir: Path,
     username: str,
-) -> tuple[Path, Path]:
-    """Fetch streak stats for *username* and render dark and light streak SVG cards.
+    stats: GitHubStats | None = None,
+) -> dict[str, str]:
+    """Fetch streak stats for *username* and render the dark and light streak SVGs.
+
+    Falls back to the last saved data bundle if fetching fails or exceeds
+    ``CARD_DEADLINE_SECONDS`` (see :mod:`src.card_bundle`).
 
     :param templates_dir: Directory containing the SVG template files.
-    :param output_dir: Directory where the rendered SVG files will be written.
     :param username: GitHub username to generate cards for.
-    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    :param stats: Optional shared :class:`GitHubStats` for *username*; one is created if omitted.
+    :return: Rendered SVGs keyed by theme (``dark`` and ``light``).
     """
     logger.info("generating streak card for %s", username)
-    stats = GitHubStats(username)
-    streak = stats.get_streak_stats()
-    first_year, first_full = stats.get_first_contribution_date()
+    stats = stats or GitHubStats(username)
+    data = fetch_bundle(username, "streak", lambda: _fetch_streak_data(stats)).data
+    streak = data["streak"]
+    first_year, first_full = data["first_contribution"]
     logger.info(
         "streak: current=%d (%s), longest=%d (%s)",
         streak["current_streak"],
@@ -52,22 +67,30 @@ def generate_github_streak_cards(
         "LONGEST_STREAK_RANGE": streak["longest_range"],
     }
 
-    dark_template = (templates_dir / "github_streak_card_dark.svg").read_text(encoding="utf-8")
-    light_template = (templates_dir / "github_streak_card_light.svg").read_text(encoding="utf-8")
+    return {
+        "dark": load_template(templates_dir / "github_streak_card_dark.svg").render(values),
+        "light": load_template(templates_dir / "github_streak_card_light.svg").render(values),
+    }
 
-    dark_svg = render_template(dark_template, values)
-    light_svg = render_template(light_template, values)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+def generate_github_streak_cards(
+    *,
+    templates_dir: Path,
+    output_dir: Path,
+    username: str,
+    stats: GitHubStats | None = None,
+) -> tuple[Path, Path]:
+    """Render the streak card for *username* and write its dark and light SVGs into *output_dir*.
 
-    dark_out = output_dir / "github_streak_card_dark.svg"
-    light_out = output_dir / "github_streak_card_light.svg"
-    dark_out.write_text(dark_svg, encoding="utf-8")
-    light_out.write_text(light_svg, encoding="utf-8")
-    logger.info("wrote %s", dark_out)
-    logger.info("wrote %s", light_out)
+    See :func:`render_github_streak_svgs`.
 
-    return dark_out, light_out
+    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    """
+    return write_card_svgs(
+        output_dir,
+        "github_streak_card",
+        render_github_streak_svgs(templates_dir=templates_dir, username=username, stats=stats),
+    )
 
 
 def main() -> None:
@@ -78,8 +101,9 @@ def main() -> None:
     generate_github_streak_cards(
         templates_dir=templates_dir,
         output_dir=output_dir,
-        username=GH_USERNAME,
+        username=require_username(),
     )
+    log_http_stats()
 
 
 if __name__ == "__main__":
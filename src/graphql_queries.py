@@ -2,14 +2,34 @@
 
 Each constant is a parameterised GraphQL query used by
 :class:`~src.github_client.GitHubClient` to fetch profile statistics.
+The ``build_*`` functions assemble batched documents whose fields are
+aliased so several lookups can share a single request.
 """
 
-TOTAL_STARS_QUERY = """
-query($username: String!, $cursor: String) {
+from collections.abc import Sequence
+
+USER_REPOSITORY_INVENTORY_QUERY = """
+query($username: String!, $cursor: String, $first: Int = 100, $withLanguages: Boolean = true) {
   user(login: $username) {
-    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
+    repositories(
+      first: $first
+      after: $cursor
+      ownerAffiliations: OWNER
+      orderBy: {field: PUSHED_AT, direction: DESC}
+    ) {
       nodes {
+        nameWithOwner
+        pushedAt
         stargazerCount
+        isFork
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) @include(if: $withLanguages) {
+          edges {
+            size
+            node {
+              name
+            }
+          }
+        }
       }
       pageInfo {
         hasNextPage
@@ -20,25 +40,21 @@ query($username: String!, $cursor: String) {
 }
 """
 
-USER_CONTRIBUTIONS_QUERY = """
-query($username: String!, $from: DateTime!, $to: DateTime!) {
-  user(login: $username) {
-    contributionsCollection(from: $from, to: $to) {
-      totalCommitContributions
-      totalIssueContributions
-      totalPullRequestContributions
-      totalPullRequestReviewContributions
-    }
-  }
-}
-"""
-
-USER_LANGUAGES_QUERY = """
-query($username: String!, $cursor: String) {
-  user(login: $username) {
-    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, isFork: false) {
+ORG_REPOSITORY_INVENTORY_QUERY = """
+query($org: String!, $cursor: String, $first: Int = 100, $withLanguages: Boolean = true) {
+  organization(login: $org) {
+    repositories(
+      first: $first
+      after: $cursor
+      ownerAffiliations: OWNER
+      orderBy: {field: PUSHED_AT, direction: DESC}
+    ) {
       nodes {
-        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+        nameWithOwner
+        pushedAt
+        stargazerCount
+        isFork
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) @include(if: $withLanguages) {
           edges {
             size
             node {
@@ -56,6 +72,25 @@ query($username: String!, $cursor: String) {
 }
 """
 
+# Paths under ``data`` to the paginated connections of the inventory queries.
+# Both queries order repositories by ``pushedAt`` (newest first), take their page
+# size from ``$first``, and skip the ``languages`` selection when ``$withLanguages`` is false.
+USER_REPOSITORIES_PATH = ("user", "repositories")
+ORG_REPOSITORIES_PATH = ("organization", "repositories")
+
+USER_CONTRIBUTIONS_QUERY = """
+query($username: String!, $from: DateTime!, $to: DateTime!) {
+  user(login: $username) {
+    contributionsCollection(from: $from, to: $to) {
+      totalCommitContributions
+      totalIssueContributions
+      totalPullRequestContributions
+      totalPullRequestReviewContributions
+    }
+  }
+}
+"""
+
 FOLLOWERS_COUNT_QUERY = """
 query($username: String!) {
   user(login: $username) {
@@ -141,41 +176,132 @@ query($query: String!) {
 }
 """
 
-ORG_STARS_QUERY = """
-query($org: String!, $cursor: String) {
-  organization(login: $org) {
-    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
-      nodes {
-        stargazerCount
-      }
-      pageInfo {
-        hasNextPage
-        endCursor
-      }
-    }
-  }
-}
+
+def build_profile_counts_query(search_aliases: Sequence[str]) -> str:
+    """Build one query returning the profile, follower count, and aliased search counts.
+
+    Each alias in *search_aliases* becomes a ``$<alias>Query: String!`` variable
+    and a ``<alias>: search(type: ISSUE, ...) { issueCount }`` field.
+
+    :param search_aliases: GraphQL-safe alias names, e.g. ``["issues", "prs"]``.
+    :return: GraphQL query string taking ``$username`` plus one variable per alias.
+    """
+    variable_defs = "".join(f", ${alias}Query: String!" for alias in search_aliases)
+    search_fields = "".join(
+        f"""
+  {alias}: search(type: ISSUE, query: ${alias}Query) {{
+    issueCount
+  }}"""
+        for alias in search_aliases
+    )
+    return f"""
+query($username: String!{variable_defs}) {{
+  user(login: $username) {{
+    name
+    login
+    followers {{
+      totalCount
+    }}
+  }}{search_fields}
+}}
 """
 
-ORG_LANGUAGES_QUERY = """
-query($org: String!, $cursor: String) {
-  organization(login: $org) {
-    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, isFork: false) {
-      nodes {
-        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
-          edges {
-            size
-            node {
-              name
-            }
-          }
-        }
-      }
-      pageInfo {
-        hasNextPage
-        endCursor
-      }
-    }
-  }
-}
+
+# Aliased contributionsCollection blocks per batched request; GitHub evaluates each
+# block as its own connection, so large accounts are split to stay under node limits.
+YEARS_PER_CONTRIBUTIONS_QUERY = 8
+
+
+def build_yearly_contributions_query(years: Sequence[int]) -> str:
+    """Build one query returning calendar totals and per-type counts for each year.
+
+    Each year becomes a ``y<year>: contributionsCollection(from: $from<year>, to: $to<year>)``
+    field selecting the calendar total and the commit, issue, PR, and review counts
+    from :data:`USER_CONTRIBUTIONS_QUERY`.
+
+    :param years: Contribution years to include, e.g. ``[2023, 2024]``.
+    :return: GraphQL query string taking ``$username`` plus ``$from<year>``/``$to<year>`` variables.
+    """
+    variable_defs = "".join(f", $from{year}: DateTime!, $to{year}: DateTime!" for year in years)
+    year_fields = "".join(
+        f"""
+    y{year}: contributionsCollection(from: $from{year}, to: $to{year}) {{
+      contributionCalendar {{
+        totalContributions
+      }}
+      totalCommitContributions
+      totalIssueContributions
+      totalPullRequestContributions
+      totalPullRequestReviewContributions
+    }}"""
+        for year in years
+    )
+    return f"""
+query($username: String!{variable_defs}) {{
+  user(login: $username) {{{year_fields}
+  }}
+}}
+"""
+
+
+def build_commit_headlines_query(count: int) -> str:
+    """Build one query resolving the headline of *count* commits, one aliased field each.
+
+    Entry ``i`` becomes ``c<i>: repository(owner: $owner<i>, name: $name<i>)`` with an
+    ``object(oid: $oid<i>)`` selection on ``Commit``.
+
+    :param count: Number of commits to resolve.
+    :return: GraphQL query string taking ``$owner<i>``, ``$name<i>``, and ``$oid<i>`` variables.
+    """
+    variable_defs = ", ".join(f"$owner{i}: String!, $name{i}: String!, $oid{i}: GitObjectID!" for i in range(count))
+    commit_fields = "".join(
+        f"""
+  c{i}: repository(owner: $owner{i}, name: $name{i}) {{
+    object(oid: $oid{i}) {{
+      ... on Commit {{
+        messageHeadline
+      }}
+    }}
+  }}"""
+        for i in range(count)
+    )
+    return f"""
+query({variable_defs}) {{{commit_fields}
+}}
+"""
+
+
+# Repositories resolved per language lookup query (see ``build_repository_languages_query``).
+REPOSITORIES_PER_LANGUAGES_QUERY = 50
+
+
+def build_repository_languages_query(count: int) -> str:
+    """Build one query fetching the languages of *count* repositories, one aliased field each.
+
+    Entry ``i`` becomes ``r<i>: repository(owner: $owner<i>, name: $name<i>)``.
+
+    :param count: Number of repositories to look up.
+    :return: GraphQL query string taking ``$owner<i>`` and ``$name<i>`` variables.
+    """
+    variable_defs = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(count))
+    repository_fields = "".join(
+        f"""
+  r{i}: repository(owner: $owner{i}, name: $name{i}) {{
+    nameWithOwner
+    pushedAt
+    isFork
+    languages(first: 10, orderBy: {{field: SIZE, direction: DESC}}) {{
+      edges {{
+        size
+        node {{
+          name
+        }}
+      }}
+    }}
+  }}"""
+        for i in range(count)
+    )
+    return f"""
+query({variable_defs}) {{{repository_fields}
+}}
 """
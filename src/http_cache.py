@@ -0,0 +1,168 @@
+"""Persistent, size-bounded HTTP cache for conditional REST requests.
+
+Stores the ``ETag``, ``Last-Modified``, and raw body of GitHub REST responses
+on disk so later runs can revalidate with ``If-None-Match`` /
+``If-Modified-Since`` and serve ``304 Not Modified`` replies from disk
+(conditional requests that return 304 do not count against the rate limit).
+Entries marked immutable, such as commits looked up by full SHA, are served
+without revalidation.
+
+Each entry is one file named by the SHA-256 of its key: a JSON metadata line
+followed by the raw response body. Least-recently-used entries are evicted
+once the directory exceeds ``max_bytes``.
+
+Usage::
+
+    from src.http_cache import HTTPCache
+
+    cache = HTTPCache(CACHE_DIR / "http", max_bytes=50 * 1024 * 1024)
+    entry = cache.get(key)
+    headers = entry.conditional_headers() if entry else {}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body with its validators."""
+
+    etag: str | None
+    last_modified: str | None
+    immutable: bool
+    body: bytes
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return ``If-None-Match`` / ``If-Modified-Since`` headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """On-disk LRU cache of response bodies keyed by request."""
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: dict[str, tuple[int, float]] | None = None
+        self.hits = 0
+        self.revalidated = 0
+        self.refreshed = 0
+        self.misses = 0
+
+    @staticmethod
+    def _name(key: object) -> str:
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+    def _load_index(self) -> dict[str, tuple[int, float]]:
+        if self._index is None:
+            self._index = {}
+            if self.directory.is_dir():
+                for path in self.directory.glob("*.entry"):
+                    stat = path.stat()
+                    self._index[path.stem] = (stat.st_size, stat.st_mtime)
+        return self._index
+
+    def get(self, key: object) -> CacheEntry | None:
+        """Return the cached entry for *key*, or ``None``, marking it recently used."""
+        name = self._name(key)
+        path = self.directory / f"{name}.entry"
+        with self._lock:
+            index = self._load_index()
+            if name not in index:
+                self.misses += 1
+                return None
+            try:
+                raw = path.read_bytes()
+                now = time.time()
+                os.utime(path, (now, now))
+            except OSError:
+                index.pop(name, None)
+                self.misses += 1
+                return None
+            index[name] = (index[name][0], now)
+
+        meta_line, _, body = raw.partition(b"\n")
+        try:
+            meta = json.loads(meta_line)
+            if not isinstance(meta, dict):
+                raise ValueError("entry metadata is not an object")
+        except ValueError:
+            logger.debug("discarding corrupt http cache entry %s", name)
+            with self._lock:
+                self.misses += 1
+                index.pop(name, None)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return CacheEntry(meta.get("etag"), meta.get("last_modified"), bool(meta.get("immutable")), body)
+
+    def put(self, key: object, *, etag: str | None, last_modified: str | None, immutable: bool, body: bytes) -> None:
+        """Store a response body and its validators under *key*, evicting LRU entries if needed."""
+        name = self._name(key)
+        meta = json.dumps({"etag": etag, "last_modified": last_modified, "immutable": immutable}).encode("utf-8")
+        data = meta + b"\n" + body
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{name}.entry"
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        with self._lock:
+            index = self._load_index()
+            index[name] = (len(data), time.time())
+            self._evict(index)
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup *outcome*: ``"hit"`` (served without a request), ``"revalidated"`` (304),
+        or ``"refreshed"`` (an entry existed but the server sent a new body).
+        """
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidated":
+                self.revalidated += 1
+            elif outcome == "refreshed":
+                self.refreshed += 1
+
+    def _evict(self, index: dict[str, tuple[int, float]]) -> None:
+        total = sum(size for size, _ in index.values())
+        if total <= self.max_bytes:
+            return
+        for name, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            try:
+                (self.directory / f"{name}.entry").unlink()
+            except OSError:
+                pass
+            del index[name]
+            total -= size
+            logger.debug("evicted http cache entry %s (%d bytes)", name, size)
+
+    def stats(self) -> dict[str, int]:
+        """Return ``hits``, ``revalidated``, ``refreshed``, ``misses``, ``entries``, and ``bytes`` counters."""
+        with self._lock:
+            index = self._load_index()
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "refreshed": self.refreshed,
+                "misses": self.misses,
+                "entries": len(index),
+                "bytes": sum(size for size, _ in index.values()),
+            }
@@ -0,0 +1,89 @@
+"""Small persistent JSON key-value store.
+
+Backs the on-disk caches that only need a flat mapping (commit messages,
+search counts, language stats, card bundles). The whole file is loaded on
+first access and written back atomically by :meth:`JsonStore.save` when
+anything changed. Access is guarded by a lock so worker threads can share
+one store. With ``max_entries``, the least recently written keys are
+dropped once the store grows past that size.
+
+Usage::
+
+    from src.json_store import JsonStore
+
+    store = JsonStore(CACHE_DIR / "commit_messages.json")
+    store.set("octocat/hello@abc123", "Initial commit")
+    store.save()
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class JsonStore:
+    """Thread-safe dict persisted as a single JSON file."""
+
+    def __init__(self, path: Path, max_entries: int | None = None) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            try:
+                self._data = json.loads(self.path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, ValueError) as exc:
+                logger.warning("ignoring unreadable store %s: %s", self.path, exc)
+                self._data = {}
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored under *key*, or *default*."""
+        with self._lock:
+            return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store *value* (JSON-serialisable) under *key*."""
+        with self._lock:
+            data = self._load()
+            if self.max_entries is not None:
+                # Re-insert so write order is kept; the oldest writes are dropped first.
+                data.pop(key, None)
+            data[key] = value
+            if self.max_entries is not None and len(data) > self.max_entries:
+                for oldest in list(data)[: len(data) - self.max_entries]:
+                    del data[oldest]
+            self._dirty = True
+
+    def delete(self, key: str) -> None:
+        """Remove *key* if present."""
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._dirty = True
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Return a snapshot of all ``(key, value)`` pairs."""
+        with self._lock:
+            return list(self._load().items())
+
+    def save(self) -> None:
+        """Atomically write the store to disk if it changed since loading."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{threading.get_ident()}.tmp")
+            # Bounded stores keep write order on disk so eviction survives a reload.
+            tmp.write_text(json.dumps(self._data, sort_keys=self.max_entries is None), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
@@ -0,0 +1,140 @@
+"""In-memory TTL memoization with single-flight request coalescing.
+
+Used by :class:`~src.github_client.GitHubClient` so that identical GraphQL
+queries and REST calls made by different generators in one process share a
+single HTTP round trip. Concurrent callers asking for a key that is already
+being fetched wait for that fetch instead of starting their own.
+
+Cached values are shared between callers and must be treated as read-only.
+Expired entries are dropped when looked up and swept at most once per TTL;
+with ``max_entries`` the least recently used entries are evicted first.
+
+Usage::
+
+    from src.query_cache import QueryCache, make_key
+
+    cache = QueryCache(ttl=300)
+    result = cache.get_or_fetch(make_key(query, variables), lambda: fetch(query, variables))
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(kind: str, text: str, params: dict | None = None) -> tuple[str, str, str]:
+    """Build a normalized cache key from a query or path and its variables.
+
+    Whitespace in *text* is collapsed and *params* are serialised with sorted
+    keys, so formatting differences do not defeat the cache.
+
+    :param kind: Request kind, e.g. ``"graphql"`` or ``"rest"``.
+    :param text: GraphQL query string or REST path.
+    :param params: Variables or query parameters.
+    :return: Hashable key tuple.
+    """
+    return kind, " ".join(text.split()), json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class QueryCache:
+    """Thread-safe TTL cache that coalesces concurrent fetches of the same key."""
+
+    def __init__(self, ttl: float, max_entries: int | None = None) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, Future] = {}
+        self._swept_at = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evicted = 0
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for *key*, calling *fetch* at most once per TTL window.
+
+        Exceptions raised by *fetch* are propagated to every waiting caller and
+        are not cached.
+
+        :param key: Key from :func:`make_key`.
+        :param fetch: Zero-argument callable performing the real request.
+        :return: Cached or freshly fetched value.
+        """
+        if self.ttl <= 0:
+            with self._lock:
+                self.misses += 1
+            return fetch()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+            pending = self._inflight.get(key)
+            if pending is None:
+                self.misses += 1
+                pending = self._inflight[key] = Future()
+                owner = True
+            else:
+                self.coalesced += 1
+                owner = False
+        if not owner:
+            return pending.result()
+
+        try:
+            value = fetch()
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._store(key, value)
+            self._inflight.pop(key, None)
+        pending.set_result(value)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Insert *value* under *key*, sweeping expired entries and evicting past ``max_entries``.
+
+        Must be called with ``_lock`` held.
+        """
+        now = time.monotonic()
+        if now - self._swept_at >= self.ttl:
+            expired = [k for k, (expires, _) in self._entries.items() if expires <= now]
+            for k in expired:
+                del self._entries[k]
+            self._swept_at = now
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry (in-flight fetches are unaffected)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return ``hits``, ``misses``, ``coalesced``, ``evicted``, and current ``entries`` counts."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evicted": self.evicted,
+                "entries": len(self._entries),
+            }
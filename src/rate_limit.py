@@ -0,0 +1,213 @@
+"""Rate-limit-aware request pacing for the GitHub APIs.
+
+GitHub meters three independent budgets: ``core`` (REST), ``search`` (REST
+search, about 30 requests per minute), and ``graphql`` (points per hour).
+:class:`RateLimitScheduler` keeps one token bucket per budget and, before
+every request, re-tunes the bucket from the latest ``X-RateLimit-*`` headers
+so the remaining budget is spread evenly over the time left until the reset.
+The burst is capped at the remaining budget, and the budget is spread over at
+least ``MIN_PACING_WINDOW`` seconds, so a reset that is seconds away cannot
+release a flood of requests. It also computes jittered backoff delays for
+rate-limited (403/429) responses.
+
+Usage::
+
+    from src.rate_limit import RateLimitScheduler
+
+    scheduler = RateLimitScheduler()
+    scheduler.acquire("search")
+    response = session.get(url)
+    scheduler.observe("search", response.headers)
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Per-bucket defaults before any response headers are seen: (requests per hour, burst size).
+DEFAULT_BUDGETS: dict[str, tuple[int, int]] = {
+    "core": (5000, 100),
+    "search": (30 * 60, 30),
+    "graphql": (5000, 100),
+}
+
+# Upper bound for a single backoff sleep; longer waits raise instead of stalling the run.
+MAX_WAIT_SECONDS = 900.0
+
+# Shortest window the remaining budget is spread over, however close the reset is.
+MIN_PACING_WINDOW = 60.0
+
+
+def bucket_for(kind: str, path: str = "") -> str:
+    """Return the rate-limit bucket a request is billed against.
+
+    :param kind: ``"graphql"`` or ``"rest"``.
+    :param path: REST path, used to detect ``/search/`` endpoints.
+    :return: ``"graphql"``, ``"search"``, or ``"core"``.
+    """
+    if kind == "graphql":
+        return "graphql"
+    return "search" if path.startswith("/search/") else "core"
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate can be re-tuned at runtime."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take *tokens* from the bucket and return how long the caller must wait first.
+
+        :param tokens: Number of tokens to consume.
+        :return: Seconds to sleep before sending (``0.0`` when tokens were available).
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate if self.rate > 0 else MAX_WAIT_SECONDS
+
+    def retune(self, rate: float, capacity: float) -> None:
+        """Switch to a new refill *rate* and *capacity*, keeping the tokens accrued so far (up to *capacity*)."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate
+            self.capacity = capacity
+            self._tokens = min(self._tokens, capacity)
+
+
+class RateLimitScheduler:
+    """Paces requests per GitHub rate-limit bucket and computes retry backoff."""
+
+    def __init__(
+        self,
+        budgets: Mapping[str, tuple[int, int]] = DEFAULT_BUDGETS,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._budgets = dict(budgets)
+        # Buckets time refills on the monotonic clock unless a clock is injected (e.g. by tests).
+        bucket_clock = time.monotonic if clock is time.time else clock
+        self.buckets = {
+            name: TokenBucket(per_hour / 3600, burst, clock=bucket_clock) for name, (per_hour, burst) in budgets.items()
+        }
+        self.remaining: dict[str, int] = {}
+        self.reset_at: dict[str, float] = {}
+        self.throttled_seconds = 0.0
+        self.retries = 0
+
+    def acquire(self, bucket: str) -> None:
+        """Block until a request may be sent against *bucket*.
+
+        The bucket is first re-tuned for the time left in the current window
+        (see :meth:`_retune`). Waits for the token bucket and, when the last
+        response reported an exhausted budget, until that budget's reset time.
+        """
+        with self._lock:
+            self._retune(bucket)
+        wait = self.buckets[bucket].reserve()
+        with self._lock:
+            if self.remaining.get(bucket, 1) <= 0:
+                wait = max(wait, self.reset_at.get(bucket, 0) - self._clock() + 1)
+        if wait > 0:
+            if wait > MAX_WAIT_SECONDS:
+                raise RuntimeError(f"GitHub {bucket} rate limit exhausted for {wait:.0f}s")
+            logger.debug("throttling %s request for %.2fs", bucket, wait)
+            with self._lock:
+                self.throttled_seconds += wait
+            self._sleep(wait)
+
+    def observe(self, bucket: str, headers: Mapping[str, str]) -> None:
+        """Update *bucket*'s budget from a response's ``X-RateLimit-*`` headers.
+
+        The budget is re-read before every request (see :meth:`acquire`).
+        ``X-RateLimit-Resource`` overrides *bucket* when present.
+        """
+        bucket = headers.get("X-RateLimit-Resource", bucket)
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None or bucket not in self.buckets:
+            return
+        self.observe_budget(bucket, int(remaining), float(reset))
+
+    def observe_budget(self, bucket: str, remaining: int, reset_at: float) -> None:
+        """Record *remaining* requests (or points) for *bucket* until the epoch time *reset_at*."""
+        with self._lock:
+            self.remaining[bucket] = remaining
+            self.reset_at[bucket] = reset_at
+            self._retune(bucket)
+
+    def _retune(self, bucket: str) -> None:
+        """Set *bucket*'s refill rate and burst from its latest budget and the time left until reset.
+
+        Without a live budget (none reported yet, already reset, or exhausted, in
+        which case :meth:`acquire` waits for the reset) the default budget applies.
+        Must be called with ``_lock`` held.
+        """
+        per_hour, burst = self._budgets[bucket]
+        remaining = self.remaining.get(bucket)
+        seconds_left = self.reset_at.get(bucket, 0) - self._clock()
+        if remaining is None or remaining <= 0 or seconds_left <= 0:
+            self.buckets[bucket].retune(per_hour / 3600, burst)
+            return
+        # GitHub budgets reset at most hourly; clamp so a bogus reset time cannot stall pacing.
+        window = min(3600.0, max(MIN_PACING_WINDOW, seconds_left))
+        self.buckets[bucket].retune(remaining / window, min(burst, remaining))
+
+    def backoff(self, bucket: str, attempt: int, headers: Mapping[str, str]) -> float:
+        """Return the delay before retrying a rate-limited request.
+
+        Honours ``Retry-After``; otherwise waits for the bucket reset when the
+        budget is exhausted, and falls back to capped exponential backoff with
+        full jitter (for secondary limits).
+
+        :param bucket: Bucket the request was billed against.
+        :param attempt: Zero-based retry attempt number.
+        :param headers: Headers of the rate-limited response.
+        :return: Seconds to sleep before the next attempt.
+        """
+        self.observe(bucket, headers)
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+        elif self.remaining.get(bucket, 1) <= 0:
+            delay = self.reset_at.get(bucket, 0) - self._clock() + 1
+        else:
+            delay = random.uniform(1.0, min(60.0, 2.0 ** (attempt + 1)))
+        return max(1.0, delay) + random.uniform(0, 1.0)
+
+    def wait(self, delay: float) -> None:
+        """Sleep for a backoff *delay* computed by :meth:`backoff`, raising if it is too long."""
+        if delay > MAX_WAIT_SECONDS:
+            raise RuntimeError(f"GitHub rate limit backoff of {delay:.0f}s exceeds {MAX_WAIT_SECONDS:.0f}s")
+        with self._lock:
+            self.retries += 1
+            self.throttled_seconds += delay
+        self._sleep(delay)
+
+    def stats(self) -> dict:
+        """Return per-bucket ``remaining`` budgets plus ``retries`` and ``throttled_seconds`` totals."""
+        with self._lock:
+            return {
+                "remaining": dict(self.remaining),
+                "retries": self.retries,
+                "throttled_seconds": round(self.throttled_seconds, 2),
+            }
@@ -1,12 +1,105 @@
-"""Simple ``{{PLACEHOLDER}}`` template renderer for SVG files.
+"""Compiled ``{{PLACEHOLDER}}`` template renderer for SVG files.
+
+Templates are parsed once into a list of literal and placeholder segments
+and rendered with a single ``str.join``. :func:`load_template` caches the
+compiled template by path and modification time, so each template file is
+read and parsed once per process.
 
 Usage::
 
-    from src.render_template import render_template
+    from src.render_template import load_template, render_template
 
+    svg = load_template(templates_dir / "badge.svg").render({"label": "github"})
     svg = render_template(template_str, {"NAME": "octocat"})
+    write_card_svgs(output_dir, "github_stats_card", {"dark": dark_svg, "light": light_svg})
 """
 
+import logging
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
+
+_file_cache: dict[Path, tuple[int, "CompiledTemplate"]] = {}
+_file_cache_lock = threading.Lock()
+
+
+class CompiledTemplate:
+    """A template pre-split into literal text and placeholder keys."""
+
+    def __init__(self, template: str, name: str = "<string>") -> None:
+        self.name = name
+        # Even indexes hold literal text, odd indexes hold placeholder keys.
+        self.segments: list[str] = _PLACEHOLDER.split(template)
+        self.keys: frozenset[str] = frozenset(self.segments[1::2])
+
+    def missing_keys(self, values: dict[str, str]) -> set[str]:
+        """Return placeholder keys in the template that *values* does not provide."""
+        return set(self.keys.difference(values))
+
+    def unused_keys(self, values: dict[str, str]) -> set[str]:
+        """Return keys in *values* that do not appear in the template."""
+        return set(values).difference(self.keys)
+
+    def render(self, values: dict[str, str]) -> str:
+        """Substitute *values* into the template in one pass.
+
+        Placeholders without a value are left as ``{{KEY}}`` and reported at
+        ``WARNING``; unused values are reported at ``DEBUG``.
+
+        :param values: Mapping of placeholder key to replacement string.
+        :return: Rendered template.
+        """
+        parts = self.segments.copy()
+        missing = []
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            value = values.get(key)
+            if value is None:
+                missing.append(key)
+                parts[i] = f"{{{{{key}}}}}"
+            else:
+                parts[i] = value
+        if missing:
+            logger.warning("template %s: no value for %s", self.name, ", ".join(sorted(set(missing))))
+        if logger.isEnabledFor(logging.DEBUG):
+            unused = self.unused_keys(values)
+            if unused:
+                logger.debug("template %s: unused values %s", self.name, ", ".join(sorted(unused)))
+        return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str) -> CompiledTemplate:
+    """Compile *template*, memoized by its text.
+
+    :param template: Template string containing ``{{KEY}}`` placeholders.
+    :return: Compiled template.
+    """
+    return CompiledTemplate(template)
+
+
+def load_template(path: Path) -> CompiledTemplate:
+    """Read and compile the template at *path*, cached by path and modification time.
+
+    :param path: Template file path.
+    :return: Compiled template; re-read only when the file's mtime changes.
+    """
+    mtime = path.stat().st_mtime_ns
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    compiled = CompiledTemplate(path.read_text(encoding="utf-8"), name=path.name)
+    with _file_cache_lock:
+        _file_cache[path] = (mtime, compiled)
+    logger.debug("compiled template %s (%d placeholders)", path.name, len(compiled.keys))
+    return compiled
+
 
 def render_template(template: str, values: dict[str, str]) -> str:
     """Replace ``{{KEY}}`` placeholders in *template* with values from *values*.
@@ -15,7 +108,22 @@ def render_template(template: str, values: dict[str, str]) -> str:
     :param values: Mapping of placeholder key to replacement string.
     :return: Rendered template with all matching placeholders substituted.
     """
-    rendered = template
-    for key, value in values.items():
-        rendered = rendered.replace(f"{{{{{key}}}}}", value)
-    return rendered
+    return compile_template(template).render(values)
+
+
+def write_card_svgs(output_dir: Path, name: str, svgs: dict[str, str]) -> tuple[Path, Path]:
+    """Write a card's rendered themes to ``<name>_dark.svg`` and ``<name>_light.svg``.
+
+    :param output_dir: Directory where the SVG files will be written.
+    :param name: Card file stem, e.g. ``github_stats_card``.
+    :param svgs: Rendered SVGs keyed by theme (``dark`` and ``light``).
+    :return: Tuple of ``(dark_svg_path, light_svg_path)``.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    dark_out = output_dir / f"{name}_dark.svg"
+    light_out = output_dir / f"{name}_light.svg"
+    dark_out.write_text(svgs["dark"], encoding="utf-8")
+    light_out.write_text(svgs["light"], encoding="utf-8")
+    logger.info("wrote %s", dark_out)
+    logger.info("wrote %s", light_out)
+    return dark_out, light_out
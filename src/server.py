@@ -0,0 +1,191 @@
+"""Serves the cards over HTTP, rendered on demand.
+
+Routes ``/stats``, ``/streak``, ``/activity``, ``/pr``, and ``/plan`` return
+the card SVG for the ``user`` (default ``GH_USERNAME``) and ``theme``
+(``dark`` or ``light``, default ``dark``) query parameters:
+
+1. Each card keeps its own TTL cache (``SERVER_CARD_TTLS``) of rendered
+   SVGs for up to ``SERVER_CACHE_MAX_USERS`` users, least recently requested
+   evicted first; concurrent requests for the same card and user share one
+   render (:class:`~src.query_cache.QueryCache`).
+2. Responses carry a strong ``ETag`` (hash of the SVG) and
+   ``Cache-Control: public, max-age=<card TTL>``; a matching
+   ``If-None-Match`` gets ``304 Not Modified``.
+3. The org configuration (``ORG_CONFIG``) and ``PR_EXCLUDE_ORGS`` apply to
+   ``GH_USERNAME`` only; other users get their own repositories and PRs.
+
+Set ``GITHUB_API_URL`` to serve from a local stand-in for the GitHub API.
+
+Usage::
+
+    uv run python -m src.server --port 8080
+    curl 'http://localhost:8080/stats?user=octocat&theme=light'
+"""
+
+import argparse
+import hashlib
+import logging
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from src.config import GH_USERNAME, ORG_CONFIG, PR_EXCLUDE_ORGS, SERVER_CACHE_MAX_USERS, SERVER_CARD_TTLS
+from src.github_activity_card import render_github_activity_svgs
+from src.github_client import GitHubClient
+from src.github_plan_card import render_github_plan_svgs
+from src.github_pr_card import render_github_pr_svgs
+from src.github_stats_card import render_github_stats_svgs
+from src.github_streak_card import render_github_streak_svgs
+from src.query_cache import QueryCache, make_key
+from src.stats import GitHubStats
+
+logger = logging.getLogger(__name__)
+
+USERNAME_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$")
+THEMES = ("dark", "light")
+
+
+class CardRenderer:
+    """Renders cards through per-card TTL caches that coalesce concurrent renders."""
+
+    def __init__(
+        self,
+        templates_dir: Path,
+        client: GitHubClient | None = None,
+        ttls: dict[str, int] | None = None,
+        max_users: int = SERVER_CACHE_MAX_USERS,
+    ) -> None:
+        self.templates_dir = templates_dir
+        self.client = client or GitHubClient()
+        self.ttls = dict(SERVER_CARD_TTLS if ttls is None else ttls)
+        self._caches = {card: QueryCache(ttl, max_entries=max_users) for card, ttl in self.ttls.items()}
+
+    def render(self, card: str, username: str) -> dict[str, tuple[bytes, str]]:
+        """Return *card* for *username*, rendering it at most once per the card's TTL.
+
+        :param card: Card name, one of :attr:`ttls`.
+        :param username: GitHub username (ignored by the plan card).
+        :return: Mapping of theme to ``(svg_bytes, etag)``.
+        """
+        key = make_key("card", card, {"user": "" if card == "plan" else username})
+        return self._caches[card].get_or_fetch(key, lambda: self._render(card, username))
+
+    def _render(self, card: str, username: str) -> dict[str, tuple[bytes, str]]:
+        own = username == GH_USERNAME
+        if card == "plan":
+            svgs = render_github_plan_svgs(self.templates_dir)
+        elif card in ("stats", "streak"):
+            stats = GitHubStats(username, client=self.client, org_config=ORG_CONFIG if own else [])
+            render = render_github_stats_svgs if card == "stats" else render_github_streak_svgs
+            svgs = render(templates_dir=self.templates_dir, username=username, stats=stats)
+        elif card == "pr":
+            svgs = render_github_pr_svgs(
+                templates_dir=self.templates_dir,
+                username=username,
+                client=self.client,
+                exclude_orgs=PR_EXCLUDE_ORGS if own else [],
+            )
+        else:
+            svgs = render_github_activity_svgs(templates_dir=self.templates_dir, username=username, client=self.client)
+
+        rendered = {}
+        for theme, svg in svgs.items():
+            body = svg.encode("utf-8")
+            rendered[theme] = body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return rendered
+
+
+class CardRequestHandler(BaseHTTPRequestHandler):
+    """Answers ``GET /<card>?user=&theme=`` with the rendered SVG."""
+
+    server: "CardServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        card = url.path.strip("/")
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        username = params.get("user", GH_USERNAME)
+        theme = params.get("theme", "dark")
+
+        renderer = self.server.renderer
+        if card not in renderer.ttls:
+            self._send_text(HTTPStatus.NOT_FOUND, f"unknown card {card!r}; try /{', /'.join(renderer.ttls)}")
+            return
+        if not username:
+            self._send_text(HTTPStatus.BAD_REQUEST, "missing user (no GH_USERNAME default configured)")
+            return
+        if not USERNAME_RE.match(username):
+            self._send_text(HTTPStatus.BAD_REQUEST, f"invalid user {username!r}")
+            return
+        if theme not in THEMES:
+            self._send_text(HTTPStatus.BAD_REQUEST, f"invalid theme {theme!r}; use dark or light")
+            return
+
+        try:
+            body, etag = renderer.render(card, username)[theme]
+        except Exception as exc:
+            logger.exception("rendering %s card for %s failed", card, username)
+            self._send_text(HTTPStatus.BAD_GATEWAY, f"could not render {card} card: {exc}")
+            return
+
+        cache_control = f"public, max-age={renderer.ttls[card]}"
+        if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "image/svg+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, status: HTTPStatus, message: str) -> None:
+        body = f"{message}\n".encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("%s %s", self.address_string(), format % args)
+
+
+class CardServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the shared :class:`CardRenderer`."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], renderer: CardRenderer) -> None:
+        super().__init__(address, CardRequestHandler)
+        self.renderer = renderer
+
+
+def main() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    parser = argparse.ArgumentParser(description="Serve GitHub cards over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    args = parser.parse_args()
+
+    server = CardServer((args.host, args.port), CardRenderer(repo_root / "templates"))
+    logger.info("serving cards on http://%s:%d/", *server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,57 +13,272 @@ Usage::
     stars = stats.get_total_stars()
 """
 
+import heapq
 import logging
+import threading
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import date, datetime, timedelta, timezone
 from math import pow
-
-from src.config import LANGUAGES_ORGS, LOCAL_TZ, STARS_ORGS
-from src.github_client import GitHubClient
+from operator import itemgetter
+
+from src.calendar_store import CalendarStore
+from src.config import (
+    CACHE_DIR,
+    CALENDAR_RESYNC_OVERLAP_DAYS,
+    CALENDAR_REVALIDATE_DAYS,
+    LANGUAGE_RESWEEP_DAYS,
+    LOCAL_TZ,
+    ORG_CONFIG,
+    PAGE_SIZE_MAX,
+    SEARCH_INDEX_LAG_MINUTES,
+    SEARCH_RECOUNT_DAYS,
+)
+from src.contribution_calendar import ContributionCalendar
+from src.github_client import GitHubClient, PageChain
 from src.graphql_queries import (
     ALL_TIME_CONTRIBUTIONS_QUERY,
     FOLLOWERS_COUNT_QUERY,
-    ORG_LANGUAGES_QUERY,
-    ORG_STARS_QUERY,
+    ORG_REPOSITORIES_PATH,
+    ORG_REPOSITORY_INVENTORY_QUERY,
+    REPOSITORIES_PER_LANGUAGES_QUERY,
     SEARCH_ISSUE_COUNT_QUERY,
     SEARCH_REVIEW_COUNT_QUERY,
     STREAK_CALENDAR_QUERY,
-    TOTAL_STARS_QUERY,
-    USER_LANGUAGES_QUERY,
     USER_PROFILE_QUERY,
+    USER_REPOSITORIES_PATH,
+    USER_REPOSITORY_INVENTORY_QUERY,
     YEAR_CONTRIBUTIONS_QUERY,
     YEAR_CONTRIBUTIONS_SUMMARY_QUERY,
+    YEARS_PER_CONTRIBUTIONS_QUERY,
+    build_profile_counts_query,
+    build_repository_languages_query,
+    build_yearly_contributions_query,
 )
+from src.json_store import JsonStore
 
 logger = logging.getLogger(__name__)
 
+# Search totals keyed by base query; shared so concurrent GitHubStats instances write one file.
+_search_counts = JsonStore(CACHE_DIR / "search_counts.json")
 
-class GitHubStats:
-    """Fetches and aggregates GitHub profile statistics for a given user."""
+# Per-repository languages (``repo:<nameWithOwner>``) and last full sweep per owner (``sweep:<owner>``).
+_language_cache = JsonStore(CACHE_DIR / "languages.json")
 
-    def __init__(self, username):
-        self.username = username
-        self.client = GitHubClient()
 
-    def get_total_stars(self):
-        total_stars = 0
+def _language_entry(node: dict) -> dict:
+    """Return the language cache entry for a repository node fetched with ``languages``."""
+    return {
+        "pushedAt": node["pushedAt"],
+        "isFork": node["isFork"],
+        "edges": [[edge["node"]["name"], edge["size"]] for edge in node["languages"]["edges"]],
+    }
+
 
-        def process_stars(result):
-            nonlocal total_stars
-            repos = result["data"]["user"]["repositories"]["nodes"]
-            total_stars += sum(repo["stargazerCount"] for repo in repos)
+def _language_edges(entry: dict) -> dict:
+    """Rebuild a ``languages`` connection from a language cache entry."""
+    return {"edges": [{"size": size, "node": {"name": name}} for name, size in entry["edges"]]}
 
-        self.client.paginated_query(TOTAL_STARS_QUERY, self.username, process_stars)
 
-        def process_org_stars(result):
-            nonlocal total_stars
-            repos = result["data"]["organization"]["repositories"]["nodes"]
-            total_stars += sum(repo["stargazerCount"] for repo in repos)
+class GitHubStats:
+    """Fetches and aggregates GitHub profile statistics for a given user.
 
-        for org in STARS_ORGS:
-            self.client.paginated_org_query(ORG_STARS_QUERY, org, process_org_stars)
+    Orgs counted toward stars and languages come from *org_config*, a list of
+    ``{"name", "stars", "languages"}`` entries (``ORG_CONFIG`` by default).
+    """
 
-        logger.info("total stars: %d (user + %d orgs)", total_stars, len(STARS_ORGS))
+    def __init__(self, username, client: GitHubClient | None = None, org_config: list[dict] | None = None):
+        self.username = username
+        self.client = client or GitHubClient()
+        org_config = ORG_CONFIG if org_config is None else org_config
+        self.stars_orgs = [o["name"] for o in org_config if o["stars"]]
+        self.languages_orgs = [o["name"] for o in org_config if o["languages"]]
+        self._calendar: CalendarStore | None = None
+        self._calendar_years: list[int] = []
+        self._inventory: dict[str, list[dict]] | None = None
+        self._inventory_lock = threading.Lock()
+
+    def get_repository_inventory(self) -> dict[str, list[dict]]:
+        """Fetch every owned repository of the user and of the configured orgs in one sweep.
+
+        Each repository node carries ``stargazerCount``, ``isFork``, and ``languages``
+        so stars and languages are computed from the same paginated pass. Orgs are
+        included when they are configured for stars or languages.
+
+        Languages are cached per repository by ``nameWithOwner`` and ``pushedAt``.
+        Pages arrive most recently pushed first; once a page reaches a repository
+        whose cached ``pushedAt`` is unchanged, the remaining pages skip the
+        ``languages`` selection (owners counted for stars) or are not fetched at
+        all (language-only owners, whose older repositories then come from the
+        cache).
+
+        :return: Mapping of owner login to that owner's repository nodes.
+        """
+        with self._inventory_lock:
+            if self._inventory is not None:
+                return self._inventory
+
+            language_owners = {self.username, *self.languages_orgs}
+            star_owners = {self.username, *self.stars_orgs}
+            inventory: dict[str, list[dict]] = {}
+            stopped: set[str] = set()
+            chains = []
+            for owner in dict.fromkeys([self.username] + self.stars_orgs + self.languages_orgs):
+                inventory[owner] = []
+                if owner == self.username:
+                    query, path = USER_REPOSITORY_INVENTORY_QUERY, USER_REPOSITORIES_PATH
+                    variables = {"username": owner}
+                else:
+                    query, path = ORG_REPOSITORY_INVENTORY_QUERY, ORG_REPOSITORIES_PATH
+                    variables = {"org": owner}
+                variables["withLanguages"] = owner in language_owners
+                process_fn = self._inventory_page_fn(
+                    owner,
+                    inventory[owner],
+                    path,
+                    with_languages=owner in language_owners,
+                    needs_stars=owner in star_owners,
+                    stopped=stopped,
+                )
+                chains.append(PageChain(query, variables, path, process_fn, page_size=PAGE_SIZE_MAX))
+
+            self.client.paginated_queries(chains)
+
+            for owner in inventory:
+                if owner in language_owners:
+                    self._attach_languages(owner, inventory[owner], complete=owner not in stopped)
+            _language_cache.save()
+
+            logger.info(
+                "repository inventory: %d repos across %d owner(s)",
+                sum(len(repos) for repos in inventory.values()),
+                len(inventory),
+            )
+            self._inventory = inventory
+            return inventory
+
+    def _inventory_page_fn(
+        self,
+        owner: str,
+        repos: list[dict],
+        path: tuple[str, ...],
+        *,
+        with_languages: bool,
+        needs_stars: bool,
+        stopped: set[str],
+    ) -> Callable[[dict], dict | bool | None]:
+        """Return the page callback for one owner's inventory chain.
+
+        Caches the languages of every repository on pages fetched with them and,
+        unless a full sweep is due, switches the chain to lean pages (or stops
+        it, adding *owner* to *stopped*) once an unchanged repository is seen.
+        """
+        last_sweep = _language_cache.get(f"sweep:{owner.lower()}")
+        full_sweep = last_sweep is None or (
+            datetime.now(timezone.utc) - datetime.fromisoformat(last_sweep) >= timedelta(days=LANGUAGE_RESWEEP_DAYS)
+        )
+        state = {"languages": with_languages}
+
+        def process(result: dict) -> dict | bool | None:
+            connection = result["data"]
+            for key in path:
+                connection = connection[key]
+            nodes = connection["nodes"]
+            repos.extend(nodes)
+            if not state["languages"]:
+                return None
+
+            reached_unchanged = False
+            for node in nodes:
+                key = f"repo:{node['nameWithOwner']}"
+                cached = _language_cache.get(key)
+                if cached is not None and cached["pushedAt"] == node["pushedAt"]:
+                    reached_unchanged = True
+                _language_cache.set(key, _language_entry(node))
+            if full_sweep or not reached_unchanged:
+                return None
+
+            state["languages"] = False
+            if not needs_stars:
+                logger.debug("inventory %s: reached unchanged repositories, stopping", owner)
+                stopped.add(owner)
+                return False
+            logger.debug("inventory %s: reached unchanged repositories, skipping languages", owner)
+            return {"withLanguages": False}
+
+        return process
+
+    def _attach_languages(self, owner: str, repos: list[dict], complete: bool) -> None:
+        """Fill in ``languages`` for *owner*'s repositories from the language cache.
+
+        Repositories fetched without languages are served from the cache, or looked
+        up in batches if the cache has no current entry. When the chain stopped
+        early, the unchanged repositories it never listed are added from the cache;
+        when it listed everything, cache entries of deleted repositories are pruned.
+        """
+        seen = set()
+        missing = []
+        for repo in repos:
+            seen.add(repo["nameWithOwner"])
+            if "languages" in repo:
+                continue
+            cached = _language_cache.get(f"repo:{repo['nameWithOwner']}")
+            if cached is not None and cached["pushedAt"] == repo["pushedAt"]:
+                repo["languages"] = _language_edges(cached)
+            else:
+                missing.append(repo)
+        if missing:
+            self._fetch_repository_languages(missing)
+
+        prefix = f"repo:{owner.lower()}/"
+        added = pruned = 0
+        for key, cached in _language_cache.items():
+            name = key.removeprefix("repo:")
+            if not key.lower().startswith(prefix) or name in seen:
+                continue
+            if complete:
+                _language_cache.delete(key)
+                pruned += 1
+            else:
+                repos.append(
+                    {
+                        "nameWithOwner": name,
+                        "pushedAt": cached["pushedAt"],
+                        "isFork": cached["isFork"],
+                        "languages": _language_edges(cached),
+                    }
+                )
+                added += 1
+        if complete:
+            _language_cache.set(f"sweep:{owner.lower()}", datetime.now(timezone.utc).isoformat())
+        logger.debug("languages %s: %d looked up, %d from cache only, %d pruned", owner, len(missing), added, pruned)
+
+    def _fetch_repository_languages(self, repos: list[dict]) -> None:
+        """Look up and cache the languages of *repos* with batched aliased queries."""
+        for start in range(0, len(repos), REPOSITORIES_PER_LANGUAGES_QUERY):
+            batch = repos[start : start + REPOSITORIES_PER_LANGUAGES_QUERY]
+            variables = {}
+            for i, repo in enumerate(batch):
+                owner, _, name = repo["nameWithOwner"].partition("/")
+                variables.update({f"owner{i}": owner, f"name{i}": name})
+            result = self.client.query(build_repository_languages_query(len(batch)), variables, allow_partial=True)
+            data = result.get("data") or {}
+            for i, repo in enumerate(batch):
+                node = data.get(f"r{i}")
+                if node is None:
+                    logger.debug("languages for %s unavailable", repo["nameWithOwner"])
+                    repo["languages"] = {"edges": []}
+                    continue
+                repo["languages"] = node["languages"]
+                _language_cache.set(f"repo:{repo['nameWithOwner']}", _language_entry(node))
+
+    def get_total_stars(self):
+        inventory = self.get_repository_inventory()
+        total_stars = 0
+        for owner in [self.username] + self.stars_orgs:
+            total_stars += sum(repo["stargazerCount"] for repo in inventory[owner])
+
+        logger.info("total stars: %d (user + %d orgs)", total_stars, len(self.stars_orgs))
         return total_stars
 
     def get_commits_last_year(self):
@@ -81,29 +296,113 @@ class GitHubStats:
         return contributions["contributionCalendar"]["totalContributions"]
 
     def get_commits_all_time(self):
-        result = self.client.query(ALL_TIME_CONTRIBUTIONS_QUERY, {"username": self.username})
-        years = result["data"]["user"]["contributionsCollection"]["contributionYears"]
+        return self.get_contribution_totals()["total"]
 
-        total_commits = 0
-        for year in years:
-            start = datetime(year, 1, 1, tzinfo=timezone.utc)
-            end = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+    def get_contribution_totals(self) -> dict:
+        """Fetch all-time contribution totals and the per-type breakdown in batched requests.
 
-            variables = {"username": self.username, "from": start.isoformat(), "to": end.isoformat()}
+        Every contribution year is requested as an aliased ``contributionsCollection``
+        block, :data:`~src.graphql_queries.YEARS_PER_CONTRIBUTIONS_QUERY` years per request.
 
-            result = self.client.query(YEAR_CONTRIBUTIONS_QUERY, variables)
-            contributions = result["data"]["user"]["contributionsCollection"]
-            total_commits += contributions["contributionCalendar"]["totalContributions"]
+        :return: Dict with ``total``, ``commits``, ``issues``, ``prs``, ``reviews``, and
+            ``years`` (mapping of year to calendar total).
+        """
+        result = self.client.query(ALL_TIME_CONTRIBUTIONS_QUERY, {"username": self.username})
+        years = sorted(result["data"]["user"]["contributionsCollection"]["contributionYears"])
+
+        totals = {"total": 0, "commits": 0, "issues": 0, "prs": 0, "reviews": 0, "years": {}}
+        for i in range(0, len(years), YEARS_PER_CONTRIBUTIONS_QUERY):
+            chunk = years[i : i + YEARS_PER_CONTRIBUTIONS_QUERY]
+            variables = {"username": self.username}
+            for year in chunk:
+                start = datetime(year, 1, 1, tzinfo=timezone.utc)
+                end = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+                variables[f"from{year}"] = start.isoformat()
+                variables[f"to{year}"] = end.isoformat()
+
+            result = self.client.query(build_yearly_contributions_query(chunk), variables)
+            user = result["data"]["user"]
+            for year in chunk:
+                contributions = user[f"y{year}"]
+                year_total = contributions["contributionCalendar"]["totalContributions"]
+                totals["years"][year] = year_total
+                totals["total"] += year_total
+                totals["commits"] += contributions["totalCommitContributions"]
+                totals["issues"] += contributions["totalIssueContributions"]
+                totals["prs"] += contributions["totalPullRequestContributions"]
+                totals["reviews"] += contributions["totalPullRequestReviewContributions"]
+
+        logger.info(
+            "contributions all time: %d across %d years (commits=%d, issues=%d, prs=%d, reviews=%d)",
+            totals["total"],
+            len(years),
+            totals["commits"],
+            totals["issues"],
+            totals["prs"],
+            totals["reviews"],
+        )
+        return totals
+
+    def _incremental_search_counts(
+        self, searches: dict[str, str], run_searches: Callable[[dict[str, str]], dict[str, int]]
+    ) -> dict[str, int]:
+        """Return search totals, querying only items created since the last run where possible.
+
+        Totals cover items created up to ``now - SEARCH_INDEX_LAG_MINUTES``, so
+        late-indexed items are not missed. Each base query's count is stored with
+        that cutoff (``through``). Later runs search the closed window
+        ``created:THROUGH+1s..NEW_THROUGH`` and add the delta, so every item is
+        counted exactly once. A full search (``created:<=NEW_THROUGH``) is run when
+        there is no stored count or the last full recount is older than
+        ``SEARCH_RECOUNT_DAYS``, which catches deletions and visibility changes
+        that deltas cannot see.
+
+        :param searches: Mapping of alias to base search query.
+        :param run_searches: Callable taking alias -> query string and returning alias -> ``issueCount``.
+        :return: Mapping of alias to total count.
+        """
+        now = datetime.now(timezone.utc)
+        cutoff = (now - timedelta(minutes=SEARCH_INDEX_LAG_MINUTES)).replace(microsecond=0)
+        new_through = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+        queries, bases, recounted = {}, {}, {}
+        for alias, q in searches.items():
+            entry = _search_counts.get(q)
+            start = None
+            if entry and now - datetime.fromisoformat(entry["recounted_at"]) < timedelta(days=SEARCH_RECOUNT_DAYS):
+                start = datetime.strptime(entry["through"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+                start += timedelta(seconds=1)
+            if start is not None and start <= cutoff:
+                queries[alias] = f"{q} created:{start.strftime('%Y-%m-%dT%H:%M:%SZ')}..{new_through}"
+                bases[alias] = entry["count"]
+                recounted[alias] = entry["recounted_at"]
+            else:
+                queries[alias] = f"{q} created:<={new_through}"
+                bases[alias] = 0
+                recounted[alias] = now.isoformat()
+
+        results = run_searches(queries)
+        counts = {}
+        for alias, q in searches.items():
+            counts[alias] = bases[alias] + results[alias]
+            _search_counts.set(q, {"count": counts[alias], "through": new_through, "recounted_at": recounted[alias]})
+            if bases[alias]:
+                logger.debug("search %r: %d + %d new", q, bases[alias], results[alias])
+            else:
+                logger.debug("search %r: full count %d", q, results[alias])
+        _search_counts.save()
+        return counts
+
+    def _search_count(self, query_string: str, q: str) -> int:
+        def run(queries: dict[str, str]) -> dict[str, int]:
+            result = self.client.query(query_string, {"query": queries["count"]})
+            return {"count": result["data"]["search"]["issueCount"]}
 
-        logger.info("commits all time: %d across %d years", total_commits, len(years))
-        return total_commits
+        return self._incremental_search_counts({"count": q}, run)["count"]
 
     def get_total_issues_created(self):
         # Search is the most consistent way to count authored issues across orgs,
         # provided the token can "see" those repositories.
-        q = f"author:{self.username} is:issue"
-        result = self.client.query(SEARCH_ISSUE_COUNT_QUERY, {"query": q})
-        count = result["data"]["search"]["issueCount"]
+        count = self._search_count(SEARCH_ISSUE_COUNT_QUERY, f"author:{self.username} is:issue")
         logger.info("total issues created: %d", count)
         return count
 
@@ -115,9 +414,7 @@ class GitHubStats:
         return name
 
     def get_total_pull_requests_created(self):
-        q = f"author:{self.username} is:pr"
-        result = self.client.query(SEARCH_ISSUE_COUNT_QUERY, {"query": q})
-        count = result["data"]["search"]["issueCount"]
+        count = self._search_count(SEARCH_ISSUE_COUNT_QUERY, f"author:{self.username} is:pr")
         logger.info("total PRs created: %d", count)
         return count
 
@@ -129,12 +426,48 @@ class GitHubStats:
 
     def get_total_reviews_created(self):
         # Count authored PR reviews via search.
-        q = f"reviewed-by:{self.username} is:pr"
-        result = self.client.query(SEARCH_REVIEW_COUNT_QUERY, {"query": q})
-        count = result["data"]["search"]["issueCount"]
+        count = self._search_count(SEARCH_REVIEW_COUNT_QUERY, f"reviewed-by:{self.username} is:pr")
         logger.info("total reviews: %d", count)
         return count
 
+    def get_profile_counts(self) -> dict:
+        """Fetch the display name, follower count, and issue/PR/review totals in one request.
+
+        The search totals are maintained incrementally; see :meth:`_incremental_search_counts`.
+
+        :return: Dict with ``display_name``, ``followers``, ``issues``, ``prs``, and ``reviews``.
+        """
+        searches = {
+            "issues": f"author:{self.username} is:issue",
+            "prs": f"author:{self.username} is:pr",
+            "reviews": f"reviewed-by:{self.username} is:pr",
+        }
+        data: dict = {}
+
+        def run(queries: dict[str, str]) -> dict[str, int]:
+            variables = {"username": self.username}
+            variables.update({f"{alias}Query": q for alias, q in queries.items()})
+            data.update(self.client.query(build_profile_counts_query(list(queries)), variables)["data"])
+            return {alias: data[alias]["issueCount"] for alias in queries}
+
+        search_counts = self._incremental_search_counts(searches, run)
+        user = data.get("user") or {}
+        counts = {
+            "display_name": user.get("name") or user.get("login") or self.username,
+            "followers": (user.get("followers") or {}).get("totalCount", 0),
+            **search_counts,
+        }
+
+        logger.info(
+            "profile counts: name=%s, followers=%d, issues=%d, prs=%d, reviews=%d",
+            counts["display_name"],
+            counts["followers"],
+            counts["issues"],
+            counts["prs"],
+            counts["reviews"],
+        )
+        return counts
+
     def get_repos_contributed_last_year(self):
         now = datetime.now(timezone.utc)
         one_year_ago = now - timedelta(days=365)
@@ -153,38 +486,24 @@ class GitHubStats:
         if exclude is None:
             exclude = {"TeX", "HTML"}
         language_bytes = defaultdict(int)
+        inventory = self.get_repository_inventory()
 
-        def process_languages(result):
-            repos = result["data"]["user"]["repositories"]["nodes"]
-            for repo in repos:
+        for owner in [self.username] + self.languages_orgs:
+            for repo in inventory[owner]:
+                if repo["isFork"]:
+                    continue
                 for edge in repo["languages"]["edges"]:
                     name = edge["node"]["name"]
                     if name in exclude:
                         continue
                     language_bytes[name] += edge["size"]
 
-        self.client.paginated_query(USER_LANGUAGES_QUERY, self.username, process_languages)
-
-        def process_org_languages(result):
-            repos = result["data"]["organization"]["repositories"]["nodes"]
-            for repo in repos:
-                for edge in repo["languages"]["edges"]:
-                    name = edge["node"]["name"]
-                    if name in exclude:
-                        continue
-                    language_bytes[name] += edge["size"]
-
-        for org in LANGUAGES_ORGS:
-            self.client.paginated_org_query(ORG_LANGUAGES_QUERY, org, process_org_languages)
-
         total_bytes = sum(language_bytes.values())
         if total_bytes == 0:
             return []
 
-        sorted_languages = sorted(language_bytes.items(), key=lambda x: x[1], reverse=True)
-
         top_languages = []
-        for lang, bytes_count in sorted_languages[:top_n]:
+        for lang, bytes_count in heapq.nlargest(top_n, language_bytes.items(), key=itemgetter(1)):
             percentage = (bytes_count / total_bytes) * 100
             top_languages.append(
                 {
@@ -201,19 +520,11 @@ class GitHubStats:
         return top_languages
 
     def get_first_contribution_date(self) -> tuple[str, str]:
-        years_resp = self.client.query(ALL_TIME_CONTRIBUTIONS_QUERY, {"username": self.username})
-        years = sorted(years_resp["data"]["user"]["contributionsCollection"]["contributionYears"])
-        if not years:
-            return ("-", "-")
-
-        for year in years:
-            start_dt = datetime(year, 1, 1, tzinfo=timezone.utc)
-            end_dt = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
-            days = self._fetch_calendar_days(start_dt, end_dt)
-            first = next((d for d, count in sorted(days) if count > 0), None)
-            if first:
-                logger.info("first contribution: %s", first.isoformat())
-                return (str(first.year), first.strftime("%b %-d, %Y"))
+        store = self._sync_calendar()
+        first = store.first_contribution() if store is not None else None
+        if first:
+            logger.info("first contribution: %s", first.isoformat())
+            return (str(first.year), first.strftime("%b %-d, %Y"))
 
         return ("-", "-")
 
@@ -234,43 +545,86 @@ class GitHubStats:
                 days_list.append((date.fromisoformat(d["date"]), d["contributionCount"]))
         return days_list
 
-    def get_streak_stats(self) -> dict:
+    def _sync_calendar(self) -> CalendarStore | None:
+        """Bring the local calendar store up to date and return it.
+
+        Finished years are fetched once and re-fetched only every
+        ``CALENDAR_REVALIDATE_DAYS``. The latest year is fetched from the last
+        synced day (minus ``CALENDAR_RESYNC_OVERLAP_DAYS``) through today, with a
+        full-year fetch on the same revalidation schedule.
+
+        :return: Synced :class:`CalendarStore`, or ``None`` when the user has no contribution years.
+        """
+        if self._calendar is not None:
+            return self._calendar
+
         years_resp = self.client.query(ALL_TIME_CONTRIBUTIONS_QUERY, {"username": self.username})
-        years = years_resp["data"]["user"]["contributionsCollection"]["contributionYears"]
+        years = sorted(years_resp["data"]["user"]["contributionsCollection"]["contributionYears"])
         if not years:
-            return {
-                "total_contributions": 0,
-                "current_streak": 0,
-                "current_range": "-",
-                "longest_streak": 0,
-                "longest_range": "-",
-            }
+            return None
 
-        days_list = []
-        for year in years:
+        store = CalendarStore.open(CACHE_DIR / "calendar" / f"{self.username}.bin")
+        max_age = timedelta(days=CALENDAR_REVALIDATE_DAYS)
+        now_utc = datetime.now(timezone.utc)
+        latest_year = years[-1]
+        fetched_years = 0
+
+        for year in years[:-1]:
+            if store.year_is_fresh(year, max_age):
+                continue
             start_dt = datetime(year, 1, 1, tzinfo=timezone.utc)
-            if year == max(years):
-                end_dt = datetime.now(LOCAL_TZ)
-            else:
-                end_dt = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
-            days_list.extend(self._fetch_calendar_days(start_dt, end_dt))
+            end_dt = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+            store.update(self._fetch_calendar_days(start_dt, end_dt))
+            store.mark_year(year, complete=now_utc > end_dt)
+            fetched_years += 1
+
+        start_dt = datetime(latest_year, 1, 1, tzinfo=timezone.utc)
+        if (
+            store.synced_through
+            and store.synced_through.year == latest_year
+            and store.fetched_within(latest_year, max_age)
+        ):
+            resume = store.synced_through - timedelta(days=CALENDAR_RESYNC_OVERLAP_DAYS)
+            start_dt = max(start_dt, datetime(resume.year, resume.month, resume.day, tzinfo=timezone.utc))
+        end_dt = datetime.now(LOCAL_TZ)
+        days = self._fetch_calendar_days(start_dt, end_dt)
+        store.update(days)
+        if start_dt.month == 1 and start_dt.day == 1:
+            store.mark_year(latest_year, complete=False)
+        if days:
+            store.mark_synced(max(d for d, _ in days))
+        store.save()
 
-        if not days_list:
+        logger.info(
+            "calendar store: %d day(s), fetched %d finished year(s) + %s onwards",
+            len(store),
+            fetched_years,
+            start_dt.date().isoformat(),
+        )
+        self._calendar = store
+        self._calendar_years = years
+        return store
+
+    def get_streak_stats(self) -> dict:
+        store = self._sync_calendar()
+        if store is None:
             return {
                 "total_contributions": 0,
                 "current_streak": 0,
                 "current_range": "-",
                 "longest_streak": 0,
                 "longest_range": "-",
-                "total_range": "-",
             }
 
-        days_list.sort(key=lambda x: x[0])
+        # Only contribution years count, as when each year was fetched separately; the latest
+        # year's window runs up to today in LOCAL_TZ, which may already be the next year.
+        years = set(self._calendar_years)
+        if store.last_day is not None:
+            years.update(range(max(years), store.last_day.year + 1))
+        calendar = ContributionCalendar(store.base_ordinal, store.counts, years=years)
 
         # Weekends (Sat=5, Sun=6) are excluded: they neither count toward nor break streaks.
-        days_list = [(d, c) for d, c in days_list if d.weekday() < 5]
-
-        if not days_list:
+        if not len(calendar):
             return {
                 "total_contributions": 0,
                 "current_streak": 0,
@@ -280,62 +634,13 @@ class GitHubStats:
                 "total_range": "-",
             }
 
-        total_contribs = sum(c for _, c in days_list)
-        first_day = days_list[0][0]
-        last_day = days_list[-1][0]
-
-        # Longest streak scan: after the weekend filter every consecutive pair is a consecutive
-        # weekday, so a simple prev_has flag is sufficient (no day-gap check needed).
-        longest_len = 0
-        longest_start = None
-        longest_end = None
-        run_len = 0
-        run_start = None
-        prev_has = False
-        for d, count in days_list:
-            has = count > 0
-            if has:
-                if prev_has:
-                    run_len += 1
-                else:
-                    run_len = 1
-                    run_start = d
-                if run_len > longest_len:
-                    longest_len = run_len
-                    longest_start = run_start
-                    longest_end = d
-            else:
-                run_len = 0
-                run_start = None
-            prev_has = has
+        longest_len, longest_start, longest_end = calendar.longest_streak()
 
         # Current streak (most-recent weekday backwards). Grace period: if today UTC has 0
         # contributions and is still a weekday in NZT, skip ahead to the previous weekday.
         today_nzt = datetime.now(LOCAL_TZ).date()
         today_utc = datetime.now(timezone.utc).date()
-
-        current_len = 0
-        current_start = None
-        current_end = None
-        last_idx = len(days_list) - 1
-        last_day_entry, last_count = days_list[last_idx]
-
-        if last_count == 0 and today_nzt.weekday() < 5 and last_day_entry == today_utc:
-            last_idx -= 1
-
-        if last_idx >= 0:
-            last_day_entry, last_count = days_list[last_idx]
-            if last_count > 0:
-                current_end = last_day_entry
-                current_len = 1
-                current_start = last_day_entry
-                for idx in range(last_idx - 1, -1, -1):
-                    d, count = days_list[idx]
-                    if count > 0:
-                        current_len += 1
-                        current_start = d
-                    else:
-                        break
+        current_len, current_start, current_end = calendar.current_streak(today_nzt, today_utc)
 
         def fmt_range(start_d, end_d):
             if not start_d or not end_d:
@@ -345,8 +650,8 @@ class GitHubStats:
             return f"{start_d.strftime('%b %-d, %Y')} - {end_d.strftime('%b %-d, %Y')}"
 
         return {
-            "total_contributions": total_contribs,
-            "total_range": fmt_range(first_day, last_day),
+            "total_contributions": calendar.total,
+            "total_range": fmt_range(calendar.first_day, calendar.last_day),
             "current_streak": current_len,
             "current_range": fmt_range(current_start, current_end),
             "longest_streak": longest_len,
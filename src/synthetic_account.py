@@ -0,0 +1,275 @@
+"""Synthetic GitHub accounts for offline benchmarks.
+
+:class:`SyntheticAccount` describes an account's size (owned repositories,
+contribution years, organizations, events). :class:`SyntheticAPIAdapter` is a
+``requests`` adapter that answers every REST and GraphQL request the card
+generators send with deterministic data for that account, so accounts far
+larger than any real test account can be recorded into a cassette (see
+:mod:`src.cassette`) and replayed. Data is seeded by username; timestamps
+are relative to the moment the adapter is created.
+
+One in seven commits is hidden from GraphQL (``NOT_FOUND``) so the activity
+card's REST fallback is exercised too.
+
+Usage::
+
+    from src.synthetic_account import ACCOUNTS, SyntheticAPIAdapter
+
+    session = requests.Session()
+    session.mount("https://", SyntheticAPIAdapter(ACCOUNTS["large"]))
+"""
+
+import json
+import random
+import re
+from datetime import date, datetime, timedelta, timezone
+from functools import cached_property
+from http import HTTPStatus
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+LANGUAGES = ("Python", "TypeScript", "Go", "Rust", "C", "Shell", "HTML", "TeX", "Java", "Ruby", "Lua", "Nix")
+
+_RATE_LIMIT_HEADERS = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "4102444800"}
+
+
+class SyntheticAccount(NamedTuple):
+    """Size of a synthetic account; every org is counted for both stars and languages."""
+
+    username: str
+    repos: int
+    years: int
+    orgs: int
+    org_repos: int = 25
+    events: int = 300
+
+    @property
+    def org_config(self) -> list[dict]:
+        return [{"name": f"{self.username}-org{i}", "stars": True, "languages": True} for i in range(self.orgs)]
+
+
+ACCOUNTS = {
+    "small": SyntheticAccount("bench-small", repos=30, years=3, orgs=1),
+    "large": SyntheticAccount("bench-large", repos=500, years=20, orgs=20),
+}
+
+
+class _SyntheticData:
+    """Deterministic repositories, calendar, and events for one :class:`SyntheticAccount`."""
+
+    def __init__(self, account: SyntheticAccount, now: datetime) -> None:
+        self.account = account
+        self.now = now
+
+    def repositories(self, owner: str) -> list[dict]:
+        return self._repositories[owner.lower()]
+
+    @cached_property
+    def _repositories(self) -> dict[str, list[dict]]:
+        owners = {self.account.username: self.account.repos}
+        owners.update({org["name"]: self.account.org_repos for org in self.account.org_config})
+        repositories = {}
+        for owner, count in owners.items():
+            rng = random.Random(f"repos:{owner}")
+            repos = []
+            for i in range(count):
+                languages = rng.sample(LANGUAGES, rng.randint(0, 5))
+                repos.append(
+                    {
+                        "nameWithOwner": f"{owner}/repo-{i:03d}",
+                        "pushedAt": _iso(self.now - timedelta(hours=i * 7 + rng.randint(0, 6))),
+                        "stargazerCount": int(rng.paretovariate(1.2)) - 1,
+                        "isFork": rng.random() < 0.15,
+                        "languages": {
+                            "edges": [{"size": rng.randint(100, 500_000), "node": {"name": name}} for name in languages]
+                        },
+                    }
+                )
+            repositories[owner.lower()] = repos
+        return repositories
+
+    @cached_property
+    def years(self) -> list[int]:
+        return list(range(self.now.year - self.account.years + 1, self.now.year + 1))
+
+    @cached_property
+    def calendar(self) -> dict[date, int]:
+        rng = random.Random(f"calendar:{self.account.username}")
+        day = date(self.years[0], 1, 1)
+        days = {}
+        while day <= self.now.date():
+            active = rng.random() < (0.85 if day.weekday() < 5 else 0.2)
+            days[day] = rng.randint(1, 12) if active else 0
+            day += timedelta(days=1)
+        return days
+
+    @cached_property
+    def events(self) -> list[dict]:
+        rng = random.Random(f"events:{self.account.username}")
+        repos = self.repositories(self.account.username)[:12]
+        events = []
+        for i in range(self.account.events):
+            repo = rng.choice(repos)["nameWithOwner"]
+            events.append(
+                {
+                    "id": str(90_000_000 - i),
+                    "type": "PushEvent" if rng.random() < 0.7 else rng.choice(("WatchEvent", "IssuesEvent")),
+                    "repo": {"name": repo},
+                    "payload": {"head": f"{rng.getrandbits(160):040x}"},
+                    "created_at": _iso(self.now - timedelta(minutes=i * 37)),
+                }
+            )
+        return events
+
+
+def _iso(moment: datetime) -> str:
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _count(seed: str, low: int, high: int) -> int:
+    return random.Random(seed).randint(low, high)
+
+
+class SyntheticAPIAdapter(BaseAdapter):
+    """Offline adapter answering GitHub API requests for one :class:`SyntheticAccount`."""
+
+    def __init__(self, account: SyntheticAccount) -> None:
+        super().__init__()
+        self.data = _SyntheticData(account, datetime.now(timezone.utc))
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        params = dict(parse_qsl(url.query))
+        headers = dict(_RATE_LIMIT_HEADERS)
+        if url.path.endswith("/graphql"):
+            body = json.loads(request.body)
+            status, payload = 200, self._graphql(body["query"], body.get("variables") or {})
+            headers["X-RateLimit-Resource"] = "graphql"
+        else:
+            status, payload, extra = self._rest(url.path, params, request.headers)
+            headers.update(extra)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({**headers, "Content-Type": "application/json; charset=utf-8"})
+        response._content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        response.reason = HTTPStatus(status).phrase
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
+
+    def _rest(self, path: str, params: dict, request_headers) -> tuple[int, object, dict]:
+        data = self.data
+        if path == f"/users/{data.account.username}/events":
+            page, per_page = int(params.get("page", 1)), int(params.get("per_page", 30))
+            etag = f'"events-{page}-{len(data.events)}"'
+            headers = {"ETag": etag, "X-Poll-Interval": "60", "X-RateLimit-Resource": "core"}
+            if request_headers.get("If-None-Match") == etag:
+                return 304, None, headers
+            return 200, data.events[(page - 1) * per_page : page * per_page], headers
+        if match := re.fullmatch(r"/repos/([^/]+/[^/]+)/commits/([0-9a-f]+)", path):
+            repo, sha = match.groups()
+            message = f"Update {repo.rsplit('/', 1)[1]} ({sha[:7]})\n\nSynthetic commit body."
+            return 200, {"sha": sha, "commit": {"message": message}}, {"ETag": f'"{sha}"'}
+        if path == "/search/issues":
+            rng = random.Random(f"prs:{params.get('q')}")
+            items = [
+                {
+                    "repository_url": f"https://api.github.com/repos/upstream{i}/project{rng.randint(0, 99)}",
+                    "title": f"Fix edge case #{rng.randint(1, 9999)}",
+                    "state": rng.choice(("open", "closed")),
+                    "pull_request": {"merged_at": _iso(data.now - timedelta(days=i)) if rng.random() < 0.5 else None},
+                    "updated_at": _iso(data.now - timedelta(days=i, hours=rng.randint(0, 23))),
+                }
+                for i in range(int(params.get("per_page", 30)))
+            ]
+            return 200, {"total_count": len(items), "items": items}, {"X-RateLimit-Resource": "search"}
+        return 404, {"message": "Not Found"}, {}
+
+    def _graphql(self, query: str, variables: dict) -> dict:
+        data = self.data
+        username = data.account.username
+        if "repositories(" in query:
+            owner = variables.get("org") or variables["username"]
+            start = int(variables.get("cursor") or 0)
+            first = int(variables.get("first", 100))
+            repos = data.repositories(owner)
+            nodes = repos[start : start + first]
+            if not variables.get("withLanguages", True):
+                nodes = [{k: v for k, v in node.items() if k != "languages"} for node in nodes]
+            connection = {
+                "nodes": nodes,
+                "pageInfo": {"hasNextPage": start + first < len(repos), "endCursor": str(start + first)},
+            }
+            return {"data": {"organization" if "org" in variables else "user": {"repositories": connection}}}
+
+        aliases = re.findall(r"\b([rc]\d+): repository\(", query)
+        if aliases:
+            result, errors = {}, []
+            for alias in aliases:
+                i = alias[1:]
+                owner, name = variables[f"owner{i}"], variables[f"name{i}"]
+                if alias[0] == "r":
+                    repo = next((r for r in data.repositories(owner) if r["nameWithOwner"] == f"{owner}/{name}"), None)
+                    result[alias] = repo
+                elif int(variables[f"oid{i}"][:8], 16) % 7 == 0:
+                    result[alias] = None
+                    errors.append({"type": "NOT_FOUND", "path": [alias], "message": "Could not resolve"})
+                else:
+                    result[alias] = {"object": {"messageHeadline": f"Update {name} ({variables[f'oid{i}'][:7]})"}}
+            return {"data": result, "errors": errors} if errors else {"data": result}
+
+        if "contributionYears" in query:
+            return {"data": {"user": {"contributionsCollection": {"contributionYears": data.years[::-1]}}}}
+
+        if "contributionDays" in query:
+            start = datetime.fromisoformat(variables["from"]).date()
+            end = datetime.fromisoformat(variables["to"]).date()
+            days = [
+                {"date": d.isoformat(), "contributionCount": c} for d, c in data.calendar.items() if start <= d <= end
+            ]
+            weeks = [{"contributionDays": days[i : i + 7]} for i in range(0, len(days), 7)]
+            calendar = {"totalContributions": sum(d["contributionCount"] for d in days), "weeks": weeks}
+            return {"data": {"user": {"contributionsCollection": {"contributionCalendar": calendar}}}}
+
+        years = re.findall(r"\by(\d{4}): contributionsCollection", query)
+        if years:
+            user = {}
+            for year in map(int, years):
+                total = sum(c for d, c in data.calendar.items() if d.year == year)
+                user[f"y{year}"] = {
+                    "contributionCalendar": {"totalContributions": total},
+                    "totalCommitContributions": total * 4 // 5,
+                    "totalIssueContributions": total // 20,
+                    "totalPullRequestContributions": total // 10,
+                    "totalPullRequestReviewContributions": total // 25,
+                }
+            return {"data": {"user": user}}
+
+        result: dict = {}
+        if "followers" in query or "login" in query:
+            result["user"] = {
+                "name": f"Synthetic {username}",
+                "login": username,
+                "followers": {"totalCount": _count(f"followers:{username}", 10, 5000)},
+            }
+        for alias in re.findall(r"\b(\w+): search\(", query):
+            result[alias] = {"issueCount": _count(variables[f"{alias}Query"], 0, 2000)}
+        if "search(type: ISSUE, query: $query)" in query:
+            result["search"] = {"issueCount": _count(variables["query"], 0, 2000)}
+        if "contributionsCollection(from: $from" in query:
+            last_year = sum(c for d, c in data.calendar.items() if (data.now.date() - d).days <= 365)
+            result.setdefault("user", {})["contributionsCollection"] = {
+                "contributionCalendar": {"totalContributions": last_year},
+                "totalRepositoriesWithContributedCommits": min(data.account.repos, 40),
+            }
+        return {"data": result}
@@ -0,0 +1,125 @@
+"""Routing of GitHub API requests across a pool of tokens.
+
+Each token has its own :class:`~src.rate_limit.RateLimitScheduler`, fed by
+the ``X-RateLimit-*`` headers of the responses it receives, so its budget is
+tracked per bucket (``core``, ``search``, ``graphql``). :meth:`TokenPool.choose`
+routes each request to the usable token with the most remaining budget in
+that bucket:
+
+1. Tokens that answered ``401 Unauthorized`` are marked revoked and skipped.
+2. Tokens whose bucket is exhausted are skipped until their reset time.
+3. If every token is exhausted, the one that resets first is used (its
+   scheduler then waits for the reset).
+
+Usage::
+
+    from src.token_pool import TokenPool
+
+    pool = TokenPool(["ghp_first", "ghp_second"])
+    token = pool.choose("graphql")
+    token.scheduler.acquire("graphql")
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+
+from src.rate_limit import DEFAULT_BUDGETS, RateLimitScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class PooledToken:
+    """One token with its scheduler and usage counters."""
+
+    def __init__(self, value: str, scheduler: RateLimitScheduler) -> None:
+        self.value = value
+        self.scheduler = scheduler
+        self.revoked = False
+        self.requests: Counter[str] = Counter()
+
+    @property
+    def label(self) -> str:
+        """Masked form of the token, safe to log."""
+        return f"...{self.value[-4:]}"
+
+    def remaining(self, bucket: str) -> int:
+        """Last reported remaining budget for *bucket*, or the default budget if none seen yet."""
+        return self.scheduler.remaining.get(bucket, DEFAULT_BUDGETS[bucket][0])
+
+    def exhausted(self, bucket: str, now: float) -> bool:
+        return self.remaining(bucket) <= 0 and self.scheduler.reset_at.get(bucket, 0) > now
+
+
+class TokenPool:
+    """Chooses, per request, the token with the most remaining budget in the request's bucket."""
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        schedulers: Sequence[RateLimitScheduler] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not tokens:
+            raise ValueError("TokenPool needs at least one token")
+        schedulers = list(schedulers or [])
+        schedulers += [RateLimitScheduler() for _ in range(len(tokens) - len(schedulers))]
+        self.tokens = [PooledToken(value, scheduler) for value, scheduler in zip(tokens, schedulers)]
+        # Identifies what the pool can see without exposing the tokens, e.g. to keep cached responses apart.
+        self.fingerprint = hashlib.sha256("\n".join(sorted(tokens)).encode("utf-8")).hexdigest()[:16]
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def choose(self, bucket: str, exclude: PooledToken | None = None) -> PooledToken:
+        """Return the token to send the next *bucket* request with.
+
+        :param bucket: Rate-limit bucket of the request.
+        :param exclude: Token to avoid if any other token is usable (e.g. one that just failed).
+        :return: The usable token with the most remaining budget, or the soonest to reset if all are exhausted.
+        """
+        now = self._clock()
+        with self._lock:
+            live = [t for t in self.tokens if not t.revoked] or self.tokens
+            usable = [t for t in live if t is not exclude and not t.exhausted(bucket, now)]
+            if not usable:
+                usable = [t for t in live if not t.exhausted(bucket, now)]
+            if usable:
+                return max(usable, key=lambda t: t.remaining(bucket))
+            return min(live, key=lambda t: t.scheduler.reset_at.get(bucket, 0))
+
+    def has_alternative(self, token: PooledToken, bucket: str) -> bool:
+        """Return True when a token other than *token* is live and not exhausted for *bucket*."""
+        now = self._clock()
+        with self._lock:
+            return any(t is not token and not t.revoked and not t.exhausted(bucket, now) for t in self.tokens)
+
+    def record(self, token: PooledToken, bucket: str) -> None:
+        """Count one request sent with *token* against *bucket*."""
+        with self._lock:
+            token.requests[bucket] += 1
+
+    def revoke(self, token: PooledToken) -> None:
+        """Stop routing requests to *token* (it answered ``401 Unauthorized``)."""
+        with self._lock:
+            if not token.revoked:
+                token.revoked = True
+                logger.warning("token %s rejected (401), removed from the pool", token.label)
+
+    def stats(self) -> list[dict]:
+        """Return per-token ``label``, ``requests`` per bucket, ``remaining`` budgets, and ``revoked`` flag."""
+        with self._lock:
+            return [
+                {
+                    "label": t.label,
+                    "requests": dict(t.requests),
+                    "remaining": dict(t.scheduler.remaining),
+                    "revoked": t.revoked,
+                }
+                for t in self.tokens
+            ]
@@ -0,0 +1,106 @@
+"""In-memory stand-ins for the GitHub API shared by the unit tests.
+
+Importing this module first gives the process a throwaway ``CACHE_DIR`` and a
+dummy ``GH_TOKEN``, so module-level stores never touch the real cache.
+
+Usage::
+
+    from fakes import FakeAPI, make_client
+
+    api = FakeAPI(lambda request: (200, {"ok": True}, {}))
+    client = make_client(api)
+"""
+
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+os.environ.setdefault("GH_TOKEN", "test-token")
+os.environ.setdefault("CACHE_DIR", tempfile.mkdtemp(prefix="github-stats-tests-"))
+os.environ.setdefault("LOG_LEVEL", "NONE")
+
+import requests  # noqa: E402
+from requests.adapters import BaseAdapter  # noqa: E402
+from requests.structures import CaseInsensitiveDict  # noqa: E402
+
+from src.github_client import GitHubClient  # noqa: E402
+from src.http_cache import HTTPCache  # noqa: E402
+from src.query_cache import QueryCache  # noqa: E402
+from src.rate_limit import RateLimitScheduler  # noqa: E402
+from src.token_pool import TokenPool  # noqa: E402
+
+Handler = Callable[[requests.PreparedRequest], tuple[int, object, dict[str, str]]]
+
+
+class FakeAPI(BaseAdapter):
+    """Adapter answering every request with ``handler(request) -> (status, json_body, headers)``.
+
+    A handler may raise (e.g. :class:`requests.Timeout`) to simulate transport failures.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        super().__init__()
+        self.handler = handler
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.requests.append(request)
+        status, payload, headers = self.handler(request)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", **headers})
+        response._content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        response.reason = HTTPStatus(status).phrase
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def query_params(request: requests.PreparedRequest) -> dict[str, str]:
+    """Return the query string parameters of *request*."""
+    return dict(parse_qsl(urlsplit(request.url).query))
+
+
+def graphql_body(request: requests.PreparedRequest) -> dict:
+    """Return the decoded JSON body of a GraphQL *request*."""
+    return json.loads(request.body)
+
+
+def make_client(
+    api: FakeAPI,
+    tokens: list[str] | None = None,
+    cache_dir: Path | None = None,
+    cache: QueryCache | None = None,
+) -> GitHubClient:
+    """Build a :class:`~src.github_client.GitHubClient` over *api* with private caches and no real sleeping.
+
+    :param api: Fake transport answering the client's requests.
+    :param tokens: Token pool values (default one token).
+    :param cache_dir: Directory for the client's HTTP cache (default a fresh temporary directory).
+    :param cache: In-process query cache, e.g. to share one between clients (default a private one).
+    :return: The client; its schedulers record sleeps in ``scheduler.slept`` instead of sleeping.
+    """
+    session = requests.Session()
+    session.mount("https://", api)
+    session.mount("http://", api)
+    tokens = tokens or ["test-token"]
+    schedulers = []
+    for _ in tokens:
+        slept: list[float] = []
+        scheduler = RateLimitScheduler(sleep=slept.append)
+        scheduler.slept = slept
+        schedulers.append(scheduler)
+    return GitHubClient(
+        session=session,
+        cache=cache or QueryCache(ttl=300),
+        http_cache=HTTPCache(cache_dir or Path(tempfile.mkdtemp(prefix="http-cache-")), max_bytes=1 << 20),
+        token_pool=TokenPool(tokens, schedulers),
+    )
@@ -0,0 +1,54 @@
+"""User-controlled text must reach the served SVG cards escaped.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from xml.etree import ElementTree
+
+import fakes  # noqa: F401
+
+from src.github_activity_card import _build_log_lines_svg
+from src.github_pr_card import _build_pr_lines_svg
+from src.github_stats_card import render_github_stats_svgs
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+PAYLOAD = '</text><script>alert("x")</script><text>'
+
+
+class _Stats:
+    def get_profile_counts(self) -> dict:
+        return {"display_name": PAYLOAD, "prs": 1, "issues": 2, "reviews": 3, "followers": 4}
+
+    def get_total_stars(self) -> int:
+        return 5
+
+    def get_commits_all_time(self) -> int:
+        return 6
+
+
+class CardEscapingTest(unittest.TestCase):
+    def assert_no_script(self, svg: str) -> None:
+        root = ElementTree.fromstring(svg)
+        self.assertFalse([el for el in root.iter() if el.tag.rsplit("}", 1)[-1] == "script"])
+
+    def test_stats_display_name_is_escaped(self) -> None:
+        svgs = render_github_stats_svgs(templates_dir=TEMPLATES_DIR, username="escape-test", stats=_Stats())
+        for svg in svgs.values():
+            self.assert_no_script(svg)
+            self.assertIn("&lt;script&gt;", svg)
+
+    def test_activity_and_pr_lines_are_escaped(self) -> None:
+        now = datetime.now(timezone.utc)
+        activity = _build_log_lines_svg([{"repo": PAYLOAD, "message": PAYLOAD, "timestamp": now}])
+        prs = _build_pr_lines_svg([{"repo": PAYLOAD, "title": PAYLOAD, "status": "open", "timestamp": now}])
+        for lines in (activity, prs):
+            self.assert_no_script(f"<svg>{lines}</svg>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Randomized equivalence of :class:`ContributionCalendar` with the list-based streak scan it replaced.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import random
+import unittest
+from datetime import date, timedelta
+
+from src.contribution_calendar import ContributionCalendar
+
+
+def _reference_streaks(days: list[tuple[date, int]], today_local: date, today_utc: date) -> dict:
+    """Streak scan from ``GitHubStats.get_streak_stats`` before it moved to :class:`ContributionCalendar`."""
+    days_list = sorted(days, key=lambda x: x[0])
+    days_list = [(d, c) for d, c in days_list if d.weekday() < 5]
+    if not days_list:
+        return {"total": 0, "first": None, "last": None, "longest": (0, None, None), "current": (0, None, None)}
+
+    longest_len = 0
+    longest_start = None
+    longest_end = None
+    run_len = 0
+    run_start = None
+    prev_has = False
+    for d, count in days_list:
+        has = count > 0
+        if has:
+            if prev_has:
+                run_len += 1
+            else:
+                run_len = 1
+                run_start = d
+            if run_len > longest_len:
+                longest_len = run_len
+                longest_start = run_start
+                longest_end = d
+        else:
+            run_len = 0
+            run_start = None
+        prev_has = has
+
+    current_len = 0
+    current_start = None
+    current_end = None
+    last_idx = len(days_list) - 1
+    last_day_entry, last_count = days_list[last_idx]
+    if last_count == 0 and today_local.weekday() < 5 and last_day_entry == today_utc:
+        last_idx -= 1
+    if last_idx >= 0:
+        last_day_entry, last_count = days_list[last_idx]
+        if last_count > 0:
+            current_end = last_day_entry
+            current_len = 1
+            current_start = last_day_entry
+            for idx in range(last_idx - 1, -1, -1):
+                d, count = days_list[idx]
+                if count > 0:
+                    current_len += 1
+                    current_start = d
+                else:
+                    break
+
+    return {
+        "total": sum(c for _, c in days_list),
+        "first": days_list[0][0],
+        "last": days_list[-1][0],
+        "longest": (longest_len, longest_start, longest_end),
+        "current": (current_len, current_start, current_end),
+    }
+
+
+class ContributionCalendarEquivalenceTest(unittest.TestCase):
+    def assert_matches_reference(self, calendar: ContributionCalendar, days: list, rng: random.Random) -> None:
+        last = days[-1][0] if days else date(2020, 1, 1)
+        today_utc = last + timedelta(days=rng.choice((0, 0, 1)))
+        today_local = today_utc + timedelta(days=rng.choice((-1, 0, 1)))
+        expected = _reference_streaks(days, today_local, today_utc)
+        self.assertEqual(calendar.total, expected["total"])
+        self.assertEqual(calendar.first_day, expected["first"])
+        self.assertEqual(calendar.last_day, expected["last"])
+        self.assertEqual(calendar.longest_streak(), expected["longest"])
+        self.assertEqual(calendar.current_streak(today_local, today_utc), expected["current"])
+
+        first = days[0][0] if days else last
+        for _ in range(5):
+            lo = first + timedelta(days=rng.randrange(-10, (last - first).days + 10))
+            hi = lo + timedelta(days=rng.randrange(-5, 400))
+            brute = sum(c for d, c in days if lo <= d <= hi and d.weekday() < 5)
+            self.assertEqual(calendar.range_total(lo, hi), brute)
+
+    def test_matches_reference_on_random_calendars(self) -> None:
+        rng = random.Random(20261018)
+        for trial in range(500):
+            start = date(2015, 1, 1) + timedelta(days=rng.randrange(3000))
+            activity = rng.choice((0.0, 0.3, 0.8, 0.97, 1.0))
+            counts = [rng.randint(1, 20) if rng.random() < activity else 0 for _ in range(rng.randrange(0, 900))]
+            days = [(start + timedelta(days=i), count) for i, count in enumerate(counts)]
+            with self.subTest(trial=trial):
+                self.assert_matches_reference(ContributionCalendar(start.toordinal(), counts), days, rng)
+
+    def test_years_missing_from_contribution_years_are_skipped(self) -> None:
+        rng = random.Random(20261019)
+        for trial in range(200):
+            first_year = rng.randrange(2012, 2020)
+            last_year = first_year + rng.randrange(2, 6)
+            start = date(first_year, 1, 1) + timedelta(days=rng.randrange(200))
+            end = date(last_year, 12, 31) - timedelta(days=rng.randrange(200))
+            interior = list(range(first_year + 1, last_year))
+            years = {first_year, last_year, *rng.sample(interior, rng.randrange(len(interior)))}
+            activity = rng.choice((0.5, 0.97, 1.0))
+            counts = []
+            for offset in range((end - start).days + 1):
+                day = start + timedelta(days=offset)
+                # The store zero-fills years it never fetched, but may keep older data for a dropped year.
+                listed = day.year in years or rng.random() < 0.3
+                counts.append(rng.randint(1, 20) if listed and rng.random() < activity else 0)
+            # Before ContributionCalendar, only the calendars of the listed years were fetched and scanned.
+            days = [(start + timedelta(days=i), c) for i, c in enumerate(counts)]
+            days = [(d, c) for d, c in days if d.year in years]
+            with self.subTest(trial=trial):
+                calendar = ContributionCalendar(start.toordinal(), counts, years=years)
+                self.assert_matches_reference(calendar, days, rng)
+
+    def test_streak_continues_across_a_skipped_year(self) -> None:
+        start = date(2018, 12, 24)
+        counts = [1] * ((date(2020, 1, 10) - start).days + 1)
+        for offset in range((date(2019, 1, 1) - start).days, (date(2020, 1, 1) - start).days):
+            counts[offset] = 0
+        calendar = ContributionCalendar(start.toordinal(), counts, years=[2018, 2020])
+        self.assertEqual(calendar.longest_streak(), (14, date(2018, 12, 24), date(2020, 1, 10)))
+        self.assertEqual(calendar.range_total(date(2019, 1, 1), date(2019, 12, 31)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Conditional polling of :class:`EventLog`, including polls that fail part way through.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from fakes import FakeAPI, make_client, query_params
+
+from src.event_log import EVENTS_PER_PAGE, EventLog
+
+
+def _push(event_id: int) -> dict:
+    return {
+        "id": str(event_id),
+        "type": "PushEvent",
+        "repo": {"name": "octocat/hello"},
+        "payload": {"head": f"{event_id:040x}"},
+        "created_at": "2026-10-01T00:00:00Z",
+    }
+
+
+class _EventsFeed:
+    """Events endpoint over a newest-first list of events, with an ETag and injectable page failures."""
+
+    def __init__(self, events: list[dict]) -> None:
+        self.events = events
+        self.fail_pages: set[int] = set()
+
+    def add(self, count: int, type_: str = "PushEvent") -> None:
+        newest = int(self.events[0]["id"]) if self.events else 0
+        added = [{**_push(newest + i), "type": type_} for i in range(count, 0, -1)]
+        self.events = added + self.events
+
+    def __call__(self, request):
+        page = int(query_params(request).get("page", 1))
+        etag = f'"{self.events[0]["id"] if self.events else "empty"}"'
+        headers = {"ETag": etag, "X-Poll-Interval": "60"}
+        if page == 1 and request.headers.get("If-None-Match") == etag:
+            return 304, None, headers
+        if page in self.fail_pages:
+            return 502, {"message": "Bad Gateway"}, {}
+        return 200, self.events[(page - 1) * EVENTS_PER_PAGE : page * EVENTS_PER_PAGE], headers
+
+
+class EventLogPollTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.feed = _EventsFeed([])
+        self.api = FakeAPI(self.feed)
+        self.client = make_client(self.api)
+        self.log = EventLog(Path(tempfile.mkdtemp()), "octocat")
+
+    def logged_ids(self) -> list[int]:
+        return [int(event["id"]) for event in self.log.iter_newest_first()]
+
+    def test_failed_page_does_not_advance_etag(self) -> None:
+        self.feed.add(100)
+        self.log.poll(self.client, force=True)
+        self.assertEqual(len(self.logged_ids()), 100)
+
+        self.feed.add(150)
+        self.feed.fail_pages = {2}
+        with self.assertRaises(Exception):
+            self.log.poll(self.client, force=True)
+        self.assertEqual(self.log.state.get("newest_id"), "100")
+
+        self.feed.fail_pages = set()
+        self.assertEqual(self.log.poll(self.client, force=True), 2)
+        self.assertEqual(self.logged_ids(), list(range(250, 0, -1)))
+        self.assertEqual(self.log.state.get("newest_id"), "250")
+
+    def test_empty_feed_is_polled_conditionally(self) -> None:
+        self.assertEqual(self.log.poll(self.client, force=True), 1)
+        self.assertEqual(self.log.poll(self.client, force=True), 0)
+        self.assertEqual(self.api.requests[-1].headers.get("If-None-Match"), '"empty"')
+
+        self.feed.add(5, type_="WatchEvent")
+        self.assertEqual(self.log.poll(self.client, force=True), 1)
+        self.assertEqual(self.log.poll(self.client, force=True), 0)
+        self.assertEqual(self.logged_ids(), [])
+
+    def test_poll_interval_skips_requests(self) -> None:
+        self.feed.add(3)
+        self.log.poll(self.client)
+        sent = len(self.api.requests)
+        self.assertEqual(self.log.poll(self.client), 0)
+        self.assertEqual(len(self.api.requests), sent)
+        self.assertEqual(self.logged_ids(), [3, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
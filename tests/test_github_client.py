@@ -0,0 +1,142 @@
+"""Caching, token routing, and pagination in :class:`GitHubClient`, against a fake API.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import time
+import unittest
+
+from fakes import FakeAPI, graphql_body, make_client
+
+from src.query_cache import QueryCache
+
+
+def _viewer(request):
+    token = request.headers["Authorization"].removeprefix("Bearer ")
+    return 200, {"data": {"viewer": {"login": token}}}, {}
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_clients_with_other_tokens_do_not_share_results(self) -> None:
+        shared = QueryCache(ttl=300)
+        api = FakeAPI(_viewer)
+        first = make_client(api, tokens=["token-a"], cache=shared)
+        second = make_client(api, tokens=["token-b"], cache=shared)
+
+        self.assertEqual(first.query("{ viewer { login } }")["data"]["viewer"]["login"], "token-a")
+        self.assertEqual(second.query("{ viewer { login } }")["data"]["viewer"]["login"], "token-b")
+        self.assertEqual(first.query("{ viewer { login } }")["data"]["viewer"]["login"], "token-a")
+        self.assertEqual(len(api.requests), 2)
+
+        api.handler = lambda request: (200, {"token": request.headers["Authorization"]}, {})
+        self.assertNotEqual(first.get_rest("/user"), second.get_rest("/user"))
+
+
+def _token(request) -> str:
+    return request.headers["Authorization"].removeprefix("Bearer ")
+
+
+class TokenRoutingTest(unittest.TestCase):
+    def test_unauthorized_token_is_revoked_and_the_request_retried(self) -> None:
+        api = FakeAPI(
+            lambda request: (401, {"message": "Bad credentials"}, {}) if _token(request) == "a" else _viewer(request)
+        )
+        client = make_client(api, tokens=["a", "b"])
+
+        self.assertEqual(client.query("{ viewer { login } }")["data"]["viewer"]["login"], "b")
+        self.assertEqual(client.get_rest("/user"), {"data": {"viewer": {"login": "b"}}})
+        self.assertEqual([_token(request) for request in api.requests], ["a", "b", "b"])
+        self.assertTrue(client.token_pool.tokens[0].revoked)
+
+    def test_exhausted_token_fails_over_without_waiting(self) -> None:
+        reset = str(int(time.time()) + 3600)
+
+        def handler(request):
+            if _token(request) == "a":
+                headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset, "X-RateLimit-Resource": "graphql"}
+                return 403, {"message": "API rate limit exceeded"}, headers
+            return _viewer(request)
+
+        api = FakeAPI(handler)
+        client = make_client(api, tokens=["a", "b"])
+
+        self.assertEqual(client.query("{ viewer { login } }")["data"]["viewer"]["login"], "b")
+        self.assertEqual(client.query("{ viewer { id } }")["data"]["viewer"]["login"], "b")
+        self.assertEqual([_token(request) for request in api.requests], ["a", "b", "b"])
+        self.assertEqual([token.scheduler.retries for token in client.token_pool.tokens], [0, 0])
+
+    def test_single_token_backs_off_and_retries(self) -> None:
+        responses = [(403, {"message": "You have exceeded a secondary rate limit"}, {"Retry-After": "7"})]
+        api = FakeAPI(lambda request: responses.pop(0) if responses else _viewer(request))
+        client = make_client(api)
+
+        self.assertEqual(client.query("{ viewer { login } }")["data"]["viewer"]["login"], "test-token")
+        scheduler = client.token_pool.tokens[0].scheduler
+        self.assertEqual(len(api.requests), 2)
+        self.assertEqual(scheduler.retries, 1)
+        self.assertTrue(7 <= scheduler.throttled_seconds < 8)
+        self.assertIn(scheduler.throttled_seconds, scheduler.slept)
+
+
+class _Items:
+    """Fake GraphQL connection of *total* items that answers 502 to pages larger than *max_first*."""
+
+    def __init__(self, total: int, max_first: int) -> None:
+        self.total = total
+        self.max_first = max_first
+        self.pages: list[tuple[str | None, int]] = []
+
+    def __call__(self, request):
+        variables = graphql_body(request)["variables"]
+        self.pages.append((variables["cursor"], variables["first"]))
+        if variables["first"] > self.max_first:
+            return 502, {"message": "Server Error"}, {}
+        start = int(variables["cursor"] or 0)
+        end = min(self.total, start + variables["first"])
+        connection = {
+            "nodes": list(range(start, end)),
+            "pageInfo": {"hasNextPage": end < self.total, "endCursor": str(end)},
+        }
+        return 200, {"data": {"items": connection}}, {}
+
+
+class AdaptivePageSizeTest(unittest.TestCase):
+    QUERY = "query($cursor: String, $first: Int) { items(first: $first, after: $cursor) { nodes } }"
+
+    def paginate(self, items: _Items, page_size: int) -> list[int]:
+        nodes: list[int] = []
+        client = make_client(FakeAPI(items))
+        client.paginated_query(
+            self.QUERY,
+            {"test": self.id()},
+            ("items",),
+            lambda result: nodes.extend(result["data"]["items"]["nodes"]),
+            page_size,
+        )
+        return nodes
+
+    def test_failed_page_is_retried_at_half_size_and_the_size_is_kept(self) -> None:
+        items = _Items(total=25, max_first=10)
+
+        self.assertEqual(self.paginate(items, page_size=40), list(range(25)))
+        self.assertEqual(items.pages, [(None, 40), (None, 20), (None, 10), ("10", 10), ("20", 10)])
+
+        # The next chain starts at the recorded size, then probes a larger one again.
+        items.pages.clear()
+        self.assertEqual(self.paginate(items, page_size=40), list(range(25)))
+        self.assertEqual(items.pages, [(None, 10), ("10", 20), ("10", 10), ("20", 10)])
+
+    def test_fast_pages_grow_back_to_the_maximum(self) -> None:
+        items = _Items(total=25, max_first=10)
+        self.paginate(items, page_size=40)
+        items.max_first = 40
+        items.pages.clear()
+
+        self.assertEqual(self.paginate(items, page_size=40), list(range(25)))
+        self.assertEqual(items.pages, [(None, 10), ("10", 20)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Repository names on the PR card for github.com and GitHub Enterprise Server API URLs.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import unittest
+from unittest import mock
+
+from fakes import FakeAPI, make_client
+
+from src import github_pr_card
+
+
+def _search(base: str):
+    def handler(request):
+        item = {
+            "repository_url": f"{base}/repos/upstream/project",
+            "title": "Fix edge case",
+            "state": "open",
+            "pull_request": {"merged_at": None},
+            "updated_at": "2026-10-01T00:00:00Z",
+        }
+        return 200, {"total_count": 1, "items": [item]}, {}
+
+    return handler
+
+
+class ExternalPRsTest(unittest.TestCase):
+    def test_repository_name_uses_configured_api_url(self) -> None:
+        for base in ("https://api.github.com", "https://ghes.example.com/api/v3"):
+            with self.subTest(base=base), mock.patch.object(github_pr_card, "REST_API_URL", base):
+                client = make_client(FakeAPI(_search(base)))
+                data = github_pr_card._fetch_external_prs(client, "octocat", [])
+                self.assertEqual(data["prs"][0]["repo"], "upstream/project")
+                self.assertEqual(data["prs"][0]["status"], "open")
+
+
+if __name__ == "__main__":
+    unittest.main()
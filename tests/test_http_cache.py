@@ -0,0 +1,103 @@
+"""Conditional revalidation, immutable entries, and LRU eviction in :class:`HTTPCache`.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fakes import FakeAPI, make_client
+
+from src.http_cache import HTTPCache
+
+SHA = "a" * 40
+
+
+class _Repo:
+    """REST endpoint with an ETag that honours ``If-None-Match`` and counts full responses."""
+
+    def __init__(self) -> None:
+        self.version = 1
+        self.bodies = 0
+
+    def __call__(self, request):
+        if request.url.endswith(f"/commits/{SHA}"):
+            self.bodies += 1
+            return 200, {"sha": SHA, "commit": {"message": "Fix"}}, {"ETag": f'"{SHA}"'}
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, None, {"ETag": etag}
+        self.bodies += 1
+        return 200, {"version": self.version}, {"ETag": etag}
+
+
+class HTTPCacheClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = _Repo()
+        self.api = FakeAPI(self.repo)
+        self.cache_dir = Path(tempfile.mkdtemp())
+
+    def fresh_client(self):
+        """A new process's client: empty in-memory cache, shared on-disk cache."""
+        return make_client(self.api, cache_dir=self.cache_dir)
+
+    def test_etag_revalidation_and_refresh(self) -> None:
+        self.assertEqual(self.fresh_client().get_rest("/repos/o/r"), {"version": 1})
+
+        client = self.fresh_client()
+        self.assertEqual(client.get_rest("/repos/o/r"), {"version": 1})
+        self.assertEqual(self.api.requests[-1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(self.repo.bodies, 1)
+        self.assertEqual(client.http_cache.stats()["revalidated"], 1)
+
+        self.repo.version = 2
+        client = self.fresh_client()
+        self.assertEqual(client.get_rest("/repos/o/r"), {"version": 2})
+        stats = client.http_cache.stats()
+        self.assertEqual((stats["refreshed"], stats["misses"]), (1, 0))
+
+    def test_commit_by_full_sha_is_served_without_a_request(self) -> None:
+        self.fresh_client().get_rest(f"/repos/o/r/commits/{SHA}")
+        sent = len(self.api.requests)
+
+        client = self.fresh_client()
+        self.assertEqual(client.get_rest(f"/repos/o/r/commits/{SHA}")["sha"], SHA)
+        self.assertEqual(len(self.api.requests), sent)
+        self.assertEqual(client.http_cache.stats()["hits"], 1)
+
+    def test_corrupt_entry_counts_as_miss_and_is_refetched(self) -> None:
+        self.fresh_client().get_rest("/repos/o/r")
+        for entry in self.cache_dir.glob("*.entry"):
+            entry.write_bytes(b"not json\n{}")
+
+        client = self.fresh_client()
+        self.assertEqual(client.get_rest("/repos/o/r"), {"version": 1})
+        self.assertEqual(client.http_cache.stats()["misses"], 1)
+        self.assertEqual(self.repo.bodies, 2)
+
+
+class HTTPCacheEvictionTest(unittest.TestCase):
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        cache = HTTPCache(Path(tempfile.mkdtemp()), max_bytes=1 << 20)
+        ticks = itertools.count(1_000_000)
+        with mock.patch("src.http_cache.time.time", side_effect=lambda: float(next(ticks))):
+            for key in ("a", "b", "c"):
+                cache.put(key, etag=f'"{key}"', last_modified=None, immutable=False, body=b"x" * 40)
+            # Room for exactly the three entries stored so far.
+            cache.max_bytes = cache.stats()["bytes"]
+            self.assertIsNotNone(cache.get("a"))
+            cache.put("d", etag='"d"', last_modified=None, immutable=False, body=b"x" * 40)
+
+        self.assertIsNone(cache.get("b"))
+        for key in ("a", "c", "d"):
+            self.assertEqual(cache.get(key).etag, f'"{key}"')
+        self.assertLessEqual(cache.stats()["bytes"], cache.max_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Single-flight coalescing, TTL expiry, and size bounds in :class:`QueryCache`.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from src.query_cache import QueryCache, make_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class QueryCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        patcher = mock.patch("src.query_cache.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_make_key_normalizes_whitespace_and_param_order(self) -> None:
+        self.assertEqual(
+            make_key("graphql", "query {\n  viewer { login }\n}", {"b": 1, "a": 2}),
+            make_key("graphql", "query { viewer { login } }", {"a": 2, "b": 1}),
+        )
+        self.assertNotEqual(make_key("rest", "/a"), make_key("graphql", "/a"))
+
+    def test_concurrent_callers_share_one_fetch(self) -> None:
+        cache = QueryCache(ttl=60)
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"value": 1}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(cache.get_or_fetch, "key", fetch) for _ in range(8)]
+            for _ in range(5000):
+                if cache.stats()["coalesced"] == 7:
+                    break
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(cache.stats(), {"hits": 0, "misses": 1, "coalesced": 7, "evicted": 0, "entries": 1})
+
+    def test_entries_expire_after_ttl_and_are_dropped(self) -> None:
+        cache = QueryCache(ttl=60)
+        cache.get_or_fetch("key", lambda: 1)
+        self.clock.now += 59
+        self.assertEqual(cache.get_or_fetch("key", lambda: 2), 1)
+        self.clock.now += 2
+        self.assertEqual(cache.get_or_fetch("key", lambda: 2), 2)
+
+        cache.get_or_fetch("other", lambda: 3)
+        self.clock.now += 61
+        cache.get_or_fetch("new", lambda: 4)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_errors_are_propagated_and_not_cached(self) -> None:
+        cache = QueryCache(ttl=60)
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_fetch("key", fail)
+        self.assertEqual(cache.get_or_fetch("key", lambda: "ok"), "ok")
+
+    def test_max_entries_evicts_least_recently_used(self) -> None:
+        cache = QueryCache(ttl=60, max_entries=2)
+        cache.get_or_fetch("a", lambda: "a")
+        cache.get_or_fetch("b", lambda: "b")
+        cache.get_or_fetch("a", lambda: "stale")
+        cache.get_or_fetch("c", lambda: "c")
+        self.assertEqual(cache.get_or_fetch("a", lambda: "refetched"), "a")
+        self.assertEqual(cache.get_or_fetch("b", lambda: "refetched"), "refetched")
+        self.assertEqual(cache.stats()["evicted"], 2)
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        cache = QueryCache(ttl=0)
+        self.assertEqual(cache.get_or_fetch("key", lambda: 1), 1)
+        self.assertEqual(cache.get_or_fetch("key", lambda: 2), 2)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
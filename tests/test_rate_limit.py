@@ -0,0 +1,101 @@
+"""Token-bucket pacing and ``X-RateLimit-*`` handling in :class:`RateLimitScheduler`.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import unittest
+
+from src.rate_limit import DEFAULT_BUDGETS, MIN_PACING_WINDOW, RateLimitScheduler, bucket_for
+
+
+class _Clock:
+    """Fake epoch clock that only moves when the scheduler sleeps or the test advances it."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _headers(remaining: int, reset_at: float, resource: str | None = None) -> dict[str, str]:
+    headers = {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(reset_at))}
+    if resource:
+        headers["X-RateLimit-Resource"] = resource
+    return headers
+
+
+class RateLimitSchedulerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.scheduler = RateLimitScheduler(sleep=self.clock.sleep, clock=self.clock)
+
+    def test_bucket_for(self) -> None:
+        self.assertEqual(bucket_for("graphql"), "graphql")
+        self.assertEqual(bucket_for("rest", "/search/issues"), "search")
+        self.assertEqual(bucket_for("rest", "/users/octocat/events"), "core")
+
+    def test_default_burst_then_paced(self) -> None:
+        per_hour, burst = DEFAULT_BUDGETS["search"]
+        for _ in range(burst):
+            self.scheduler.acquire("search")
+        self.assertEqual(self.clock.sleeps, [])
+        self.scheduler.acquire("search")
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 3600 / per_hour)
+
+    def test_rate_is_recomputed_as_the_window_passes(self) -> None:
+        self.scheduler.observe("core", _headers(1000, self.clock.now + 3600))
+        self.scheduler.acquire("core")
+        self.assertAlmostEqual(self.scheduler.buckets["core"].rate, 1000 / 3600)
+
+        self.clock.now += 3000
+        self.scheduler.acquire("core")
+        self.assertAlmostEqual(self.scheduler.buckets["core"].rate, 1000 / 600)
+
+    def test_reset_near_end_of_window_is_bounded(self) -> None:
+        self.scheduler.observe("core", _headers(4000, self.clock.now + 2))
+        self.scheduler.acquire("core")
+        bucket = self.scheduler.buckets["core"]
+        self.assertAlmostEqual(bucket.rate, 4000 / MIN_PACING_WINDOW)
+        self.assertLessEqual(bucket.capacity, DEFAULT_BUDGETS["core"][1])
+
+    def test_burst_capped_at_remaining_budget(self) -> None:
+        self.scheduler.observe("core", _headers(5, self.clock.now + 3600))
+        for _ in range(5):
+            self.scheduler.acquire("core")
+        self.assertEqual(self.clock.sleeps, [])
+        self.scheduler.acquire("core")
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+    def test_exhausted_budget_waits_for_reset(self) -> None:
+        self.scheduler.observe("graphql", _headers(0, self.clock.now + 30))
+        self.scheduler.acquire("graphql")
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 31, delta=1)
+
+    def test_observe_uses_resource_header_and_ignores_incomplete_headers(self) -> None:
+        self.scheduler.observe("core", _headers(12, self.clock.now + 60, resource="search"))
+        self.assertEqual(self.scheduler.remaining, {"search": 12})
+        self.scheduler.observe("core", {"X-RateLimit-Remaining": "7"})
+        self.scheduler.observe("core", _headers(7, self.clock.now + 60, resource="unknown"))
+        self.assertEqual(self.scheduler.remaining, {"search": 12})
+
+    def test_backoff_honours_retry_after_and_reset(self) -> None:
+        self.assertGreaterEqual(self.scheduler.backoff("core", 0, {"Retry-After": "12"}), 12)
+        delay = self.scheduler.backoff("core", 0, _headers(0, self.clock.now + 100))
+        self.assertGreaterEqual(delay, 101)
+        self.assertLess(delay, 102.5)
+        with self.assertRaises(RuntimeError):
+            self.scheduler.wait(10_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+"""Incremental bookkeeping in :class:`GitHubStats`, against a fake API and a fixed clock.
+
+Usage::
+
+    uv run python -m unittest discover -s tests
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+import requests
+from fakes import FakeAPI, graphql_body, make_client
+
+from src import stats
+from src.cassette import Cassette
+from src.config import LANGUAGE_RESWEEP_DAYS, SEARCH_INDEX_LAG_MINUTES, SEARCH_RECOUNT_DAYS
+from src.json_store import JsonStore
+from src.stats import GitHubStats
+
+LANGUAGE_ORGS = [{"name": "acme", "stars": False, "languages": True}]
+
+START = datetime(2026, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+
+
+def _frozen_datetime(now: datetime) -> type[datetime]:
+    """Return a ``datetime`` subclass whose ``now()`` is *now*."""
+
+    class Frozen(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz)
+
+    return Frozen
+
+
+def _stamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class IncrementalSearchCountsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = Path(tempfile.mkdtemp(prefix="search-counts-"))
+        patcher = mock.patch.object(stats, "_search_counts", JsonStore(directory / "search_counts.json"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.stats = GitHubStats("octocat", client=make_client(FakeAPI(lambda request: (500, None, {}))))
+        self.sent: list[dict[str, str]] = []
+
+    def count(self, now: datetime, new_items: int) -> int:
+        """Run one incremental count at *now*, the search reporting *new_items* in its window."""
+
+        def run(queries: dict[str, str]) -> dict[str, int]:
+            self.sent.append(queries)
+            return {alias: new_items for alias in queries}
+
+        with mock.patch.object(stats, "datetime", _frozen_datetime(now)):
+            return self.stats._incremental_search_counts({"issues": "author:octocat is:issue"}, run)["issues"]
+
+    def test_windows_end_before_the_index_lag_and_do_not_overlap(self) -> None:
+        lag = timedelta(minutes=SEARCH_INDEX_LAG_MINUTES)
+        first_through = (START - lag).replace(microsecond=0)
+        later = START + timedelta(hours=1)
+        second_through = (later - lag).replace(microsecond=0)
+
+        self.assertEqual(self.count(START, 10), 10)
+        self.assertEqual(self.count(later, 3), 13)
+
+        self.assertEqual(
+            [queries["issues"] for queries in self.sent],
+            [
+                f"author:octocat is:issue created:<={_stamp(first_through)}",
+                "author:octocat is:issue "
+                f"created:{_stamp(first_through + timedelta(seconds=1))}..{_stamp(second_through)}",
+            ],
+        )
+        self.assertEqual(stats._search_counts.get("author:octocat is:issue")["through"], _stamp(second_through))
+
+    def test_full_recount_replaces_the_total_after_the_recount_period(self) -> None:
+        self.count(START, 10)
+        self.count(START + timedelta(days=1), 5)
+        recount_at = START + timedelta(days=SEARCH_RECOUNT_DAYS, minutes=1)
+
+        self.assertEqual(self.count(recount_at, 12), 12)
+        self.assertTrue(self.sent[-1]["issues"].startswith("author:octocat is:issue created:<="))
+        self.assertEqual(stats._search_counts.get("author:octocat is:issue")["recounted_at"], recount_at.isoformat())
+
+    def test_cassette_matches_windows_from_other_runs(self) -> None:
+        base_url = "https://api.github.com"
+        cassette = Cassette(Path(tempfile.mkdtemp(prefix="cassette-")), base_url)
+        self.count(START, 10)
+        self.count(START + timedelta(hours=1), 3)
+
+        normalized = [
+            cassette.normalize(
+                requests.Request("POST", f"{base_url}/graphql", json={"variables": {"query": q["issues"]}}).prepare()
+            )
+            for q in self.sent
+        ]
+        self.assertEqual(normalized[0]["body"]["variables"]["query"], "author:octocat is:issue created:<now>")
+        self.assertEqual(normalized[0], normalized[1])
+
+
+class _Inventory:
+    """Fake GraphQL inventory of ``octocat`` and ``acme``, served most recently pushed first."""
+
+    def __init__(self) -> None:
+        self.repos = {
+            "user": [self._repo(f"octocat/r{i}", i) for i in range(7)],
+            "organization": [self._repo(f"acme/a{i}", i) for i in range(8)],
+        }
+        self.pages: list[tuple[str, dict]] = []
+
+    @staticmethod
+    def _repo(name: str, age: int) -> dict:
+        return {
+            "nameWithOwner": name,
+            "pushedAt": f"2025-12-{31 - age:02d}T00:00:00Z",
+            "stargazerCount": 1,
+            "isFork": False,
+            "language": "Python" if age % 2 else "Go",
+        }
+
+    def push(self, owner_key: str, name: str) -> None:
+        """Record a new push to *name*, moving it to the front of its owner's list."""
+        repos = self.repos[owner_key]
+        repo = next(r for r in repos if r["nameWithOwner"] == name)
+        repos.remove(repo)
+        repos.insert(0, {**repo, "pushedAt": "2026-01-01T00:00:00Z"})
+
+    def __call__(self, request):
+        variables = graphql_body(request)["variables"]
+        owner_key = "user" if "username" in variables else "organization"
+        self.pages.append((owner_key, variables))
+        start = int(variables["cursor"] or 0)
+        end = start + variables["first"]
+        nodes = []
+        for repo in self.repos[owner_key][start:end]:
+            node = {k: v for k, v in repo.items() if k != "language"}
+            if variables["withLanguages"]:
+                node["languages"] = {"edges": [{"size": 100, "node": {"name": repo["language"]}}]}
+            nodes.append(node)
+        page_info = {"hasNextPage": end < len(self.repos[owner_key]), "endCursor": str(end)}
+        return 200, {"data": {owner_key: {"repositories": {"nodes": nodes, "pageInfo": page_info}}}}, {}
+
+
+class LanguageCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = Path(tempfile.mkdtemp(prefix="languages-"))
+        for name, value in (("_language_cache", JsonStore(directory / "languages.json")), ("PAGE_SIZE_MAX", 5)):
+            patcher = mock.patch.object(stats, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.api = _Inventory()
+
+    def inventory(self) -> dict[str, dict[str, list[str]]]:
+        """Run one inventory sweep and return each owner's repository languages by name."""
+        github_stats = GitHubStats("octocat", client=make_client(FakeAPI(self.api)), org_config=LANGUAGE_ORGS)
+        return {
+            owner: {
+                repo["nameWithOwner"]: [edge["node"]["name"] for edge in repo["languages"]["edges"]] for repo in repos
+            }
+            for owner, repos in github_stats.get_repository_inventory().items()
+        }
+
+    def pages(self, owner_key: str) -> list[bool]:
+        """Return the ``withLanguages`` flag of each page fetched for *owner_key* since the last call."""
+        flags = [variables["withLanguages"] for key, variables in self.api.pages if key == owner_key]
+        self.api.pages = [(key, variables) for key, variables in self.api.pages if key != owner_key]
+        return flags
+
+    def test_unchanged_repositories_come_from_the_cache(self) -> None:
+        first = self.inventory()
+        self.assertEqual(self.pages("user"), [True, True])
+        self.assertEqual(self.pages("organization"), [True, True])
+
+        self.api.push("organization", "acme/a5")
+        second = self.inventory()
+
+        self.assertEqual(self.pages("user"), [True, False])
+        self.assertEqual(self.pages("organization"), [True])
+        self.assertEqual(second, first)
+
+    def test_full_sweep_after_the_resweep_period(self) -> None:
+        self.inventory()
+        self.api.pages.clear()
+        later = datetime.now(timezone.utc) + timedelta(days=LANGUAGE_RESWEEP_DAYS, minutes=1)
+
+        with mock.patch.object(stats, "datetime", _frozen_datetime(later)):
+            self.inventory()
+
+        self.assertEqual(self.pages("user"), [True, True])
+        self.assertEqual(self.pages("organization"), [True, True])
+
+
+if __name__ == "__main__":
+    unittest.main()